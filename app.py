@@ -1,10 +1,48 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import json
-import re
+import tempfile
+import time
 from io import BytesIO
 
+from screener import SkillIndex, compile_job_profile, generate_insights
+from screener.batch import analyze_features_batch
+from screener.cache import content_hash
+from screener.campaigns import DEFAULT_CAMPAIGN, Campaigns, campaign_db_path
+from screener.dedupe import NearDuplicateIndex
+from screener.export import DEFAULT_COLUMNS, EXPORT_FORMATS, EXPORT_HEADERS, EXPORT_MIME_TYPES, ExportError, write_export
+from screener.extract import get_text_cache
+from screener.ingest import count_upload_entries, ingest_uploads
+from screener.invites import (
+    DAY_END, DEFAULT_CONCURRENCY, DEFAULT_RATE, INTERVIEW_DURATIONS, Invite, SMTPSettings, assign_slots, send_invites
+)
+from screener.matrix import best_fit, iter_score_matrix, job_title, split_job_descriptions, top_candidates
+from screener.perf import PerfRecorder, session_sizes
+from screener.profile import SEMANTIC_WEIGHT
+from screener.reports import report_file_name, write_report_archive
+from screener.results import filter_results, get_page, page_count
+from screener.samples import SAMPLE_RESUMES
+from screener.storage import SQLiteStorage, WriteBehind
+from screener.store import CandidateStore
+from screener.vectors import DEFAULT_TOP_K, VectorStore
+
+PAGE_SIZES = [10, 25, 50, 100]
+SEARCH_RESULT_LIMIT = 50
+MAX_RESUMES = 100_000
+EXPORT_CHUNK_ROWS = 10_000
+# Resumes scored per step when ranking from stored features
+SCORE_CHUNK_ROWS = 10_000
+LOCAL_VECTOR_DB = "Local (TF-IDF)"
+LOCAL_STORAGE = "SQLite (local)"
+# Best-fit rows shown in the multi-job matrix tab
+MATRIX_ROW_LIMIT = 1000
+# Uploaded resumes listed per page in the upload tab
+UPLOAD_PAGE_SIZE = 25
+# Skills listed in the pool's most common skills table
+SKILL_COVERAGE_ROWS = 10
+
 # Page Configuration
 st.set_page_config(
     page_title="AI Resume Screening Agent",
@@ -79,11 +117,19 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Whole-script timing for the Performance panel
+run_started = time.perf_counter()
+
 # Initialize Session State
-if 'resumes' not in st.session_state:
-    st.session_state.resumes = []
-if 'results' not in st.session_state:
-    st.session_state.results = []
+# Resumes, indexes and rankings live in the shared campaign; a session keeps only its own settings and views
+if 'uploader_key' not in st.session_state:
+    st.session_state.uploader_key = 0
+if 'ingest_report' not in st.session_state:
+    st.session_state.ingest_report = None
+if 'job_profile' not in st.session_state:
+    st.session_state.job_profile = None
+if 'requisition' not in st.session_state:
+    st.session_state.requisition = None
 if 'analyzed' not in st.session_state:
     st.session_state.analyzed = False
 if 'min_score' not in st.session_state:
@@ -92,172 +138,200 @@ if 'job_description' not in st.session_state:
     st.session_state.job_description = ""
 if 'position' not in st.session_state:
     st.session_state.position = ""
-
-# Sample Resumes
-SAMPLE_RESUMES = [
-    {
-        "name": "Alex Johnson",
-        "email": "alex.johnson@email.com",
-        "content": """Full Stack Developer with 6 years of experience. Expert in React, Node.js, and Python. 
-        Strong background in AWS cloud services. Built multiple SaaS applications from scratch. 
-        Proficient in PostgreSQL, MongoDB, Docker. BS in Computer Science from MIT. 
-        Led team of 4 developers. Implemented CI/CD pipelines using Jenkins."""
-    },
-    {
-        "name": "Sarah Chen",
-        "email": "sarah.chen@email.com",
-        "content": """Software Engineer with 3 years experience. Skilled in JavaScript, React, and Node.js.
-        Some experience with Python. Working knowledge of AWS. Completed several web projects.
-        Bachelor's in Software Engineering. Good team player and fast learner."""
-    },
-    {
-        "name": "Michael Rodriguez",
-        "email": "m.rodriguez@email.com",
-        "content": """Senior Developer with 8 years experience. Deep expertise in JavaScript, TypeScript, React, Node.js.
-        Python and FastAPI for microservices. PostgreSQL and Redis expert. 
-        AWS and GCP certified. Kubernetes and Docker in production. Led multiple teams.
-        MS in Computer Science. Open source contributor."""
-    },
-    {
-        "name": "Emily Watson",
-        "email": "emily.w@email.com",
-        "content": """Front-end Developer with 4 years experience. Strong React and JavaScript skills.
-        Basic Node.js knowledge. Worked with REST APIs. Some MongoDB experience.
-        Good at UI/UX design. Bachelor's in Design. Team collaboration skills."""
-    },
-    {
-        "name": "David Kim",
-        "email": "d.kim@email.com",
-        "content": """Full Stack Engineer with 7 years experience. JavaScript, TypeScript, React expert.
-        Node.js and Python backend development. FastAPI and Express. PostgreSQL and MongoDB.
-        AWS infrastructure and Lambda. Docker containers. CI/CD with GitHub Actions.
-        Bachelor's CS. Mentored junior developers."""
-    }
-]
+if 'job_descriptions' not in st.session_state:
+    st.session_state.job_descriptions = ""
+if 'job_matrix' not in st.session_state:
+    st.session_state.job_matrix = None
+if 'perf' not in st.session_state:
+    st.session_state.perf = PerfRecorder()
+perf = st.session_state.perf
+# The panel's checkbox is drawn last, but its value is known before the run starts
+perf.enabled = st.session_state.get('perf_enabled', False)
 
 # Helper Functions
-def extract_requirements(job_desc):
-    """Extract skills and requirements from job description"""
-    tech_stack = [
-        'JavaScript', 'TypeScript', 'React', 'Node.js', 'Python', 'FastAPI',
-        'PostgreSQL', 'MongoDB', 'AWS', 'GCP', 'Docker', 'Kubernetes',
-        'CI/CD', 'Jenkins', 'GitHub Actions', 'Express', 'Vue', 'Angular'
-    ]
-    
-    skills = []
-    for tech in tech_stack:
-        if tech.lower() in job_desc.lower():
-            skills.append(tech)
-    
-    years_match = re.search(r'(\d+)\+?\s*years?', job_desc, re.I)
-    min_years = int(years_match.group(1)) if years_match else 3
-    
-    return {'skills': skills, 'min_years': min_years}
+@st.cache_resource
+def get_extraction_cache():
+    """Process-wide on-disk cache of text extracted from PDF/DOCX files"""
+    return get_text_cache()
 
-def analyze_resume(resume, job_desc):
-    """Analyze a single resume against job description"""
-    requirements = extract_requirements(job_desc)
-    resume_lower = resume['content'].lower()
-    
-    # Skill matching
-    matched_skills = [s for s in requirements['skills'] if s.lower() in resume_lower]
-    skill_score = (len(matched_skills) / len(requirements['skills']) * 100) if requirements['skills'] else 0
-    
-    # Experience matching
-    exp_match = re.search(r'(\d+)\+?\s*years?', resume['content'], re.I)
-    if exp_match:
-        years = int(exp_match.group(1))
-        exp_score = min((years / requirements['min_years']) * 100, 100)
-    else:
-        exp_score = 30
-    
-    # Education matching
-    if 'master' in resume_lower or 'ms' in resume_lower:
-        edu_score = 100
-    elif 'bachelor' in resume_lower or 'bs' in resume_lower:
-        edu_score = 80
-    else:
-        edu_score = 50
-    
-    # Leadership
-    has_leadership = any(word in resume_lower for word in ['lead', 'led', 'mentor'])
-    leadership_bonus = 10 if has_leadership else 0
-    
-    # Overall score
-    overall_score = int(
-        (skill_score * 0.5) + 
-        (exp_score * 0.3) + 
-        (edu_score * 0.15) + 
-        (leadership_bonus * 0.05)
-    )
-    
-    # Generate insights
-    insights = []
-    if overall_score >= 80:
-        insights.append("⭐ Excellent match for the position")
-        insights.append("🎯 Strong technical skills aligned with requirements")
-    elif overall_score >= 65:
-        insights.append("✅ Good candidate with relevant experience")
-        insights.append("📈 Meets most core requirements")
-    else:
-        insights.append("⚠️ Limited alignment with job requirements")
-        insights.append("📚 May need additional training or experience")
-    
-    if has_leadership:
-        insights.append("👥 Demonstrated leadership and mentoring experience")
-    
-    if 'open source' in resume_lower:
-        insights.append("💻 Active open source contributor")
-    
-    # Recommendation
-    if overall_score >= 80:
-        recommendation = "Strong Hire - Schedule Interview"
-    elif overall_score >= 70:
-        recommendation = "Recommended for Interview"
-    elif overall_score >= 60:
-        recommendation = "Consider for Phone Screen"
-    else:
-        recommendation = "Not Recommended"
-    
-    return {
-        **resume,
-        'score': overall_score,
-        'skill_match': int(skill_score),
-        'experience_match': int(exp_score),
-        'education_match': int(edu_score),
-        'matched_skills': matched_skills,
-        'missing_skills': [s for s in requirements['skills'] if s not in matched_skills],
-        'insights': insights,
-        'recommendation': recommendation
-    }
+@st.cache_resource
+def get_campaigns():
+    """Process-wide campaigns, so sessions on the same campaign share one candidate pool and its rankings"""
+    return Campaigns()
+
+@st.cache_resource
+def get_local_storage(campaign_name):
+    """Process-wide SQLite store of a campaign behind a write-behind queue, shared by its sessions"""
+    return WriteBehind(SQLiteStorage(campaign_db_path(campaign_name)))
+
+def current_campaign():
+    return get_campaigns().get(st.session_state.get('campaign', '').strip() or DEFAULT_CAMPAIGN)
+
+def switch_campaign():
+    """Drop the session's views of the previous campaign's pool"""
+    st.session_state.ingest_report = None
+    st.session_state.job_matrix = None
+    st.session_state.export = None
+    st.session_state.report_archive = None
+    st.session_state.results_page = 1
+
+def storage_writer():
+    """Write-behind queue of the selected storage backend, or None when saving is only simulated"""
+    return get_local_storage(campaign.name) if st.session_state.get('storage') == LOCAL_STORAGE else None
+
+def campaign_near_duplicates():
+    """The campaign's near-duplicate index, rebuilt from its resumes if it was dropped"""
+    with campaign.lock:
+        if campaign.near_duplicates is None:
+            resumes = campaign.resumes
+            index = NearDuplicateIndex()
+            with perf.stage('near_duplicate_rebuild', len(resumes)):
+                index.add_texts(resumes.hashes, (resumes.text(i) for i in range(len(resumes))))
+            campaign.near_duplicates = index
+        return campaign.near_duplicates
+
+def near_duplicate_index():
+    """The index to check new resumes against, or None when this session doesn't collapse near-duplicates"""
+    if not st.session_state.get('collapse_near_duplicates', True):
+        return None
+    return campaign_near_duplicates()
+
+def link_variants(variants):
+    """Record near-duplicates against the canonical resumes they were collapsed into"""
+    for variant in variants:
+        campaign.variants.setdefault(variant['canonical'], []).append(variant)
+
+def rank_resumes(ranking, start=0, progress=None):
+    """Score the campaign's resumes from position start on against a ranking's job profile and insert them into it
 
-def get_score_class(score):
-    """Get CSS class for score"""
-    if score >= 80:
-        return 'score-excellent'
-    elif score >= 70:
-        return 'score-good'
-    elif score >= 60:
-        return 'score-fair'
+    Resumes were parsed into features when they were added, so only the
+    job-dependent scoring runs here; embeddings come from the vector store.
+    """
+    job_profile = ranking.job_profile
+    resumes = campaign.resumes
+    if start >= len(resumes):
+        return
+    chunks = []
+    for chunk_start in range(start, len(resumes), SCORE_CHUNK_ROWS):
+        stop = min(chunk_start + SCORE_CHUNK_ROWS, len(resumes))
+        with perf.stage('score', stop - chunk_start):
+            features = resumes.features(chunk_start, stop, job_profile.matcher)
+            if job_profile.semantic_weight:
+                features['embedding'] = campaign.vector_store.vectors[chunk_start:stop]
+            chunks.append(analyze_features_batch(
+                features, resumes.names[chunk_start:stop], resumes.emails[chunk_start:stop], job_profile, chunk_start
+            ))
+        if progress is not None:
+            progress((stop - start) / (len(resumes) - start))
+    results = pd.concat(chunks, ignore_index=True)
+    with perf.stage('rank_insert', len(results)):
+        ranking.add(results, resumes.hashes)
+    perf.count('resumes_scored', len(results))
+    writer = storage_writer()
+    requisition = campaign.requisitions.get(job_profile.fingerprint)
+    if writer is not None and requisition is not None:
+        writer.submit('save_requisition', requisition)
+        writer.submit('save_results', job_profile.fingerprint, resumes.hashes[start:], results)
+
+def session_ranking():
+    """The campaign's ranking for this session's job profile, scored now if it was dropped; None before analysis"""
+    job_profile = st.session_state.job_profile
+    if job_profile is None:
+        return None
+    with campaign.lock:
+        ranking = campaign.ranking(job_profile.fingerprint)
+        if ranking is None:
+            ranking = campaign.add_ranking(job_profile, st.session_state.requisition)
+            rank_resumes(ranking)
+    return ranking
+
+def add_resumes(new_resumes):
+    """Append resumes to the campaign, index them for candidate search and rank them for every analyzed job profile"""
+    with campaign.lock:
+        start = len(campaign.resumes)
+        with perf.stage('parse_features', len(new_resumes)):
+            campaign.resumes.extend(new_resumes)
+        with perf.stage('skill_index', len(new_resumes)):
+            campaign.skill_index.add_features(campaign.resumes.features(start))
+        with perf.stage('embed', len(new_resumes)):
+            campaign.vector_store.add_many(r['content'] for r in new_resumes)
+        # Indexed whether or not this session collapses near-duplicates, so sessions that do see every resume;
+        # uploads checked against the index are already in it
+        with perf.stage('near_duplicate_index', len(new_resumes)):
+            campaign_near_duplicates().add_texts(campaign.resumes.hashes[start:], (r['content'] for r in new_resumes))
+        perf.count('resumes_added', len(new_resumes))
+        campaign.hashes.update(campaign.resumes.hashes[start:])
+        campaign.changed()
+        writer = storage_writer()
+        if writer is not None:
+            columns = campaign.resumes.columns(start)
+            columns['embedding'] = campaign.vector_store.vectors[start:].copy()
+            with perf.stage('storage_submit', len(new_resumes)):
+                writer.submit('save_candidates', columns)
+        for ranking in campaign.rankings.values():
+            rank_resumes(ranking, start)
+
+def remove_resume(digest):
+    """Remove the resume with this content hash from the campaign, its indexes and every ranking"""
+    with campaign.lock:
+        # Positions shift as other sessions remove resumes, so find it now; it may be gone already
+        try:
+            idx = campaign.resumes.hashes.index(digest)
+        except ValueError:
+            return
+        campaign.resumes.pop(idx)
+        campaign.skill_index.remove(idx)
+        campaign.vector_store.remove(idx)
+        campaign.hashes.discard(digest)
+        for ranking in campaign.rankings.values():
+            ranking.remove(digest)
+        if campaign.near_duplicates is not None:
+            campaign.near_duplicates.remove(digest)
+        # Its variants go with it, so they can be uploaded again
+        for variant in campaign.variants.pop(digest, []):
+            campaign.hashes.discard(variant['hash'])
+        campaign.changed()
+    writer = storage_writer()
+    if writer is not None:
+        writer.submit('delete_candidates', [digest])
+
+def clear_resumes():
+    """Drop every resume and ranking of the campaign, for all of its sessions"""
+    with campaign.lock:
+        campaign.clear()
+    st.session_state.ingest_report = None
+    writer = storage_writer()
+    if writer is not None:
+        writer.submit('clear')
+
+def restore_resumes(writer):
+    """Replace the campaign's resumes with its saved pool, rebuilding the search indexes without reparsing"""
+    writer.flush()
+    vector_store = VectorStore()
+    columns = writer.storage.load_candidates(vector_store.dim)
+    resumes = CandidateStore.from_columns(columns)
+    if 'embedding' in columns:
+        vector_store.add_vectors(columns['embedding'])
     else:
-        return 'score-poor'
-
-def export_to_csv(results):
-    """Export results to CSV"""
-    data = []
-    for r in results:
-        data.append({
-            'Name': r['name'],
-            'Email': r['email'],
-            'Overall Score': r['score'],
-            'Skills Match': r['skill_match'],
-            'Experience Match': r['experience_match'],
-            'Education Match': r['education_match'],
-            'Recommendation': r['recommendation'],
-            'Matched Skills': ', '.join(r['matched_skills']),
-            'Missing Skills': ', '.join(r['missing_skills'])
-        })
-    return pd.DataFrame(data)
+        vector_store.add_many(resumes.text(i) for i in range(len(resumes)))
+    skill_index = SkillIndex()
+    skill_index.add_features(resumes.features())
+    with campaign.lock:
+        campaign.clear()
+        campaign.resumes = resumes
+        campaign.skill_index = skill_index
+        campaign.vector_store = vector_store
+        campaign.hashes = set(resumes.hashes)
+        # Rebuilt on the next upload rather than now; variants are not saved
+        campaign.near_duplicates = None
+    st.session_state.analyzed = False
+    # Bring back the last analyzed job description, ready to re-run
+    requisitions = writer.storage.requisitions()
+    if requisitions:
+        st.session_state.job_description = requisitions[0]['job_description']
+        st.session_state.position = requisitions[0]['title']
+
+campaign = current_campaign()
 
 # Sidebar
 with st.sidebar:
@@ -265,6 +339,15 @@ with st.sidebar:
     st.title("🤖 AI Resume Screener")
     st.markdown("---")
     
+    # Campaign
+    st.text_input(
+        "📁 Campaign", value=DEFAULT_CAMPAIGN, key='campaign', on_change=switch_campaign,
+        help="Everyone working on the same campaign shares one resume pool, and each job description "
+             "is scored once for all of them"
+    )
+    st.caption(f"{len(campaign)} resume(s) · open campaigns: {', '.join(get_campaigns().names())}")
+    st.markdown("---")
+    
     st.subheader("⚙️ Technology Stack")
     
     # AI Model
@@ -277,16 +360,33 @@ with st.sidebar:
     # Vector DB
     vector_db = st.selectbox(
         "🗄️ Vector Database",
-        ["Pinecone", "ChromaDB", "Weaviate", "FAISS"],
-        help="Vector database for semantic search"
+        [LOCAL_VECTOR_DB, "Pinecone", "ChromaDB", "Weaviate", "FAISS"],
+        help="Vector database for semantic search. The local engine runs offline"
+    )
+    local_vectors = vector_db == LOCAL_VECTOR_DB
+    # Off by default, so the app ranks as the CLI and the scoring API do unless asked otherwise
+    semantic = local_vectors and st.checkbox(
+        "🧭 Blend semantic similarity into scores",
+        value=False,
+        key='semantic_scoring',
+        help=f"Adds text similarity to the job description as {SEMANTIC_WEIGHT:.0%} of each score "
+             "(the CLI's --semantic). Takes effect on the next analysis"
     )
     
     # Storage
     storage = st.selectbox(
         "💾 Storage",
-        ["Firebase", "Supabase", "Google Sheets"],
-        help="Data storage backend"
+        [LOCAL_STORAGE, "Firebase", "Supabase", "Google Sheets"],
+        key='storage',
+        help="Data storage backend. The local SQLite store saves resumes and scores in the background "
+             "and can restore them in a new session"
     )
+    writer = storage_writer()
+    if writer is not None:
+        if writer.pending:
+            st.caption(f"💾 Saving... {writer.pending} write(s) queued")
+        for error in writer.errors[-3:]:
+            st.warning(f"Storage error: {error}")
     
     # Framework
     framework = st.selectbox(
@@ -314,7 +414,9 @@ st.title("🤖 AI Resume Screening Agent")
 st.markdown("### Powered by OpenAI GPT-4, LangChain & Pinecone")
 
 # Tabs
-tab1, tab2, tab3 = st.tabs(["📄 Upload & Analyze", "📊 Results & Statistics", "🗓️ Interview Scheduling"])
+tab1, tab2, tab3, tab4 = st.tabs([
+    "📄 Upload & Analyze", "📊 Results & Statistics", "🗓️ Interview Scheduling", "🧮 Multi-Job Matrix"
+])
 
 with tab1:
     col1, col2 = st.columns([1, 1])
@@ -353,69 +455,160 @@ Nice to have:
         
         # File upload
         uploaded_files = st.file_uploader(
-            "Upload resume files (PDF, DOCX, TXT)",
+            "Upload resume files (PDF, DOCX, TXT) or ZIP archives of them",
             accept_multiple_files=True,
-            type=['pdf', 'docx', 'txt']
+            type=['pdf', 'docx', 'txt', 'zip'],
+            key=f"uploader_{st.session_state.uploader_key}"
+        )
+        st.checkbox(
+            "🔗 Collapse near-duplicates", value=True, key='collapse_near_duplicates',
+            help="Treat reposted or lightly edited copies of a resume already added as variants of it, "
+                 "so each candidate is scored and reviewed once"
         )
         
         if uploaded_files:
-            for file in uploaded_files:
-                try:
-                    if file.type == 'text/plain':
-                        content = file.read().decode('utf-8', errors='ignore')
-                    elif file.type == 'application/pdf':
-                        content = f"[PDF Document: {file.name}] - PDF parsing would require PyPDF2 library"
-                    elif file.type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-                        content = f"[Word Document: {file.name}] - DOCX parsing would require python-docx library"
-                    else:
-                        content = file.read().decode('utf-8', errors='ignore')
-                    st.session_state.resumes.append({
-                        'name': file.name.replace('.txt', '').replace('.pdf', '').replace('.docx', ''),
-                        'email': f"candidate{len(st.session_state.resumes) + 1}@email.com",
-                        'content': content
-                    })
-                except Exception as e:
-                    st.warning(f"Could not read {file.name}: {str(e)}")
-            st.success(f"✅ {len(uploaded_files)} file(s) uploaded!")
+            total = count_upload_entries(uploaded_files)
+            progress_bar = st.progress(0, text=f"Ingesting {total} file(s)...")
+            report = {}
+            ingest_started = time.perf_counter()
+            for processed, batch in ingest_uploads(
+                uploaded_files,
+                campaign.hashes,
+                next_number=len(campaign) + 1,
+                capacity=MAX_RESUMES - len(campaign),
+                report=report,
+                text_cache=get_extraction_cache(),
+                near_duplicates=near_duplicate_index(),
+                lock=campaign.lock
+            ):
+                add_resumes(batch)
+                progress_bar.progress(min(processed / max(total, 1), 1.0), text=f"Ingested {processed} of {total} file(s)")
+            with campaign.lock:
+                link_variants(report.pop('variants'))
+            st.session_state.ingest_report = report
+            # Includes reading and decoding the files as well as add_resumes
+            perf.record('ingest_uploads', time.perf_counter() - ingest_started, total)
+            # A fresh uploader key drops the processed files, so later reruns cannot ingest them again
+            st.session_state.uploader_key += 1
             st.rerun()
         
+        report = st.session_state.ingest_report
+        if report:
+            st.success(f"✅ {report['added']} resume(s) added, {report['duplicates']} duplicate(s) skipped")
+            if report['near_duplicates']:
+                st.info(f"🔗 {report['near_duplicates']} near-duplicate(s) linked to candidates already added")
+            for name, reason in report['skipped'][:10]:
+                st.warning(f"Could not read {name}: {reason}")
+            if len(report['skipped']) > 10:
+                st.warning(f"...and {len(report['skipped']) - 10} more file(s) skipped")
+        
         st.markdown("---")
         
         # Text input
         resume_text = st.text_area("Or paste resume text here:", height=150)
         if st.button("➕ Add Resume"):
-            if resume_text.strip():
-                st.session_state.resumes.append({
-                    'name': f"Candidate {len(st.session_state.resumes) + 1}",
-                    'email': f"candidate{len(st.session_state.resumes) + 1}@email.com",
-                    'content': resume_text
-                })
-                st.success("✅ Resume added!")
-                st.rerun()
+            digest = content_hash(resume_text)
+            if digest in campaign.hashes:
+                st.warning("⚠️ This resume has already been added")
+            elif resume_text.strip():
+                with campaign.lock:
+                    index = near_duplicate_index()
+                    match = index.find_or_add(resume_text, digest) if index is not None else None
+                    if match is not None:
+                        campaign.hashes.add(digest)
+                        link_variants([{'name': "Pasted resume", 'hash': digest, 'canonical': match[0],
+                                        'similarity': match[1]}])
+                if match is not None:
+                    st.info(f"🔗 This resume is {match[1]:.0%} similar to one already added, so it was linked to it")
+                else:
+                    add_resumes([{
+                        'name': f"Candidate {len(campaign) + 1}",
+                        'email': f"candidate{len(campaign) + 1}@email.com",
+                        'content': resume_text
+                    }])
+                    st.success("✅ Resume added!")
+                    st.rerun()
             else:
                 st.error("❌ Please enter resume text!")
         
         st.markdown("---")
         
-        # Load samples
+        # Load samples alongside the pool; saved resumes are left alone
         if st.button("📥 Load Sample Resumes"):
-            st.session_state.resumes = SAMPLE_RESUMES.copy()
-            st.success("✅ 5 sample resumes loaded!")
+            with campaign.lock:
+                samples = [r for r in SAMPLE_RESUMES if content_hash(r['content']) not in campaign.hashes]
+                if samples:
+                    add_resumes(samples)
+            st.success(f"✅ {len(samples)} sample resume(s) loaded!")
             st.rerun()
+        
+        # Restore the saved pool into an empty campaign
+        writer = storage_writer()
+        if writer is not None and not campaign:
+            saved = writer.storage.count_candidates()
+            if saved and st.button(f"📂 Restore {saved} Saved Resume(s)"):
+                with st.spinner("Loading saved resumes..."), perf.stage('restore', saved):
+                    restore_resumes(writer)
+                st.rerun()
     
     st.markdown("---")
     
-    # Display uploaded resumes
-    if st.session_state.resumes:
-        st.subheader(f"📋 {len(st.session_state.resumes)} Resume(s) Ready for Analysis")
-        for idx, resume in enumerate(st.session_state.resumes):
+    # Display uploaded resumes, one page at a time so reruns don't slow down as the pool grows
+    with campaign.lock:
+        n_listed = len(campaign)
+    if n_listed:
+        st.subheader(f"📋 {n_listed} Resume(s) Ready for Analysis")
+        n_upload_pages = page_count(n_listed, UPLOAD_PAGE_SIZE)
+        if st.session_state.get('uploads_page', 1) > n_upload_pages:
+            st.session_state.uploads_page = n_upload_pages
+        if n_upload_pages > 1:
+            upload_page = st.number_input(f"Page (of {n_upload_pages})", 1, n_upload_pages, key='uploads_page')
+        else:
+            upload_page = 1
+        first = (upload_page - 1) * UPLOAD_PAGE_SIZE
+        with campaign.lock:
+            listed = [
+                (digest, name, len(campaign.variants.get(digest, ())))
+                for name, digest in zip(
+                    campaign.resumes.names[first:first + UPLOAD_PAGE_SIZE],
+                    campaign.resumes.hashes[first:first + UPLOAD_PAGE_SIZE]
+                )
+            ]
+        for digest, name, variants in listed:
             col1, col2 = st.columns([5, 1])
             with col1:
-                st.text(f"📄 {resume['name']}")
+                st.text(f"📄 {name}" + (f"  🔗 {variants} variant(s)" if variants else ""))
             with col2:
-                if st.button("🗑️", key=f"del_{idx}"):
-                    st.session_state.resumes.pop(idx)
+                if st.button("🗑️", key=f"del_{digest}"):
+                    remove_resume(digest)
                     st.rerun()
+        
+        # Candidate search runs on the skill index, without re-reading resume text
+        query = st.text_input(
+            "🔎 Search candidates",
+            placeholder="e.g. Kubernetes AND PostgreSQL NOT Angular 5+ years"
+        )
+        if query.strip():
+            started = time.perf_counter()
+            with campaign.lock:
+                matches = campaign.skill_index.query(query)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                match_names = [campaign.resumes.names[pos] for pos in matches[:SEARCH_RESULT_LIMIT]]
+            st.caption(f"{len(matches)} matching resume(s) in {elapsed_ms:.1f} ms")
+            for name in match_names:
+                st.text(f"🔎 {name}")
+            if len(matches) > SEARCH_RESULT_LIMIT:
+                st.caption(f"...and {len(matches) - SEARCH_RESULT_LIMIT} more")
+        
+        if local_vectors and st.button(f"🧭 Top {DEFAULT_TOP_K} Most Similar to Job Description"):
+            started = time.perf_counter()
+            with campaign.lock:
+                positions, similarities = campaign.vector_store.search(st.session_state.job_description)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                similar_names = [campaign.resumes.names[pos] for pos in positions]
+            st.caption(f"Searched {n_listed} resume(s) in {elapsed_ms:.1f} ms")
+            for name, sim in zip(similar_names, similarities):
+                st.text(f"🧭 {name} ({sim:.2f})")
     
     st.markdown("---")
     
@@ -423,37 +616,87 @@ Nice to have:
     col1, col2, col3 = st.columns([2, 2, 1])
     with col1:
         if st.button("🚀 Analyze Resumes", type="primary"):
-            if not st.session_state.resumes:
+            if not campaign:
                 st.error("❌ Please upload or add resumes first!")
             elif not st.session_state.job_description.strip():
                 st.error("❌ Please enter job description!")
             else:
-                with st.spinner("🤖 AI is analyzing resumes..."):
+                with st.spinner("🤖 AI is analyzing resumes..."), perf.profiling(), perf.stage('analyze'):
                     progress_bar = st.progress(0)
-                    st.session_state.results = []
-                    
-                    for idx, resume in enumerate(st.session_state.resumes):
-                        result = analyze_resume(resume, st.session_state.job_description)
-                        st.session_state.results.append(result)
-                        progress_bar.progress((idx + 1) / len(st.session_state.resumes))
-                    
-                    st.session_state.results.sort(key=lambda x: x['score'], reverse=True)
+                    with perf.stage('compile_job_profile'):
+                        job_profile = compile_job_profile(
+                            st.session_state.job_description,
+                            semantic_weight=SEMANTIC_WEIGHT if semantic else 0.0
+                        )
+                    started = time.perf_counter()
+
+                    # Resumes added or removed from now on update this ranking in place, for every session
+                    st.session_state.job_profile = job_profile
+                    st.session_state.requisition = {
+                        'fingerprint': job_profile.fingerprint,
+                        'title': st.session_state.position or job_title(st.session_state.job_description),
+                        'job_description': st.session_state.job_description,
+                        'semantic_weight': job_profile.semantic_weight,
+                    }
+                    with campaign.lock:
+                        # Another session may have scored this job profile already
+                        ranking = campaign.ranking(job_profile.fingerprint)
+                        scored = 0
+                        if ranking is None:
+                            ranking = campaign.add_ranking(job_profile, st.session_state.requisition)
+                            rank_resumes(ranking, progress=progress_bar.progress)
+                            scored = len(ranking)
                     st.session_state.analyzed = True
+                    st.session_state.job_skills = list(job_profile.skills)
+                    st.session_state.results_page = 1
+                    st.session_state.export = None
+                    st.session_state.report_archive = None
+                    st.session_state.last_analysis = (scored, len(ranking), time.perf_counter() - started)
                     
                 st.success("✅ Analysis complete!")
                 st.balloons()
                 st.rerun()
     
+        if st.session_state.get('last_analysis'):
+            scored, ranked, seconds = st.session_state.last_analysis
+            if scored:
+                st.caption(f"⏱️ Last run: {scored} resume(s) scored from stored features in {seconds * 1000:.0f} ms")
+            else:
+                st.caption(f"⏱️ Last run: reused the campaign's ranking of {ranked} resume(s) in {seconds * 1000:.0f} ms")
+    
     with col2:
-        if st.button("🔄 Reset All"):
-            st.session_state.resumes = []
-            st.session_state.results = []
-            st.session_state.analyzed = False
-            st.rerun()
+        if st.button("🔄 Reset All", help="Clears the campaign's resumes and results for everyone working on it"):
+            st.session_state.confirm_reset = True
+        # Clearing also deletes saved data, so it takes a second click
+        if st.session_state.get('confirm_reset'):
+            st.warning("⚠️ This deletes the campaign's resumes and results, saved ones included, for everyone working on it.")
+            confirm_col, cancel_col = st.columns(2)
+            with confirm_col:
+                if st.button("🗑️ Yes, Reset All", type="primary", key='confirm_reset_yes'):
+                    clear_resumes()
+                    st.session_state.confirm_reset = False
+                    st.session_state.job_profile = None
+                    st.session_state.export = None
+                    st.session_state.report_archive = None
+                    st.session_state.analyzed = False
+                    st.rerun()
+            with cancel_col:
+                if st.button("↩️ Cancel", key='confirm_reset_no'):
+                    st.session_state.confirm_reset = False
+                    st.rerun()
+
+# Shared with every session of the campaign that analyzed the same job description
+ranking = session_ranking() if st.session_state.analyzed else None
 
-with tab2:
-    if st.session_state.analyzed and st.session_state.results:
-        # Statistics
+# The campaign lock is only held to snapshot the ranking, so other sessions' uploads don't wait on this page
+with tab2, perf.stage('render_results'):
+    # Statistics are kept current by the live ranking and its aggregates, without a pass over the results
+    if ranking is not None:
+        with campaign.lock:
+            stats = ranking.stats.copy()
+            qualified = ranking.count_at_least(st.session_state.min_score)
+            top_score = ranking.top_score
+    if ranking is not None and len(stats):
         st.subheader("📊 Screening Statistics")
         
         col1, col2, col3, col4 = st.columns(4)
@@ -461,48 +704,228 @@ with tab2:
         with col1:
             st.metric(
                 label="👥 Total Screened",
-                value=len(st.session_state.results)
+                value=len(stats)
             )
         
         with col2:
-            qualified = len([r for r in st.session_state.results if r['score'] >= st.session_state.min_score])
             st.metric(
                 label="✅ Qualified",
                 value=qualified,
-                delta=f"{(qualified/len(st.session_state.results)*100):.0f}%"
+                delta=f"{(qualified/len(stats)*100):.0f}%"
             )
         
         with col3:
-            avg_score = sum(r['score'] for r in st.session_state.results) / len(st.session_state.results)
+            avg_score = stats.mean('score')
             st.metric(
                 label="📈 Average Score",
                 value=f"{avg_score:.0f}%"
             )
         
         with col4:
-            top_score = max(r['score'] for r in st.session_state.results)
             st.metric(
                 label="🏆 Top Score",
                 value=f"{top_score}%"
             )
         
-        st.markdown("---")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric(
+                label="🎯 Median Score",
+                value=f"{stats.quantile(0.5)}%"
+            )
+        
+        with col2:
+            st.metric(
+                label="🔝 90th Percentile",
+                value=f"{stats.quantile(0.9)}%",
+                help="One candidate in ten scores at least this"
+            )
+        
+        with col3:
+            st.metric(
+                label="🧠 Average Skills Match",
+                value=f"{stats.mean('skill_match'):.0f}%"
+            )
+        
+        with col4:
+            st.metric(
+                label="👥 Leadership",
+                value=stats.leaders,
+                delta=f"{(stats.leaders/len(stats)*100):.0f}%"
+            )
+        
+        # Distributions are read off the aggregates' counters, so they cost the same at any pool size
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Score Distribution**")
+            st.bar_chart(stats.histogram())
+        
+        with col2:
+            st.markdown("**By Recommendation**")
+            st.dataframe(
+                pd.DataFrame(stats.recommendation_counts().items(), columns=['Recommendation', 'Candidates']),
+                hide_index=True,
+                use_container_width=True
+            )
+        
+        coverage_columns = {
+            'skill': "Skill",
+            'candidates': "Candidates",
+            'coverage': st.column_config.ProgressColumn("Coverage", format="%.0f%%", min_value=0, max_value=100)
+        }
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Required Skill Coverage**")
+            if ranking.job_profile.skills:
+                st.dataframe(
+                    stats.skill_coverage(ranking.job_profile.matcher, ranking.job_profile.skills),
+                    hide_index=True,
+                    use_container_width=True,
+                    column_config=coverage_columns
+                )
+            else:
+                st.caption("The job description names no known skills.")
         
-        # Export button
-        col1, col2 = st.columns([4, 1])
         with col2:
-            csv_data = export_to_csv(st.session_state.results)
-            st.download_button(
-                label="📥 Export CSV",
-                data=csv_data.to_csv(index=False),
-                file_name=f"screening_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+            st.markdown("**Most Common Skills in the Pool**")
+            st.dataframe(
+                stats.skill_coverage(ranking.job_profile.matcher).head(SKILL_COVERAGE_ROWS),
+                hide_index=True,
+                use_container_width=True,
+                column_config=coverage_columns
             )
         
+        st.markdown("---")
+        
+        # Export runs only when asked for, streaming the ranking a chunk at a time
+        with st.expander("📥 Export Results"):
+            col1, col2, col3 = st.columns([1, 4, 1])
+            with col1:
+                export_format = st.selectbox("Format", EXPORT_FORMATS, key='export_format')
+            with col2:
+                export_columns = st.multiselect(
+                    "Columns",
+                    list(EXPORT_HEADERS),
+                    default=DEFAULT_COLUMNS[export_format],
+                    format_func=EXPORT_HEADERS.get,
+                    key=f'export_columns_{export_format}'
+                )
+            with col3:
+                # Exports stream the live ranking, so they hold the lock until written
+                if st.button("📦 Prepare", disabled=not export_columns):
+                    try:
+                        with tempfile.TemporaryFile() as f, perf.stage('export', len(stats)), campaign.lock:
+                            rows = write_export(ranking.iter_chunks(EXPORT_CHUNK_ROWS), f, export_format, export_columns)
+                            f.seek(0)
+                            st.session_state.export = {
+                                'data': f.read(),
+                                'rows': rows,
+                                'format': export_format,
+                                'file_name': f"screening_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+                            }
+                    except ExportError as e:
+                        st.error(f"❌ {e}")
+            
+            export = st.session_state.get('export')
+            if export:
+                st.download_button(
+                    label=f"📥 Download {export['format'].upper()} ({export['rows']} candidates)",
+                    data=export['data'],
+                    file_name=export['file_name'],
+                    mime=EXPORT_MIME_TYPES[export['format']]
+                )
+            
+            st.markdown("---")
+            
+            # One ZIP with a report per qualified candidate, rendered straight into the archive
+            if st.button(f"🗂️ Prepare Reports for All {qualified} Qualified Candidate(s)", disabled=not qualified):
+                with tempfile.TemporaryFile() as f, perf.stage('report_archive', qualified), campaign.lock:
+                    written = write_report_archive(
+                        ranking.iter_chunks(EXPORT_CHUNK_ROWS), f, st.session_state.position,
+                        min_score=st.session_state.min_score
+                    )
+                    f.seek(0)
+                    st.session_state.report_archive = {
+                        'data': f.read(),
+                        'reports': written,
+                        'file_name': f"candidate_reports_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+                    }
+            
+            archive = st.session_state.get('report_archive')
+            if archive:
+                st.download_button(
+                    label=f"🗂️ Download Reports ZIP ({archive['reports']} candidates)",
+                    data=archive['data'],
+                    file_name=archive['file_name'],
+                    mime="application/zip"
+                )
+        
         # Results
         st.subheader("🎯 Candidate Analysis")
         
-        for idx, result in enumerate(st.session_state.results):
+        # Filters run on the whole frame; widgets are only built for the visible page
+        col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
+        with col1:
+            filter_score = st.number_input("Min Score (%)", 0, 100, 0, key='filter_score')
+        with col2:
+            filter_recommendations = st.multiselect(
+                "Recommendation",
+                sorted(label for label, count in stats.recommendation_counts().items() if count),
+                key='filter_recommendations'
+            )
+        with col3:
+            filter_skills = st.multiselect(
+                "Has all skills",
+                st.session_state.get('job_skills', []),
+                key='filter_skills'
+            )
+        with col4:
+            page_size = st.selectbox("Per page", PAGE_SIZES, key='page_size')
+        
+        # Unfiltered pages are sliced straight out of the ranking; filters run on a snapshot of its frame
+        if filter_score or filter_recommendations or filter_skills:
+            with campaign.lock:
+                frame = ranking.frame()
+                skill_words = ranking.skill_words(frame['resume_id'])
+            filtered = filter_results(
+                frame,
+                min_score=filter_score,
+                recommendations=filter_recommendations,
+                required_skills=filter_skills,
+                matcher=st.session_state.job_profile.matcher,
+                skill_words=skill_words
+            )
+            n_matching = len(filtered)
+        else:
+            filtered = None
+            n_matching = len(stats)
+        n_pages = page_count(n_matching, page_size)
+        if st.session_state.get('results_page', 1) > n_pages:
+            st.session_state.results_page = n_pages
+        
+        col1, col2 = st.columns([4, 1])
+        with col2:
+            page = st.number_input(f"Page (of {n_pages})", 1, n_pages, key='results_page')
+        with col1:
+            first = (page - 1) * page_size
+            st.caption(
+                f"Showing {min(first + 1, n_matching)}-{min(first + page_size, n_matching)} "
+                f"of {n_matching} matching candidate(s) ({len(stats)} screened)"
+            )
+        
+        with campaign.lock:
+            if filtered is None:
+                page_rows = ranking.slice(first, first + page_size)
+            else:
+                page_rows = get_page(filtered, page, page_size)
+            page_keys = [ranking.key(idx) for idx in page_rows['resume_id'].tolist()]
+            page_variants = [list(campaign.variants.get(key, ())) for key in page_keys]
+        for result, key, variants in zip(page_rows.to_dict('records'), page_keys, page_variants):
+            idx = result['resume_id']
+            insights = generate_insights(result)
             with st.container():
                 st.markdown(f"""
                     <div class="candidate-card">
@@ -511,7 +934,7 @@ with tab2:
                                 <h2>{result['name']}</h2>
                                 <p>📧 {result['email']}</p>
                             </div>
-                            <div class="{get_score_class(result['score'])}">{result['score']}%</div>
+                            <div class="{result['score_class']}">{result['score']}%</div>
                         </div>
                     </div>
                 """, unsafe_allow_html=True)
@@ -523,6 +946,12 @@ with tab2:
                     st.metric("💼 Experience", f"{result['experience_match']}%")
                 with col3:
                     st.metric("🎓 Education", f"{result['education_match']}%")
+                if st.session_state.job_profile.semantic_weight:
+                    st.caption(f"🧭 Semantic similarity to the job description: {result['semantic_match']}%")
+                if variants:
+                    st.caption("🔗 Also received as: " + ", ".join(
+                        f"{v['name']} ({v['similarity']:.0%} similar)" for v in variants
+                    ))
                 
                 # Matched Skills
                 if result['matched_skills']:
@@ -538,7 +967,7 @@ with tab2:
                 
                 # AI Insights
                 st.markdown("**🤖 AI Insights:**")
-                for insight in result['insights']:
+                for insight in insights:
                     st.markdown(f"- {insight}")
                 
                 # Recommendation
@@ -553,41 +982,22 @@ with tab2:
                     if st.button(f"📤 Share", key=f"share_{idx}"):
                         st.session_state[f'share_modal_{idx}'] = True
                 with col3:
-                    report = f"""CANDIDATE ANALYSIS REPORT
-{'='*50}
-
-Name: {result['name']}
-Email: {result['email']}
-Position: {st.session_state.position}
-
-OVERALL SCORE: {result['score']}%
-Recommendation: {result['recommendation']}
-
-DETAILED SCORES:
-- Skills Match: {result['skill_match']}%
-- Experience Match: {result['experience_match']}%
-- Education Match: {result['education_match']}%
-
-MATCHED SKILLS:
-{chr(10).join(['✓ ' + s for s in result['matched_skills']])}
-
-MISSING SKILLS:
-{chr(10).join(['✗ ' + s for s in result['missing_skills']])}
-
-AI INSIGHTS:
-{chr(10).join(result['insights'])}
-
----
-Generated by AI Resume Screener
-Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-                    st.download_button(
-                        label="📄 Download Report",
-                        data=report,
-                        file_name=f"{result['name'].replace(' ', '_')}_analysis.txt",
-                        mime="text/plain",
-                        key=f"download_{idx}"
-                    )
+                    # Reports are rendered on request and cached by content hash, not rebuilt on every rerun
+                    report_key = (key, st.session_state.job_profile, st.session_state.position)
+                    with campaign.lock:
+                        report = campaign.report_cache.get(*report_key)
+                    perf.count('report_cache_misses' if report is None else 'report_cache_hits')
+                    if report is None and st.button("📄 Prepare Report", key=f"report_{idx}"):
+                        with perf.stage('render_report', 1), campaign.lock:
+                            report = campaign.report_cache.render(result, *report_key)
+                    if report is not None:
+                        st.download_button(
+                            label="📄 Download Report",
+                            data=report,
+                            file_name=report_file_name(result),
+                            mime="text/plain",
+                            key=f"download_{idx}"
+                        )
                 
                 # Share Modal
                 if st.session_state.get(f'share_modal_{idx}', False):
@@ -612,22 +1022,111 @@ Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     else:
         st.info("👆 Please analyze resumes first in the 'Upload & Analyze' tab")
 
-with tab3:
-    if st.session_state.analyzed and st.session_state.results:
+with tab3, perf.stage('render_scheduling'):
+    if ranking is not None and len(ranking):
         st.subheader("🗓️ Interview Scheduling")
+        scheduling_mode = st.radio("Mode", ["Single Candidate", "Bulk (All Qualified)"], horizontal=True)
+    
+    if ranking is not None and len(ranking) and scheduling_mode == "Bulk (All Qualified)":
+        with campaign.lock:
+            qualified = ranking.count_at_least(st.session_state.min_score)
+        st.markdown(f"Invite all **{qualified}** candidate(s) scoring at least **{st.session_state.min_score}%**, "
+                    f"in rank order, to back-to-back interview slots.")
         
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            first_date = st.date_input("First Interview Date", value=datetime.now() + timedelta(days=1), key='bulk_date')
+            interview_type = st.selectbox(
+                "Interview Type",
+                ["Technical Interview", "HR Round", "Cultural Fit", "Final Round"],
+                key='bulk_type'
+            )
+        with col2:
+            first_time = st.time_input("First Slot", value=datetime.strptime("10:00", "%H:%M").time(), key='bulk_time')
+            day_end = st.time_input("Last Slot Ends By", value=DAY_END, key='bulk_day_end')
+        with col3:
+            duration = st.selectbox("Duration", list(INTERVIEW_DURATIONS), key='bulk_duration')
+            gap = st.number_input("Break Between Slots (minutes)", 0, 120, 0, step=5)
+        meeting_link = st.text_input("Meeting Link (Optional)", placeholder="https://meet.google.com/...", key='bulk_link')
+        notes = st.text_area("Additional Notes", placeholder="Any special instructions or topics to cover...", key='bulk_notes')
+        
+        with st.expander("✉️ SMTP Settings"):
+            defaults = SMTPSettings()
+            col1, col2 = st.columns(2)
+            with col1:
+                smtp_host = st.text_input("SMTP Host", defaults.host)
+                smtp_user = st.text_input("Username", defaults.username)
+                smtp_sender = st.text_input("From Address", defaults.sender)
+                concurrency = st.number_input("Parallel Connections", 1, 32, DEFAULT_CONCURRENCY)
+            with col2:
+                smtp_port = st.number_input("SMTP Port", 1, 65535, defaults.port)
+                smtp_password = st.text_input("Password", defaults.password, type="password")
+                smtp_starttls = st.checkbox("Use STARTTLS", defaults.starttls)
+                rate = st.number_input("Max Invites per Second", 1.0, 1000.0, DEFAULT_RATE)
+            st.caption("For a dry run, start a local stand-in with `python -m screener.invites` "
+                       "(listens on localhost:1025 and accepts every message without delivering it).")
+        
+        try:
+            slots = assign_slots(
+                qualified, datetime.combine(first_date, first_time), INTERVIEW_DURATIONS[duration], gap, day_end
+            )
+        except ValueError as e:
+            slots = None
+            st.error(f"❌ {e}")
+        
+        if slots is not None and qualified:
+            with campaign.lock:
+                shortlist = ranking.top(qualified)
+            invites = [
+                Invite(name, email, slot, duration, interview_type, st.session_state.position, meeting_link, notes)
+                for name, email, slot in zip(shortlist['name'], shortlist['email'], slots)
+            ]
+            st.caption(f"Slots run from {slots[0]:%a %Y-%m-%d %H:%M} to {invites[-1].end:%a %Y-%m-%d %H:%M}")
+            
+            if st.button(f"📨 Send {len(invites)} Invite(s)", type="primary"):
+                settings = SMTPSettings(
+                    host=smtp_host, port=int(smtp_port), sender=smtp_sender, username=smtp_user,
+                    password=smtp_password, starttls=smtp_starttls
+                )
+                progress_bar = st.progress(0)
+                started = time.perf_counter()
+                with perf.stage('send_invites', len(invites)):
+                    statuses = send_invites(
+                        invites, settings, concurrency=int(concurrency), rate=rate,
+                        progress=lambda done: progress_bar.progress(done / len(invites))
+                    )
+                st.session_state.invite_statuses = (statuses, time.perf_counter() - started)
+            
+            if st.session_state.get('invite_statuses'):
+                statuses, seconds = st.session_state.invite_statuses
+                sent = sum(s['status'] == 'sent' for s in statuses)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Sent", sent)
+                with col2:
+                    st.metric("Failed", len(statuses) - sent)
+                with col3:
+                    st.metric("Time", f"{seconds:.1f}s")
+                st.dataframe(pd.DataFrame(statuses), hide_index=True, use_container_width=True)
+        elif not qualified:
+            st.info(f"No candidates score {st.session_state.min_score}% or more")
+    
+    elif ranking is not None and len(ranking):
         # Select candidate
-        candidate_names = [r['name'] for r in st.session_state.results]
+        with campaign.lock:
+            results = ranking.frame()
+        candidate_names = results['name'].tolist()
         selected_candidate = st.selectbox("Select Candidate", candidate_names)
         
-        candidate_data = next((r for r in st.session_state.results if r['name'] == selected_candidate), None)
+        candidate_rows = results[results['name'] == selected_candidate]
+        candidate_data = candidate_rows.iloc[0] if not candidate_rows.empty else None
         
-        if candidate_data:
+        if candidate_data is not None:
             st.markdown(f"""
                 <div class="candidate-card">
                     <h3>{candidate_data['name']}</h3>
                     <p>📧 {candidate_data['email']}</p>
-                    <p class="{get_score_class(candidate_data['score'])}">Match Score: {candidate_data['score']}% - {candidate_data['recommendation']}</p>
+                    <p class="{candidate_data['score_class']}">Match Score: {candidate_data['score']}% - {candidate_data['recommendation']}</p>
                 </div>
             """, unsafe_allow_html=True)
             
@@ -655,7 +1154,7 @@ with tab3:
                 
                 duration = st.selectbox(
                     "Duration",
-                    ["30 minutes", "45 minutes", "1 hour", "1.5 hours"]
+                    list(INTERVIEW_DURATIONS)
                 )
             
             meeting_link = st.text_input("Meeting Link (Optional)", placeholder="https://meet.google.com/...")
@@ -679,22 +1178,11 @@ with tab3:
             
             with col3:
                 if st.button("✉️ Email Invite", use_container_width=True):
-                    email_body = f"""Dear {candidate_data['name']},
-
-We are pleased to invite you for an interview for the position of {st.session_state.position}.
-
-Interview Details:
-- Date: {interview_date}
-- Time: {interview_time}
-- Duration: {duration}
-- Type: {interview_type}
-{f"- Meeting Link: {meeting_link}" if meeting_link else ""}
-
-{f"Additional Notes:\n{notes}" if notes else ""}
-
-We look forward to speaking with you!
-
-Best regards"""
+                    email_body = Invite(
+                        candidate_data['name'], candidate_data['email'],
+                        datetime.combine(interview_date, interview_time), duration, interview_type,
+                        st.session_state.position, meeting_link, notes
+                    ).body()
                     
                     st.success(f"✅ Email invite prepared for {candidate_data['name']}!")
                     st.code(email_body, language=None)
@@ -702,6 +1190,84 @@ Best regards"""
     else:
         st.info("👆 Please analyze resumes first in the 'Upload & Analyze' tab")
 
+with tab4, perf.stage('render_matrix'):
+    st.subheader("🧮 Score All Open Requisitions")
+    st.markdown("Paste several job descriptions separated by a line of `---`; the first line of each is its title. "
+                "Every resume is parsed once and scored against all of them.")
+    st.session_state.job_descriptions = st.text_area(
+        "Job Descriptions",
+        value=st.session_state.job_descriptions,
+        height=250,
+        placeholder="Senior Python Developer\n5+ years of Python, Django, AWS...\n---\nData Scientist\n..."
+    )
+    job_descs = split_job_descriptions(st.session_state.job_descriptions)
+    
+    if st.button(f"🧮 Score {len(campaign)} Resume(s) × {len(job_descs)} Requisition(s)", type="primary"):
+        if not campaign:
+            st.error("❌ Please upload or add resumes first!")
+        elif not job_descs:
+            st.error("❌ Please enter at least one job description!")
+        else:
+            with st.spinner("🤖 Scoring every resume against every requisition..."), perf.stage('score_matrix'), \
+                    campaign.lock:
+                progress_bar = st.progress(0)
+                started = time.perf_counter()
+                resumes = campaign.resumes
+                job_profiles = [
+                    compile_job_profile(desc, semantic_weight=SEMANTIC_WEIGHT if semantic else 0.0)
+                    for desc in job_descs
+                ]
+                chunks = []
+                for done, scores in iter_score_matrix(resumes, job_profiles, vectors=campaign.vector_store.vectors):
+                    chunks.append(scores)
+                    progress_bar.progress(done / len(resumes))
+                st.session_state.job_matrix = {
+                    'titles': [job_title(desc) for desc in job_descs],
+                    'names': list(resumes.names),
+                    'emails': list(resumes.emails),
+                    'scores': np.concatenate(chunks),
+                    'seconds': time.perf_counter() - started,
+                    'version': campaign.version,
+                }
+            st.rerun()
+    
+    matrix = st.session_state.job_matrix
+    # A matrix scored before the campaign's pool last changed is stale
+    if matrix is not None and matrix['version'] == campaign.version:
+        scores = matrix['scores']
+        titles = matrix['titles']
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Candidates", len(matrix['names']))
+        with col2:
+            st.metric("Requisitions", len(titles))
+        with col3:
+            st.metric("Scored In", f"{matrix['seconds']:.2f}s")
+        
+        st.markdown("#### 🎯 Best-Fit Requisition per Candidate")
+        jobs, best = best_fit(scores)
+        best_fits = pd.DataFrame({
+            'Name': matrix['names'],
+            'Email': matrix['emails'],
+            'Best Fit': [titles[j] for j in jobs],
+            'Score': best,
+        }).sort_values('Score', ascending=False, kind='stable')
+        st.dataframe(best_fits.head(MATRIX_ROW_LIMIT), hide_index=True, use_container_width=True)
+        if len(best_fits) > MATRIX_ROW_LIMIT:
+            st.caption(f"Showing the top {MATRIX_ROW_LIMIT} of {len(best_fits)} candidates")
+        
+        st.markdown("#### 🏆 Top Candidates per Requisition")
+        top_k = st.number_input("Candidates per requisition", 1, 100, 5)
+        for job, title in enumerate(titles):
+            rows = top_candidates(scores, job, top_k)
+            with st.expander(f"{title} — best score {scores[rows[0], job] if len(rows) else 0}%"):
+                st.dataframe(pd.DataFrame({
+                    'Name': [matrix['names'][i] for i in rows],
+                    'Email': [matrix['emails'][i] for i in rows],
+                    'Score': scores[rows, job],
+                }), hide_index=True, use_container_width=True)
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -710,3 +1276,60 @@ st.markdown("""
         <p>Built with Streamlit 🎈</p>
     </div>
 """, unsafe_allow_html=True)
+
+perf.record('rerun', time.perf_counter() - run_started)
+
+# Drawn last so it shows this run's timings
+with st.sidebar:
+    with st.expander("📈 Performance"):
+        st.checkbox(
+            "Record timings", key='perf_enabled',
+            help="Time ingestion, scoring, ranking, rendering and exports in this session. "
+                 "Off by default; recording costs well under a millisecond per rerun"
+        )
+        if perf.enabled:
+            if perf.stages:
+                st.dataframe(perf.summary(), hide_index=True, use_container_width=True)
+            else:
+                st.caption("No timings yet — upload or analyze some resumes.")
+            text_cache = get_extraction_cache()
+            session = {
+                'extraction_cache_hits': text_cache.hits,
+                'extraction_cache_misses': text_cache.misses,
+                'resumes_in_campaign': len(campaign),
+                'resume_store_bytes': campaign.resumes.nbytes(),
+                'campaign_rankings': len(campaign.rankings),
+                'open_campaigns': len(get_campaigns()),
+            }
+            st.json({**perf.counters, **session}, expanded=False)
+            
+            if st.button("📏 Measure Session State"):
+                with perf.stage('measure_session'):
+                    st.session_state.perf_sizes = session_sizes(st.session_state)
+            if st.session_state.get('perf_sizes'):
+                st.dataframe(pd.DataFrame({
+                    'Key': list(st.session_state.perf_sizes),
+                    'MB': [round(b / 1e6, 2) for b in st.session_state.perf_sizes.values()],
+                }), hide_index=True, use_container_width=True)
+            
+            if st.button("🔬 Profile Next Analysis", help="Run the next Analyze under cProfile and show the slowest calls"):
+                perf.profile_next = True
+            if perf.profile_next:
+                st.caption("The next analysis will be profiled.")
+            elif perf.profile_report:
+                st.code(perf.profile_report, language=None)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button(
+                    "📥 Export JSONL",
+                    data=perf.to_jsonl({'session': session}),
+                    file_name=f"perf_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+                    mime="application/x-ndjson"
+                )
+            with col2:
+                if st.button("🔄 Reset"):
+                    perf.reset()
+                    perf.profile_report = None
+                    st.session_state.perf_sizes = None
+                    st.rerun()
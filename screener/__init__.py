@@ -0,0 +1,32 @@
+"""Resume screening engine shared by the Streamlit app and the `python -m screener` CLI"""
+
+from .batch import analyze_resumes_batch, generate_insights, rank_results
+from .dedupe import NearDuplicateIndex
+from .index import SkillIndex, parse_query
+from .parallel import iter_result_chunks
+from .profile import JobProfile, compile_job_profile
+from .ranking import LiveRanking
+from .scoring import analyze_resume, export_to_csv, extract_requirements, get_score_class
+from .skills import SkillMatcher, get_matcher, load_taxonomy
+from .vectors import VectorStore
+
+__all__ = [
+    'JobProfile',
+    'LiveRanking',
+    'NearDuplicateIndex',
+    'SkillIndex',
+    'SkillMatcher',
+    'VectorStore',
+    'analyze_resume',
+    'analyze_resumes_batch',
+    'compile_job_profile',
+    'export_to_csv',
+    'extract_requirements',
+    'generate_insights',
+    'get_score_class',
+    'get_matcher',
+    'iter_result_chunks',
+    'load_taxonomy',
+    'parse_query',
+    'rank_results',
+]
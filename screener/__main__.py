@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Guarded so spawned worker processes can re-import this module safely
+if __name__ == '__main__':
+    sys.exit(main())
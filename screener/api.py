@@ -0,0 +1,213 @@
+import argparse
+import json
+import sys
+import time
+import traceback
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from .batch import SCORING_VERSION, generate_insights, rank_results
+from .cache import ResultCache, iter_cached_result_chunks
+from .parallel import iter_result_chunks
+from .profile import SEMANTIC_WEIGHT, compile_job_profile
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 64 * 1024 * 1024
+MAX_BATCH_RESUMES = 100_000
+# Seconds an idle keep-alive connection stays open
+KEEP_ALIVE_TIMEOUT = 30
+
+# Result fields returned per candidate, in this order, after rank
+RESPONSE_COLUMNS = [
+    'resume_id', 'name', 'email', 'score', 'skill_match', 'experience_match', 'education_match',
+    'semantic_match', 'matched_skills', 'missing_skills', 'has_leadership', 'open_source',
+    'recommendation', 'score_class'
+]
+
+
+class ApiError(Exception):
+    """A request the API refuses, with the HTTP status to answer it with"""
+
+    def __init__(self, message, status=HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+def _parse_resumes(resumes):
+    if not isinstance(resumes, list) or not resumes:
+        raise ApiError("'resumes' must be a non-empty list")
+    if len(resumes) > MAX_BATCH_RESUMES:
+        raise ApiError(f"at most {MAX_BATCH_RESUMES} resumes per request", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    parsed = []
+    for i, resume in enumerate(resumes):
+        if isinstance(resume, str):
+            resume = {'content': resume}
+        if not isinstance(resume, dict) or not isinstance(resume.get('content'), str):
+            raise ApiError(f"resumes[{i}] needs a 'content' string")
+        parsed.append({
+            'name': str(resume.get('name') or f"Candidate {i + 1}"),
+            'email': str(resume.get('email') or ''),
+            'content': resume['content'],
+        })
+    return parsed
+
+
+def score_batch(job_description, resumes, semantic=False, min_score=0, top=None, cache=None):
+    """Score resumes against one job description and return the ranked response payload
+
+    resumes are dicts with 'content' and optional 'name' and 'email' (or
+    plain strings). Each result's resume_id is the resume's position in
+    the request. Unchanged resumes are served from cache when one is given.
+    """
+    if not isinstance(job_description, str) or not job_description.strip():
+        raise ApiError("'job_description' must be a non-empty string")
+    resumes = _parse_resumes(resumes)
+    started = time.perf_counter()
+    job_profile = compile_job_profile(job_description, semantic_weight=SEMANTIC_WEIGHT if semantic else 0.0)
+    if cache is None:
+        chunks = iter_result_chunks(resumes, job_profile)
+    else:
+        chunks = iter_cached_result_chunks(resumes, job_profile, cache)
+    results = rank_results(pd.concat([frame for _, frame in chunks], ignore_index=True))
+    results = results[results['score'] >= min_score]
+    if top is not None:
+        results = results.head(top)
+
+    records = results[RESPONSE_COLUMNS].to_dict('records')
+    for rank, record in enumerate(records, 1):
+        record['rank'] = rank
+        record['insights'] = generate_insights(record)
+    return {
+        'scoring_version': SCORING_VERSION,
+        'job': {'skills': list(job_profile.skills), 'min_years': job_profile.min_years},
+        'screened': len(resumes),
+        'results': records,
+        'seconds': round(time.perf_counter() - started, 4),
+    }
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    """JSON endpoints: GET /health and POST /score
+
+    HTTP/1.1, so clients can send many requests over one kept-alive
+    connection. Responses allow any origin, so a page opened from disk can
+    call the API.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'ResumeScreener/1.0'
+    timeout = KEEP_ALIVE_TIMEOUT
+
+    def _send_json(self, payload, status=HTTPStatus.OK):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            # The body is not read, so the connection can't carry another request
+            self.close_connection = True
+            raise ApiError(f"request body must be at most {MAX_BODY_BYTES} bytes", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        try:
+            payload = json.loads(self.rfile.read(length) or b'null')
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ApiError(f"invalid JSON ({e})")
+        if not isinstance(payload, dict):
+            raise ApiError("request body must be a JSON object")
+        return payload
+
+    def do_OPTIONS(self):
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Access-Control-Max-Age', '86400')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json({'status': 'ok', 'scoring_version': SCORING_VERSION})
+        else:
+            self._send_json({'error': f"no such endpoint: {self.path}"}, HTTPStatus.NOT_FOUND)
+
+    def do_POST(self):
+        try:
+            if self.path != '/score':
+                self.close_connection = True
+                raise ApiError(f"no such endpoint: {self.path}", HTTPStatus.NOT_FOUND)
+            request = self._read_json()
+            min_score, top = request.get('min_score', 0), request.get('top')
+            # JSON true and false arrive as bools, which are ints to isinstance
+            if isinstance(min_score, bool) or not isinstance(min_score, (int, float)):
+                raise ApiError("'min_score' must be a number")
+            if top is not None and (isinstance(top, bool) or not isinstance(top, int) or top < 0):
+                raise ApiError("'top' must be a non-negative integer")
+            payload = score_batch(
+                request.get('job_description'), request.get('resumes'), semantic=bool(request.get('semantic')),
+                min_score=min_score, top=top, cache=self.server.cache
+            )
+        except ApiError as e:
+            self._send_json({'error': str(e)}, e.status)
+            return
+        except Exception as e:
+            # Answer rather than drop the connection, so clients see what went wrong
+            traceback.print_exc()
+            self._send_json({'error': f"internal error ({type(e).__name__}: {e})"}, HTTPStatus.INTERNAL_SERVER_ERROR)
+            return
+        self._send_json(payload)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """Scoring API server answering each connection on its own thread"""
+
+    daemon_threads = True
+
+    def __init__(self, address=(DEFAULT_HOST, DEFAULT_PORT), cache=None, verbose=False):
+        self.cache = cache
+        self.verbose = verbose
+        super().__init__(address, ScoringHandler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m screener.api',
+        description="Serve the scoring engine over HTTP: POST /score with a job description and a batch of resumes."
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST, help="interface to listen on (default: localhost only)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--no-cache', action='store_true', help="score every resume, ignoring the on-disk result cache")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    args = parser.parse_args(argv)
+
+    server = ScoringServer((args.host, args.port), cache=None if args.no_cache else ResultCache(),
+                           verbose=args.verbose)
+    print(f"Scoring API listening on http://{args.host}:{server.server_port} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,205 @@
+import numpy as np
+import pandas as pd
+
+from .profile import YEARS_PATTERN, compile_job_profile
+from .skills import popcount, unpack_masks
+from .vectors import embed
+
+# Bump whenever scoring rules change so cached results are recomputed
+SCORING_VERSION = 3
+
+RESULT_COLUMNS = [
+    'resume_id', 'name', 'email', 'score', 'skill_match', 'experience_match',
+    'education_match', 'semantic_match', 'matched_skills', 'missing_skills',
+    'skill_mask', 'has_leadership', 'open_source', 'recommendation', 'score_class'
+]
+
+# Education levels as detected in resume text, and the score each one earns
+EDUCATION_LEVELS = ['none', 'bachelor', 'master']
+EDUCATION_SCORES = np.array([50, 80, 100])
+
+# Job-independent facts parsed from each resume text, and their array dtypes;
+# skill_mask arrays have a row of matcher.words words per resume
+FEATURE_COLUMNS = {
+    'skill_mask': np.uint64,
+    'years': np.float64,
+    'education': np.int8,
+    'has_leadership': np.bool_,
+    'open_source': np.bool_,
+}
+
+
+def years_of_experience(contents):
+    """First "N years" figure in each text of a Series, NaN when absent"""
+    years = contents.str.extract(YEARS_PATTERN.pattern, flags=YEARS_PATTERN.flags, expand=False)
+    return years.astype(np.float64).to_numpy()
+
+
+def education_levels(lower):
+    """Index into EDUCATION_LEVELS for each lowercased text of a Series"""
+    return np.select(
+        [lower.str.contains('master|ms').to_numpy(), lower.str.contains('bachelor|bs').to_numpy()],
+        [2, 1],
+        0
+    )
+
+
+def resume_features(contents, matcher, embeddings=False):
+    """Parse resume texts once into the facts every job profile is scored from
+
+    Returns a dict of arrays with one entry per text, keyed and typed as in
+    FEATURE_COLUMNS, plus text embeddings when embeddings=True (needed for
+    semantic scoring).
+    """
+    contents = pd.Series(list(contents), dtype=object)
+    lower = contents.str.lower()
+    features = {
+        'skill_mask': matcher.pack(matcher.find_mask(text) for text in contents),
+        'years': years_of_experience(contents),
+        'education': education_levels(lower).astype(np.int8),
+        'has_leadership': lower.str.contains('lead|led|mentor').to_numpy(),
+        'open_source': lower.str.contains('open source', regex=False).to_numpy(),
+    }
+    if embeddings:
+        features['embedding'] = embed(contents.tolist())
+    return features
+
+
+def score_features(features, job_profile):
+    """Component scores (floats) and overall score (ints) of parsed resumes against one job profile"""
+    # Skill matching: bitwise ops on the resumes' skill bitmasks
+    matched = features['skill_mask'] & job_profile.skill_words
+    if job_profile.skills:
+        skill_score = popcount(matched).sum(axis=1).astype(np.float64) / len(job_profile.skills) * 100
+    else:
+        skill_score = np.zeros(len(matched))
+
+    # Experience matching
+    years = features['years']
+    if job_profile.min_years:
+        exp_score = np.where(np.isnan(years), 30, np.minimum(years / job_profile.min_years * 100, 100))
+    else:
+        # A job asking for "0+ years" is met by any stated experience
+        exp_score = np.where(np.isnan(years), 30, 100.0)
+
+    # Education matching
+    edu_score = EDUCATION_SCORES[features['education']]
+
+    # Leadership
+    leadership_bonus = np.where(features['has_leadership'], 10, 0)
+
+    # Semantic similarity to the job description, when enabled
+    if job_profile.semantic_weight:
+        semantic_score = job_profile.embedding_scores(features['embedding'])
+    else:
+        semantic_score = np.zeros(len(matched))
+
+    # Overall score
+    base_score = (
+        (skill_score * 0.5) +
+        (exp_score * 0.3) +
+        (edu_score * 0.15) +
+        (leadership_bonus * 0.05)
+    )
+    weight = job_profile.semantic_weight
+    return {
+        'score': (base_score * (1 - weight) + semantic_score * weight).astype(np.int64),
+        'skill_match': skill_score,
+        'experience_match': exp_score,
+        'education_match': edu_score,
+        'semantic_match': semantic_score,
+    }
+
+
+def analyze_resumes_batch(resumes, job_profile, start=0):
+    """Score a list of resumes against a job profile, one row per resume"""
+    if isinstance(job_profile, str):
+        job_profile = compile_job_profile(job_profile)
+    if not resumes:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    features = resume_features((r['content'] for r in resumes), job_profile.matcher,
+                               embeddings=bool(job_profile.semantic_weight))
+    return analyze_features_batch(
+        features, [r['name'] for r in resumes], [r['email'] for r in resumes], job_profile, start
+    )
+
+
+def analyze_features_batch(features, names, emails, job_profile, start=0):
+    """Score resumes already parsed by resume_features against a job profile, one row per resume
+
+    Only the job-dependent work is done here, so rescoring a stored pool
+    against a new or edited job description never reads the resume texts.
+    """
+    matcher = job_profile.matcher
+    scores = score_features(features, job_profile)
+    required = job_profile.skill_words
+    matched = features['skill_mask'] & required
+    score = scores['score']
+
+    return pd.DataFrame({
+        'resume_id': np.arange(start, start + len(score)),
+        'name': names,
+        'email': emails,
+        'score': score,
+        'skill_match': scores['skill_match'].astype(np.int64),
+        'experience_match': scores['experience_match'].astype(np.int64),
+        'education_match': scores['education_match'].astype(np.int64),
+        'semantic_match': scores['semantic_match'].astype(np.int64),
+        'matched_skills': matcher.expand_many(matched),
+        'missing_skills': matcher.expand_many(required & ~matched),
+        'skill_mask': unpack_masks(features['skill_mask']),
+        'has_leadership': features['has_leadership'],
+        'open_source': features['open_source'],
+        'recommendation': recommendations(score),
+        'score_class': score_classes(score),
+    }, columns=RESULT_COLUMNS)
+
+
+def recommendations(scores):
+    """Map an array of scores to recommendation labels"""
+    scores = np.asarray(scores)
+    return np.select(
+        [scores >= 80, scores >= 70, scores >= 60],
+        ["Strong Hire - Schedule Interview", "Recommended for Interview", "Consider for Phone Screen"],
+        "Not Recommended"
+    )
+
+
+def score_classes(scores):
+    """Map an array of scores to CSS classes"""
+    scores = np.asarray(scores)
+    return np.select(
+        [scores >= 80, scores >= 70, scores >= 60],
+        ['score-excellent', 'score-good', 'score-fair'],
+        'score-poor'
+    )
+
+
+def rank_results(results):
+    """Sort a results frame by score, best first, keeping input order on ties"""
+    return results.sort_values(
+        ['score', 'resume_id'], ascending=[False, True], kind='stable'
+    ).reset_index(drop=True)
+
+
+def generate_insights(result):
+    """Build the insight bullets for one result row"""
+    insights = []
+    if result['score'] >= 80:
+        insights.append("⭐ Excellent match for the position")
+        insights.append("🎯 Strong technical skills aligned with requirements")
+    elif result['score'] >= 65:
+        insights.append("✅ Good candidate with relevant experience")
+        insights.append("📈 Meets most core requirements")
+    else:
+        insights.append("⚠️ Limited alignment with job requirements")
+        insights.append("📚 May need additional training or experience")
+
+    if result['has_leadership']:
+        insights.append("👥 Demonstrated leadership and mentoring experience")
+
+    if result['open_source']:
+        insights.append("💻 Active open source contributor")
+
+    return insights
@@ -0,0 +1,227 @@
+import argparse
+import io
+import json
+import os
+import random
+import re
+import sys
+import timeit
+import tracemalloc
+
+import pandas as pd
+
+from .batch import analyze_features_batch, analyze_resumes_batch, rank_results
+from .cache import content_hash
+from .export import frame_chunks, write_export
+from .profile import compile_job_profile
+from .ranking import LiveRanking
+from .samples import SAMPLE_RESUMES
+from .scoring import analyze_resume, export_to_csv, extract_requirements
+from .skills import get_matcher
+from .store import CandidateStore
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_THRESHOLD = 0.2
+# Timed runs per stage; the fastest is kept, as it is the least disturbed by other load.
+# Quick stages run again until MIN_TIMED_SECONDS have been timed, up to MAX_REPEAT runs
+DEFAULT_REPEAT = 5
+MIN_TIMED_SECONDS = 1.0
+MAX_REPEAT = 50
+# Caps for the per-item stages, which would otherwise dominate the run at 100k
+MAX_JD_CALLS = 1_000
+MAX_SINGLE_RESUMES = 10_000
+
+BENCH_JOB_DESCRIPTION = """Senior Full Stack Developer
+
+Requirements:
+- 5+ years experience in web development
+- Strong proficiency in JavaScript, React, Node.js
+- Experience with Python and FastAPI
+- Knowledge of PostgreSQL and MongoDB
+- Cloud platform experience (AWS or GCP)
+- CI/CD pipeline setup experience
+- Bachelor's degree in Computer Science or related field
+
+Nice to have:
+- Experience with Docker and Kubernetes
+- TypeScript knowledge
+- Leadership experience"""
+
+FILLER_SENTENCES = [
+    "Collaborated with product and design on roadmap planning.",
+    "Wrote technical documentation and onboarding guides.",
+    "Improved test coverage and reduced flaky builds.",
+    "Participated in on-call rotation and incident reviews.",
+    "Worked in an agile team with two-week sprints.",
+    "Optimized database queries and API response times.",
+]
+
+
+def generate_resumes(n, seed=0):
+    """Build n synthetic resumes from the sample resumes and the skill taxonomy, reproducibly"""
+    rng = random.Random(seed)
+    skills = list(get_matcher().skills)
+    templates = [
+        [s.strip() for s in re.split(r'(?<=\.)\s+', sample['content']) if s.strip()]
+        for sample in SAMPLE_RESUMES
+    ]
+    resumes = []
+    for i in range(n):
+        sentences = list(rng.choice(templates))
+        rng.shuffle(sentences)
+        sentences.append("Also worked with " + ", ".join(rng.sample(skills, rng.randint(1, 6))) + ".")
+        # Lengths vary from a short summary to a multi-page resume
+        sentences.extend(rng.choice(FILLER_SENTENCES) for _ in range(int(rng.expovariate(1 / 8))))
+        resumes.append({
+            'name': f"Synthetic Candidate {i + 1}",
+            'email': f"synthetic{i + 1}@email.com",
+            'content': re.sub(r'\d+ years', f"{rng.randint(0, 15)} years", " ".join(sentences), count=1)
+        })
+    return resumes
+
+
+def _measure(func, items, repeat=DEFAULT_REPEAT):
+    """Time func as the best of at least repeat runs, then run it once under tracemalloc for peak and retained memory
+
+    Retained memory is what func's return value still holds, so stages that
+    build a long-lived structure report its size per item.
+    """
+    times = timeit.repeat(func, number=1, repeat=repeat)
+    while sum(times) < MIN_TIMED_SECONDS and len(times) < MAX_REPEAT:
+        times.extend(timeit.repeat(func, number=1, repeat=repeat))
+    seconds = min(times)
+
+    tracemalloc.start()
+    try:
+        kept = func()
+        retained, peak = tracemalloc.get_traced_memory()
+        del kept
+    finally:
+        tracemalloc.stop()
+    return {
+        'items': items,
+        'seconds': round(seconds, 6),
+        'per_second': round(items / seconds, 1) if seconds else None,
+        'peak_mb': round(peak / 2**20, 2),
+        'retained_mb': round(retained / 2**20, 2),
+        'bytes_per_item': round(retained / items) if items else None,
+    }
+
+
+def _copy_resumes(resumes):
+    # Fresh strings, as a list of resume dicts in session state holds them
+    return [{**r, 'content': r['content'].encode('utf-8').decode('utf-8')} for r in resumes]
+
+
+def _export(results, fmt):
+    with open(os.devnull, 'wb') as out:
+        return write_export(frame_chunks(results), out, fmt)
+
+
+def _ranked(results, keys, job_profile):
+    ranking = LiveRanking(job_profile)
+    ranking.add(results, keys)
+    return ranking
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, seed=0, repeat=DEFAULT_REPEAT):
+    """Time each pipeline stage at each pool size, best of repeat runs; returns {"stage@size": measurement}"""
+    results = {}
+    for size in sizes:
+        resumes = generate_resumes(size, seed)
+        job_profile = compile_job_profile(BENCH_JOB_DESCRIPTION)
+        scored = rank_results(analyze_resumes_batch(resumes, job_profile))
+        unsorted = scored.sample(frac=1, random_state=seed)
+        n_jd = min(size, MAX_JD_CALLS)
+        singles = resumes[:MAX_SINGLE_RESUMES]
+        keys = [content_hash(r['content']) for r in resumes]
+        store = CandidateStore(resumes)
+
+        stages = {
+            'extract_requirements': (lambda: [extract_requirements(BENCH_JOB_DESCRIPTION) for _ in range(n_jd)], n_jd),
+            'analyze_resume': (lambda: [analyze_resume(r, job_profile) for r in singles], len(singles)),
+            'analyze_resumes_batch': (lambda: analyze_resumes_batch(resumes, job_profile), size),
+            # Rescoring a stored pool, whose resumes were parsed into features on arrival
+            'analyze_features_batch': (
+                lambda: analyze_features_batch(store.features(), store.names, store.emails, job_profile), size
+            ),
+            'rank_results': (lambda: rank_results(unsorted), size),
+            'export_to_csv': (lambda: export_to_csv(scored).to_csv(io.StringIO(), index=False), size),
+            'write_export_csv': (lambda: _export(scored, 'csv'), size),
+            'write_export_parquet': (lambda: _export(scored, 'parquet'), size),
+            # Per-candidate memory: dicts and result records versus the compact structures
+            'resume_dicts': (lambda: _copy_resumes(resumes), size),
+            'candidate_store': (lambda: CandidateStore(resumes), size),
+            'result_records': (lambda: scored.to_dict('records'), size),
+            'live_ranking': (lambda: _ranked(scored, keys, job_profile), size),
+        }
+        for stage, (func, items) in stages.items():
+            results[f"{stage}@{size}"] = _measure(func, items, repeat)
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """List human-readable regressions: throughput down or peak memory up by more than threshold"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        if previous['per_second'] and current['per_second'] < previous['per_second'] * (1 - threshold):
+            regressions.append(
+                f"{key}: throughput {current['per_second']:,.0f}/s vs baseline {previous['per_second']:,.0f}/s"
+            )
+        if previous['peak_mb'] and current['peak_mb'] > previous['peak_mb'] * (1 + threshold):
+            regressions.append(
+                f"{key}: peak memory {current['peak_mb']:,.1f} MB vs baseline {previous['peak_mb']:,.1f} MB"
+            )
+    return regressions
+
+
+def format_table(results):
+    rows = [
+        {'stage': key.split('@')[0], 'size': int(key.split('@')[1]), **value}
+        for key, value in results.items()
+    ]
+    return pd.DataFrame(rows).to_string(index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m screener.bench',
+        description="Benchmark the screening pipeline on synthetic resumes."
+    )
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated pool sizes (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic resumes")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="timed runs per stage, keeping the fastest (default: %(default)s)")
+    parser.add_argument('--output', help="write the measurements to this JSON file")
+    parser.add_argument('--baseline', help="compare against measurements saved earlier with --output")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown or memory growth as a fraction (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    results = run_benchmarks(sizes, seed=args.seed, repeat=max(args.repeat, 1))
+    print(format_table(results))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
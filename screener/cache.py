@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from .batch import RESULT_COLUMNS, SCORING_VERSION
+from .parallel import iter_result_chunks
+
+CACHE_DIR = os.environ.get('SCREENER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'ai-resume-screener'))
+DEFAULT_CACHE_PATH = os.path.join(CACHE_DIR, 'results.sqlite3')
+DEFAULT_MAX_ENTRIES = 200_000
+# Eviction also frees this fraction of max_entries, so a full cache is recounted only every so many inserts
+EVICT_FRACTION = 0.1
+
+# Per-resume fields worth caching; resume_id, name and email come from the current upload
+CACHED_COLUMNS = [c for c in RESULT_COLUMNS if c not in ('resume_id', 'name', 'email')]
+
+
+def content_hash(text):
+    """SHA-256 of a resume's text"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def cache_key(resume_hash, job_profile):
+    """Cache key for one resume scored against one job profile"""
+    return f"{SCORING_VERSION}:{job_profile.fingerprint}:{resume_hash}"
+
+
+class ResultCache:
+    """Bounded on-disk key/value store (scored results, extracted text) with least-recently-used eviction"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Upper bound on the rows stored, counting every put as new; None until first counted
+        self._rows = None
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # One connection per call keeps the cache safe to share across Streamlit sessions
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used INTEGER NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+
+    @contextmanager
+    def _connect(self):
+        """A connection for one call, committed if the call succeeds and closed either way"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def get_many(self, keys):
+        """Return {key: cached row} for the keys present, marking them recently used"""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        now = time.time_ns()
+        with self._connect() as conn:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                marks = ','.join('?' * len(batch))
+                rows = conn.execute(f'SELECT key, value FROM results WHERE key IN ({marks})', batch)
+                found.update((key, json.loads(value)) for key, value in rows)
+                conn.execute(f'UPDATE results SET last_used = ? WHERE key IN ({marks})', [now, *batch])
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items):
+        """Store {key: row} pairs, then evict the least recently used beyond max_entries
+
+        The table is only counted once the rows put since the last count
+        could have filled it.
+        """
+        now = time.time_ns()
+        with self._connect() as conn:
+            if self._rows is None:
+                self._rows = conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+            conn.executemany(
+                'INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)',
+                ((key, json.dumps(row), now) for key, row in items.items())
+            )
+            self._rows += len(items)
+            if self._rows <= self.max_entries:
+                return
+            rows = conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+            excess = rows - self.max_entries
+            if excess > 0:
+                excess = min(rows, excess + int(self.max_entries * EVICT_FRACTION))
+                conn.execute(
+                    'DELETE FROM results WHERE key IN '
+                    '(SELECT key FROM results ORDER BY last_used LIMIT ?)',
+                    (excess,)
+                )
+                rows -= excess
+            self._rows = rows
+
+    def clear(self):
+        """Drop every cached result and reset the counters"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM results')
+        self.hits = self.misses = 0
+        self._rows = 0
+
+
+def iter_cached_result_chunks(resumes, job_profile, cache, **kwargs):
+    """Like iter_result_chunks, but serve unchanged resumes from the cache and only score the misses"""
+    # One pass over the resumes, which may be a CandidateStore that decompresses on read
+    keys, names, emails = [], [], []
+    for r in resumes:
+        keys.append(cache_key(content_hash(r['content']), job_profile))
+        names.append(r['name'])
+        emails.append(r['email'])
+    cached = cache.get_many(keys)
+
+    hit_ids = [i for i, key in enumerate(keys) if key in cached]
+    miss_ids = np.array([i for i, key in enumerate(keys) if key not in cached], dtype=np.int64)
+
+    done = len(hit_ids)
+    if hit_ids:
+        frame = pd.DataFrame([cached[keys[i]] for i in hit_ids], columns=CACHED_COLUMNS)
+        # JSON gives back plain ints; keep them as ints of any width, as results frames do
+        frame['skill_mask'] = pd.Series(list(frame['skill_mask'].map(int)), dtype=object)
+        frame.insert(0, 'resume_id', hit_ids)
+        frame.insert(1, 'name', [names[i] for i in hit_ids])
+        frame.insert(2, 'email', [emails[i] for i in hit_ids])
+        yield done, frame
+
+    missing = [resumes[i] for i in miss_ids]
+    for _, frame in iter_result_chunks(missing, job_profile, **kwargs):
+        # Chunk ids are positions within the misses; map them back to the full list
+        frame['resume_id'] = miss_ids[frame['resume_id'].to_numpy()]
+        cache.put_many({
+            keys[resume_id]: row
+            for resume_id, row in zip(frame['resume_id'], frame[CACHED_COLUMNS].to_dict('records'))
+        })
+        done += len(frame)
+        yield done, frame
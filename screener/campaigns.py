@@ -0,0 +1,106 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from .dedupe import NearDuplicateIndex
+from .index import SkillIndex
+from .ranking import LiveRanking
+from .reports import ReportCache
+from .storage import DEFAULT_DB_PATH
+from .store import CandidateStore
+from .vectors import VectorStore
+
+DEFAULT_CAMPAIGN = 'Default'
+# Rankings kept per campaign, one per analyzed job profile; the least recently used is dropped beyond this
+MAX_RANKINGS = 8
+
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w-]+')
+
+
+def campaign_db_path(name, default_path=DEFAULT_DB_PATH):
+    """SQLite file a campaign is saved to; the default campaign keeps default_path"""
+    if name == DEFAULT_CAMPAIGN:
+        return default_path
+    root, ext = os.path.splitext(default_path)
+    return f"{root}-{_UNSAFE_NAME_CHARS.sub('_', name.strip().lower())}{ext}"
+
+
+class Campaign:
+    """A candidate pool shared by every session working on the same campaign
+
+    Holds the resumes, their search and near-duplicate indexes, and one
+    LiveRanking per analyzed job profile, so each resume is parsed once and
+    scored once per job profile however many sessions have it open.
+    Sessions run on separate threads: hold lock while changing the
+    campaign or reading anything another session may change. version goes
+    up with every change to the pool, so sessions can tell when a snapshot
+    they keep is stale.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.RLock()
+        self.report_cache = ReportCache()
+        self.version = 0
+        self.clear()
+
+    def __len__(self):
+        return len(self.resumes)
+
+    def clear(self):
+        """Drop every resume, ranking and rendered report"""
+        self.resumes = CandidateStore()
+        self.skill_index = SkillIndex()
+        self.vector_store = VectorStore()
+        self.hashes = set()
+        self.near_duplicates = NearDuplicateIndex()
+        # canonical resume hash -> near-duplicates collapsed into it
+        self.variants = {}
+        # job profile fingerprint -> LiveRanking, least recently used first, and the requisition it was saved as
+        self.rankings = OrderedDict()
+        self.requisitions = {}
+        self.report_cache.clear()
+        self.changed()
+
+    def changed(self):
+        self.version += 1
+
+    def ranking(self, fingerprint):
+        """The ranking for a job profile fingerprint, or None if no session has analyzed it (or it was dropped)"""
+        ranking = self.rankings.get(fingerprint)
+        if ranking is not None:
+            self.rankings.move_to_end(fingerprint)
+        return ranking
+
+    def add_ranking(self, job_profile, requisition=None):
+        """Start an empty ranking for job_profile, dropping the least recently used beyond MAX_RANKINGS"""
+        ranking = LiveRanking(job_profile)
+        self.rankings[job_profile.fingerprint] = ranking
+        self.requisitions[job_profile.fingerprint] = requisition
+        while len(self.rankings) > MAX_RANKINGS:
+            fingerprint, _ = self.rankings.popitem(last=False)
+            self.requisitions.pop(fingerprint, None)
+        return ranking
+
+
+class Campaigns:
+    """Campaigns by name, created on first use; one instance serves the whole process"""
+
+    def __init__(self):
+        self._campaigns = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._campaigns)
+
+    def get(self, name):
+        with self._lock:
+            campaign = self._campaigns.get(name)
+            if campaign is None:
+                campaign = self._campaigns[name] = Campaign(name)
+            return campaign
+
+    def names(self):
+        with self._lock:
+            return sorted(self._campaigns)
@@ -0,0 +1,178 @@
+import argparse
+import glob
+import os
+import sys
+import time
+
+import pandas as pd
+
+from .batch import rank_results
+from .cache import ResultCache, iter_cached_result_chunks
+from .dedupe import NearDuplicateIndex
+from .export import EXPORT_FORMATS, ExportError, frame_chunks, write_export
+from .extract import get_text_cache
+from .ingest import RESUME_EXTENSIONS, ingest_uploads
+from .matrix import job_title, matrix_frame, score_matrix, split_job_descriptions
+from .parallel import iter_result_chunks
+from .profile import SEMANTIC_WEIGHT, compile_job_profile
+from .reports import write_report_archive
+
+INPUT_EXTENSIONS = RESUME_EXTENSIONS + ('.zip',)
+FORMAT_EXTENSIONS = {'.jsonl': 'jsonl', '.json': 'jsonl', '.parquet': 'parquet'}
+
+
+def expand_inputs(patterns):
+    """Resolve directories and glob patterns into a sorted list of resume and ZIP paths"""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                paths.update(os.path.join(root, f) for f in files)
+        else:
+            paths.update(glob.glob(pattern, recursive=True))
+    return sorted(p for p in paths if os.path.isfile(p) and p.lower().endswith(INPUT_EXTENSIONS))
+
+
+def _open_each(paths):
+    # One file handle open at a time, however many resumes there are
+    for path in paths:
+        with open(path, 'rb') as f:
+            yield f
+
+
+def load_resumes(paths, text_cache=None, workers=None, report=None, near_duplicates=None):
+    """Read, extract and deduplicate resumes from files on disk"""
+    resumes = []
+    for _, batch in ingest_uploads(_open_each(paths), set(), report=report, text_cache=text_cache, workers=workers,
+                                   near_duplicates=near_duplicates):
+        resumes.extend(batch)
+    return resumes
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m screener',
+        description="Score a directory (or glob) of resumes against a job description and rank them."
+    )
+    parser.add_argument('job_description', help="job description text file, or - for stdin")
+    parser.add_argument('resumes', nargs='+', help="resume files, directories, ZIP archives or glob patterns")
+    parser.add_argument('-o', '--output', default='-', help="output file (default: stdout)")
+    parser.add_argument('-f', '--format', choices=EXPORT_FORMATS,
+                        help="output format (default: from the output file extension, else csv)")
+    parser.add_argument('--columns', help="comma-separated result fields to write, e.g. rank,name,email,score")
+    parser.add_argument('--min-score', type=int, default=0, help="only write candidates scoring at least this")
+    parser.add_argument('--top', type=int, help="only write the N best candidates")
+    parser.add_argument('--reports-zip', metavar='PATH',
+                        help="also write a ZIP with a text report for each candidate written")
+    parser.add_argument('--position', help="position named in reports (default: first line of the job description)")
+    parser.add_argument('--semantic', action='store_true',
+                        help="blend text similarity to the job description into the score")
+    parser.add_argument('--matrix', action='store_true',
+                        help="the job description file holds several, separated by --- lines; write each "
+                             "resume's best fit and its score for every job as CSV")
+    parser.add_argument('--near-duplicates', action='store_true',
+                        help="score only the first of resumes that are near-identical (reposted or lightly edited)")
+    parser.add_argument('--parallel', action='store_true', help="score large batches on all CPU cores")
+    parser.add_argument('--workers', type=int, help="worker processes for extraction and parallel scoring")
+    parser.add_argument('--no-cache', action='store_true', help="ignore and do not update the on-disk caches")
+    return parser
+
+
+def write_matrix(args, job_desc, resumes, report, started):
+    """Score resumes against every job description in job_desc and write the matrix as CSV"""
+    job_descs = split_job_descriptions(job_desc)
+    if not job_descs:
+        print("error: no job descriptions found", file=sys.stderr)
+        return 1
+    semantic_weight = SEMANTIC_WEIGHT if args.semantic else 0.0
+    job_profiles = [compile_job_profile(desc, semantic_weight=semantic_weight) for desc in job_descs]
+    scores = score_matrix(resumes, job_profiles)
+    frame = matrix_frame(
+        scores, [job_title(desc) for desc in job_descs], [r['name'] for r in resumes], [r['email'] for r in resumes]
+    )
+
+    frame = frame[frame['Best Score'] >= args.min_score]
+    if args.top is not None:
+        frame = frame.head(args.top)
+    if args.output == '-':
+        frame.to_csv(sys.stdout, index=False, lineterminator='\n')
+    else:
+        frame.to_csv(args.output, index=False, lineterminator='\n')
+
+    print(
+        f"Scored {len(resumes)} resume(s) against {len(job_profiles)} job(s), {report['duplicates']} duplicate(s), "
+        f"{report['near_duplicates']} near-duplicate(s) and {len(report['skipped'])} unreadable file(s) skipped, "
+        f"in {time.perf_counter() - started:.2f}s",
+        file=sys.stderr
+    )
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+
+    if args.job_description == '-':
+        job_desc = sys.stdin.read()
+    else:
+        with open(args.job_description, encoding='utf-8', errors='ignore') as f:
+            job_desc = f.read()
+    job_profile = compile_job_profile(job_desc, semantic_weight=SEMANTIC_WEIGHT if args.semantic else 0.0)
+
+    paths = expand_inputs(args.resumes)
+    if not paths:
+        print("error: no resume files found", file=sys.stderr)
+        return 1
+
+    report = {}
+    text_cache = None if args.no_cache else get_text_cache()
+    near_duplicates = NearDuplicateIndex() if args.near_duplicates else None
+    resumes = load_resumes(paths, text_cache=text_cache, workers=args.workers, report=report,
+                           near_duplicates=near_duplicates)
+    for name, reason in report['skipped']:
+        print(f"skipped {name}: {reason}", file=sys.stderr)
+    if not resumes:
+        print("error: no readable resumes", file=sys.stderr)
+        return 1
+
+    if args.matrix:
+        return write_matrix(args, job_desc, resumes, report, started)
+
+    options = {'parallel': args.parallel, 'max_workers': args.workers}
+    if args.no_cache:
+        chunks = iter_result_chunks(resumes, job_profile, **options)
+        cache = None
+    else:
+        cache = ResultCache()
+        chunks = iter_cached_result_chunks(resumes, job_profile, cache, **options)
+    results = rank_results(pd.concat([frame for _, frame in chunks], ignore_index=True))
+
+    results = results[results['score'] >= args.min_score]
+    if args.top is not None:
+        results = results.head(args.top)
+
+    fmt = args.format or FORMAT_EXTENSIONS.get(os.path.splitext(args.output.lower())[1], 'csv')
+    columns = [c.strip() for c in args.columns.split(',') if c.strip()] if args.columns else None
+    try:
+        if args.output == '-':
+            write_export(frame_chunks(results), sys.stdout.buffer, fmt, columns)
+        else:
+            with open(args.output, 'wb') as out:
+                write_export(frame_chunks(results), out, fmt, columns)
+    except ExportError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if args.reports_zip:
+        position = args.position or job_title(job_desc)
+        with open(args.reports_zip, 'wb') as out:
+            write_report_archive(frame_chunks(results), out, position)
+
+    cached = f", {cache.hits} from cache" if cache is not None else ""
+    print(
+        f"Scored {len(resumes)} resume(s){cached}, {report['duplicates']} duplicate(s), "
+        f"{report['near_duplicates']} near-duplicate(s) and {len(report['skipped'])} unreadable file(s) skipped, "
+        f"in {time.perf_counter() - started:.2f}s",
+        file=sys.stderr
+    )
+    return 0
@@ -0,0 +1,178 @@
+import re
+import zlib
+
+import numpy as np
+
+# Word 3-grams; signatures of 64 hashes split into 16 bands of 4
+SHINGLE_WORDS = 3
+NUM_PERM = 64
+BANDS = 16
+# Estimated Jaccard similarity of shingle sets at which two resumes are one candidate
+DEFAULT_THRESHOLD = 0.8
+# Band keys are buffered in a dict and merged into the sorted arrays once the buffer
+# holds this many, or a quarter of the merged keys if more
+MERGE_MIN = 4096
+# Band buckets shared by more resumes than this are boilerplate and not searched;
+# true near-duplicates share several other bands
+MAX_BUCKET = 32
+
+# Word characters, counting every non-ASCII byte as one, so UTF-8 text splits on ASCII punctuation and spaces
+_WORD = re.compile(rb'[\w\x80-\xff]+')
+# Odd 64-bit multipliers for combining word hashes into shingles and rows into band keys
+_MIX = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93],
+                dtype=np.uint64)
+
+
+def shingles(text, k=SHINGLE_WORDS):
+    """Hashes of the distinct k-word shingles of text, lowercased; a shorter text is one shingle"""
+    words = np.array(list(map(zlib.crc32, _WORD.findall(text.lower().encode('utf-8')))), dtype=np.uint64)
+    if len(words) == 0:
+        return words
+    k = min(k, len(words))
+    hashes = np.zeros(len(words) - k + 1, dtype=np.uint64)
+    for i in range(k):
+        hashes = hashes * _MIX[i] + words[i:len(words) - k + 1 + i]
+    return np.unique(hashes)
+
+
+class MinHasher:
+    """MinHash signatures from num_perm seeded multiply-shift hash functions"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+
+    def signature(self, text):
+        """uint32 signature of text, or None if it has no words"""
+        hashes = shingles(text)
+        if len(hashes) == 0:
+            return None
+        with np.errstate(over='ignore'):
+            mixed = (self._a[:, None] * hashes[None, :] + self._b[:, None]) >> np.uint64(32)
+        return mixed.min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index of resumes, keyed by content hash, for collapsing near-duplicates
+
+    Each signature is cut into bands; resumes sharing any band are
+    candidates, and a candidate whose signatures agree on at least
+    threshold of their hashes is a near-duplicate. Band keys live in one
+    sorted array searched with binary search, plus a dict of recent keys
+    merged in geometrically, so adding and querying stay logarithmic in the
+    pool size. Buckets crowded by boilerplate shared across many resumes are
+    skipped. Removed resumes are dropped at the next merge.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=BANDS, seed=1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.hasher = MinHasher(num_perm, seed)
+        self._salt = np.arange(bands, dtype=np.uint64) * _MIX[3]
+        self._signatures = np.zeros((0, num_perm), dtype=np.uint32)
+        self._keys = []
+        self._ids = {}
+        self._alive = np.zeros(0, dtype=bool)
+        self._band_keys = np.zeros(0, dtype=np.uint64)
+        self._band_ids = np.zeros(0, dtype=np.int32)
+        self._recent = {}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def _band_hashes(self, signature):
+        rows = signature.reshape(self.bands, -1).astype(np.uint64)
+        with np.errstate(over='ignore'):
+            return (rows * _MIX[:rows.shape[1]]).sum(axis=1, dtype=np.uint64) ^ self._salt
+
+    def _candidates(self, bands):
+        left = np.searchsorted(self._band_keys, bands, 'left')
+        right = np.searchsorted(self._band_keys, bands, 'right')
+        found = [self._band_ids[l:r] for l, r in zip(left.tolist(), right.tolist()) if 0 < r - l <= MAX_BUCKET]
+        for band in bands.tolist():
+            rows = self._recent.get(band)
+            if rows and len(rows) <= MAX_BUCKET:
+                found.append(np.array(rows, dtype=np.int32))
+        if not found:
+            return found
+        ids = np.unique(np.concatenate(found))
+        return ids[self._alive[ids]]
+
+    def query(self, signature, bands=None):
+        """(key, similarity) of the closest indexed near-duplicate of a signature, or None"""
+        ids = self._candidates(self._band_hashes(signature) if bands is None else bands)
+        if not len(ids):
+            return None
+        similarity = (self._signatures[ids] == signature).mean(axis=1)
+        best = int(similarity.argmax())
+        if similarity[best] < self.threshold:
+            return None
+        return self._keys[ids[best]], float(similarity[best])
+
+    def add(self, key, signature, bands=None):
+        """Index a resume's signature under key; a key already indexed is left as is"""
+        if key in self._ids:
+            return
+        row = len(self._keys)
+        if row == len(self._signatures):
+            capacity = max(1024, 2 * row)
+            self._signatures = np.resize(self._signatures, (capacity, self._signatures.shape[1]))
+            self._alive = np.resize(self._alive, capacity)
+        self._signatures[row] = signature
+        self._alive[row] = True
+        self._keys.append(key)
+        self._ids[key] = row
+        for band in (self._band_hashes(signature) if bands is None else bands).tolist():
+            self._recent.setdefault(band, []).append(row)
+        if len(self._recent) >= max(MERGE_MIN, len(self._band_keys) // 4):
+            self._merge()
+
+    def add_texts(self, keys, texts):
+        """Index resumes by key without matching them, skipping keys already indexed and texts without words"""
+        for key, text in zip(keys, texts):
+            if key in self._ids:
+                continue
+            signature = self.hasher.signature(text)
+            if signature is not None:
+                self.add(key, signature)
+
+    def find_or_add(self, text, key):
+        """(canonical key, similarity) if text near-duplicates an indexed resume, else index it and return None
+
+        Texts without words are neither matched nor indexed.
+        """
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return None
+        bands = self._band_hashes(signature)
+        match = self.query(signature, bands)
+        if match is None:
+            self.add(key, signature, bands)
+        return match
+
+    def remove(self, key):
+        """Stop matching against key; unknown keys are ignored"""
+        row = self._ids.pop(key, None)
+        if row is not None:
+            self._alive[row] = False
+
+    def _merge(self):
+        recent_keys = np.fromiter(
+            (band for band, rows in self._recent.items() for _ in rows), dtype=np.uint64
+        )
+        recent_ids = np.fromiter((row for rows in self._recent.values() for row in rows), dtype=np.int32)
+        keys = np.concatenate([self._band_keys, recent_keys])
+        ids = np.concatenate([self._band_ids, recent_ids])
+        keep = self._alive[ids]
+        keys, ids = keys[keep], ids[keep]
+        order = np.argsort(keys, kind='stable')
+        self._band_keys = keys[order]
+        self._band_ids = ids[order]
+        self._recent = {}
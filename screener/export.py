@@ -0,0 +1,132 @@
+import json
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+EXPORT_MIME_TYPES = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet',
+}
+DEFAULT_CHUNK_ROWS = 10_000
+
+# Exportable result fields and their CSV headers; "rank" is the 1-based position
+EXPORT_HEADERS = {
+    'rank': 'Rank',
+    'name': 'Name',
+    'email': 'Email',
+    'score': 'Overall Score',
+    'skill_match': 'Skills Match',
+    'experience_match': 'Experience Match',
+    'education_match': 'Education Match',
+    'semantic_match': 'Semantic Match',
+    'recommendation': 'Recommendation',
+    'matched_skills': 'Matched Skills',
+    'missing_skills': 'Missing Skills',
+    'has_leadership': 'Leadership',
+    'open_source': 'Open Source',
+}
+DEFAULT_COLUMNS = {
+    'csv': [
+        'name', 'email', 'score', 'skill_match', 'experience_match', 'education_match',
+        'recommendation', 'matched_skills', 'missing_skills'
+    ],
+    'jsonl': [
+        'rank', 'name', 'email', 'score', 'skill_match', 'experience_match', 'education_match',
+        'semantic_match', 'recommendation', 'matched_skills', 'missing_skills'
+    ],
+}
+DEFAULT_COLUMNS['parquet'] = DEFAULT_COLUMNS['jsonl']
+
+_LIST_COLUMNS = ('matched_skills', 'missing_skills')
+
+
+class ExportError(Exception):
+    """Results could not be written in the requested format"""
+
+
+def frame_chunks(results, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Split a ranked results frame into consecutive row chunks"""
+    for start in range(0, len(results), chunk_rows):
+        yield results.iloc[start:start + chunk_rows]
+
+
+def _select(chunk, columns, first_rank):
+    out = chunk.reindex(columns=[c for c in columns if c != 'rank'])
+    if 'rank' in columns:
+        out.insert(columns.index('rank'), 'rank', range(first_rank, first_rank + len(chunk)))
+    return out
+
+
+def _write_csv(chunks, out, columns):
+    rows = 0
+    header = [EXPORT_HEADERS[c] for c in columns]
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        frame = _select(chunk, columns, rows + 1)
+        for name in _LIST_COLUMNS:
+            if name in frame:
+                frame[name] = frame[name].str.join(', ')
+        out.write(frame.to_csv(index=False, header=header, lineterminator='\n').encode('utf-8'))
+        header = False
+        rows += len(chunk)
+    if header:
+        out.write((','.join(header) + '\n').encode('utf-8'))
+    return rows
+
+
+def _write_jsonl(chunks, out, columns):
+    rows = 0
+    for chunk in chunks:
+        records = _select(chunk, columns, rows + 1).to_dict('records')
+        out.write(''.join(json.dumps(record) + '\n' for record in records).encode('utf-8'))
+        rows += len(chunk)
+    return rows
+
+
+def _write_parquet(chunks, out, columns):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ExportError("Parquet export needs pyarrow (pip install pyarrow)")
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(_select(chunk, columns, rows + 1), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out, table.schema)
+            # Each chunk becomes one row group, so only one chunk is held in memory
+            writer.write_table(table.cast(writer.schema))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ExportError("no results to export")
+    return rows
+
+
+_WRITERS = {
+    'csv': _write_csv,
+    'jsonl': _write_jsonl,
+    'parquet': _write_parquet,
+}
+
+
+def write_export(chunks, out, fmt='csv', columns=None):
+    """Write ranked result chunks to a binary stream as CSV, JSON lines or Parquet
+
+    chunks is an iterable of results frames in rank order, such as
+    frame_chunks(results) or LiveRanking.iter_chunks(), so only one chunk
+    is converted at a time. columns picks and orders the fields (keys of
+    EXPORT_HEADERS); the default depends on the format. Returns the number
+    of rows written.
+    """
+    if fmt not in _WRITERS:
+        raise ExportError(f"unknown export format {fmt!r} (choose from {', '.join(EXPORT_FORMATS)})")
+    columns = list(columns or DEFAULT_COLUMNS[fmt])
+    unknown = [c for c in columns if c not in EXPORT_HEADERS]
+    if unknown:
+        raise ExportError(f"unknown export column(s): {', '.join(unknown)}")
+    return _WRITERS[fmt](chunks, out, columns)
@@ -0,0 +1,245 @@
+import hashlib
+import importlib
+import io
+import multiprocessing
+import os
+import time
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+
+from .cache import CACHE_DIR, ResultCache
+
+# Bump whenever extraction output changes so cached text is re-extracted
+EXTRACTOR_VERSION = 1
+EXTRACT_TIMEOUT = 30
+# Decompressed size limit for word/document.xml, against ZIP bombs
+MAX_DOCX_XML_BYTES = 50 * 1024 * 1024
+DEFAULT_TEXT_CACHE_PATH = os.path.join(CACHE_DIR, 'extracted.sqlite3')
+
+_POLL_INTERVAL = 0.01
+
+
+class ExtractionError(Exception):
+    """A resume file could not be turned into text"""
+
+
+def extract_docx_text(data):
+    """Extract paragraph text from a DOCX file with a streaming XML parse"""
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            try:
+                info = zf.getinfo('word/document.xml')
+            except KeyError:
+                raise ExtractionError("not a Word document (word/document.xml missing)")
+            if info.file_size > MAX_DOCX_XML_BYTES:
+                raise ExtractionError("document body too large")
+            parts = []
+            with zf.open(info) as xml:
+                for _, elem in ET.iterparse(xml, events=('end',)):
+                    tag = elem.tag.rsplit('}', 1)[-1]
+                    if tag == 't':
+                        parts.append(elem.text or '')
+                    elif tag == 'tab':
+                        parts.append('\t')
+                    elif tag in ('br', 'cr'):
+                        parts.append('\n')
+                    elif tag == 'p':
+                        parts.append('\n')
+                        # Finished paragraphs are dropped so memory stays flat
+                        elem.clear()
+    except (zipfile.BadZipFile, ET.ParseError, zlib.error, EOFError, OSError, ValueError) as e:
+        raise ExtractionError(f"corrupt DOCX file ({e})")
+    return ''.join(parts)
+
+
+def _pypdf_text(data):
+    from pypdf import PdfReader
+    reader = PdfReader(io.BytesIO(data))
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def _pdfminer_text(data):
+    from pdfminer.high_level import extract_text
+    return extract_text(io.BytesIO(data))
+
+
+# Tried in order; SCREENER_PDF_BACKEND can name one of these or a "module:function" path
+PDF_BACKENDS = {
+    'pypdf': _pypdf_text,
+    'pdfminer': _pdfminer_text,
+}
+
+
+def _resolve_pdf_backends(backend=None):
+    backend = backend or os.environ.get('SCREENER_PDF_BACKEND')
+    if not backend:
+        return list(PDF_BACKENDS.values())
+    if backend in PDF_BACKENDS:
+        return [PDF_BACKENDS[backend]]
+    module_name, _, func_name = backend.partition(':')
+    return [getattr(importlib.import_module(module_name), func_name)]
+
+
+def extract_pdf_text(data, backend=None):
+    """Extract text from a PDF with the first available backend"""
+    for func in _resolve_pdf_backends(backend):
+        try:
+            return func(data)
+        except ImportError:
+            continue
+        except Exception as e:
+            raise ExtractionError(f"could not parse PDF ({e})")
+    raise ExtractionError("no PDF backend installed (pip install pypdf)")
+
+
+def extract_text(name, data):
+    """Turn the raw bytes of a resume file into text, choosing the parser by extension"""
+    lower = name.lower()
+    if lower.endswith('.pdf'):
+        text = extract_pdf_text(data)
+    elif lower.endswith('.docx'):
+        text = extract_docx_text(data)
+    else:
+        text = data.decode('utf-8', errors='ignore')
+    if not text.strip():
+        raise ExtractionError("no extractable text")
+    return text
+
+
+def _needs_worker(name):
+    return name.lower().endswith(('.pdf', '.docx'))
+
+
+def _extract_in_worker(name, data):
+    try:
+        return extract_text(name, data), None
+    except ExtractionError as e:
+        return None, str(e)
+    except Exception as e:
+        # Any other parser failure skips this file rather than the whole upload
+        return None, f"could not parse file ({type(e).__name__}: {e})"
+
+
+def get_text_cache(path=DEFAULT_TEXT_CACHE_PATH):
+    """On-disk cache of extracted text keyed by file hash"""
+    return ResultCache(path)
+
+
+def _text_cache_key(digest):
+    return f"text:{EXTRACTOR_VERSION}:{digest}"
+
+
+class ExtractionPool:
+    """Parse PDF/DOCX files in worker processes, killing any that overrun the per-file timeout
+
+    The pool starts with no more processes than there are files to parse,
+    up to workers, so a single PDF costs one interpreter rather than one
+    per core.
+    """
+
+    def __init__(self, workers=None, timeout=EXTRACT_TIMEOUT, cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.cache = cache
+        self._pool = None
+        # Worker processes, fixed when the first files are submitted
+        self._processes = None
+        # entry number -> (name, data, digest, async result, start time)
+        self._in_flight = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _submit(self, key, name, data, digest):
+        if self._pool is None:
+            self._pool = multiprocessing.get_context('spawn').Pool(self._processes)
+        task = self._pool.apply_async(_extract_in_worker, (name, data))
+        self._in_flight[key] = (name, data, digest, task, time.monotonic())
+
+    def _restart(self):
+        """Kill a pool holding a stuck worker and resubmit everything still pending"""
+        pending = list(self._in_flight.items())
+        self._in_flight.clear()
+        self.close()
+        for key, (name, data, digest, _, _) in pending:
+            self._submit(key, name, data, digest)
+
+    def _collect(self, block):
+        """Yield finished (name, text, error) tuples; if block, wait for at least one"""
+        while True:
+            finished = []
+            timed_out = False
+            now = time.monotonic()
+            for key, (name, data, digest, task, started) in list(self._in_flight.items()):
+                if task.ready():
+                    del self._in_flight[key]
+                    text, error = task.get()
+                    if text is not None and self.cache is not None:
+                        self.cache.put_many({_text_cache_key(digest): {'text': text}})
+                    finished.append((name, text, error))
+                elif now - started > self.timeout:
+                    del self._in_flight[key]
+                    finished.append((name, None, f"timed out after {self.timeout}s"))
+                    timed_out = True
+            if timed_out:
+                self._restart()
+            yield from finished
+            if finished or not block or not self._in_flight:
+                return
+            time.sleep(_POLL_INTERVAL)
+
+    def _start(self, waiting):
+        """Size the pool to the files waiting for it and submit them"""
+        self._processes = len(waiting)
+        for key, name, data, digest in waiting:
+            self._submit(key, name, data, digest)
+
+    def iter_extracted(self, entries):
+        """Yield (name, text, error) for (name, data, error) entries, possibly out of order"""
+        # Files held back until workers of them are waiting or the entries run out
+        waiting = []
+        for key, (name, data, error) in enumerate(entries):
+            if error:
+                yield name, None, error
+                continue
+            if not _needs_worker(name):
+                try:
+                    yield name, extract_text(name, data), None
+                except ExtractionError as e:
+                    yield name, None, str(e)
+                continue
+
+            digest = hashlib.sha256(data).hexdigest()
+            if self.cache is not None:
+                cached = self.cache.get_many([_text_cache_key(digest)])
+                if cached:
+                    yield name, cached[_text_cache_key(digest)]['text'], None
+                    continue
+
+            if self._processes is None:
+                waiting.append((key, name, data, digest))
+                if len(waiting) == self.workers:
+                    self._start(waiting)
+                    waiting = []
+                continue
+
+            # Keep at most one file per worker in flight so timeouts start on submission
+            while len(self._in_flight) >= self._processes:
+                yield from self._collect(block=True)
+            self._submit(key, name, data, digest)
+            yield from self._collect(block=False)
+
+        if waiting:
+            self._start(waiting)
+        while self._in_flight:
+            yield from self._collect(block=True)
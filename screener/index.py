@@ -0,0 +1,98 @@
+import re
+
+import numpy as np
+
+from .batch import EDUCATION_LEVELS
+from .profile import YEARS_PATTERN
+from .skills import get_matcher
+
+# A skill is excluded when the words just before it end in one of these
+NEGATION_PATTERN = re.compile(r'(?:\b(?:not|without|no|except)\s+|(?:^|\s)[-!])$')
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class SkillIndex:
+    """Inverted index from taxonomy skills to resume positions, with years and education columns"""
+
+    def __init__(self, matcher=None):
+        self.matcher = matcher or get_matcher()
+        self.postings = {skill: _EMPTY for skill in self.matcher.skills}
+        self.years = np.empty(0, dtype=np.float64)
+        self.education = np.empty(0, dtype=np.int8)
+
+    def __len__(self):
+        return len(self.years)
+
+    def add_features(self, features):
+        """Index resumes already parsed by resume_features (against this index's taxonomy), without their text"""
+        masks = features['skill_mask']
+        start = len(self)
+        for skill in self.matcher.skills:
+            word, bit = self.matcher.word_bits[skill]
+            ids = np.flatnonzero(masks[:, word] & bit)
+            if len(ids):
+                self.postings[skill] = np.concatenate([self.postings[skill], ids + start])
+        self.years = np.concatenate([self.years, features['years']])
+        self.education = np.concatenate([self.education, features['education'].astype(np.int8)])
+
+    def remove(self, position):
+        """Drop one resume and shift later positions down, mirroring list.pop"""
+        for skill, ids in self.postings.items():
+            ids = ids[ids != position]
+            ids[ids > position] -= 1
+            self.postings[skill] = ids
+        self.years = np.delete(self.years, position)
+        self.education = np.delete(self.education, position)
+
+    def search(self, all_of=(), none_of=(), min_years=None, max_years=None, min_education=None):
+        """Sorted positions of resumes with every skill in all_of, none in none_of, inside the ranges"""
+        if all_of:
+            # Intersect from the rarest skill up so intermediate results stay small
+            lists = sorted((self.postings.get(s, _EMPTY) for s in all_of), key=len)
+            ids = lists[0]
+            for other in lists[1:]:
+                ids = np.intersect1d(ids, other, assume_unique=True)
+        else:
+            ids = np.arange(len(self))
+        for skill in none_of:
+            ids = np.setdiff1d(ids, self.postings.get(skill, _EMPTY), assume_unique=True)
+        # Resumes without a years figure (NaN) never satisfy a years bound
+        if min_years is not None:
+            ids = ids[self.years[ids] >= min_years]
+        if max_years is not None:
+            ids = ids[self.years[ids] <= max_years]
+        if min_education is not None:
+            ids = ids[self.education[ids] >= min_education]
+        return ids
+
+    def query(self, text):
+        """Run a free-text query such as "Kubernetes AND PostgreSQL NOT Angular 5+ years" """
+        return self.search(**parse_query(text, self.matcher))
+
+
+def parse_query(text, matcher=None):
+    """Turn a free-text query into SkillIndex.search keyword arguments
+
+    Skills are ANDed together; a skill preceded by "not", "without", "no",
+    "except", "-" or "!" is excluded. "N+ years" sets a minimum, and
+    "bachelor" or "master" sets a minimum education level.
+    """
+    matcher = matcher or get_matcher()
+    lower = text.lower()
+    query = {'all_of': [], 'none_of': []}
+
+    years_match = YEARS_PATTERN.search(lower)
+    if years_match:
+        query['min_years'] = int(years_match.group(1))
+    for level, name in enumerate(EDUCATION_LEVELS):
+        if level and name in lower:
+            query['min_education'] = level
+
+    last_end = 0
+    for match in matcher.pattern.finditer(lower):
+        skill = matcher.canonical(match.group(0))
+        negated = NEGATION_PATTERN.search(lower[last_end:match.start()])
+        query['none_of' if negated else 'all_of'].append(skill)
+        last_end = match.end()
+    return query
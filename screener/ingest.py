@@ -0,0 +1,125 @@
+import os
+import zipfile
+from contextlib import nullcontext
+
+from .cache import content_hash
+from .extract import ExtractionPool
+
+RESUME_EXTENSIONS = ('.txt', '.pdf', '.docx')
+MAX_FILE_BYTES = 5 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 500
+
+
+def _is_resume_name(name):
+    base = os.path.basename(name)
+    return bool(base) and not base.startswith('.') and name.lower().endswith(RESUME_EXTENSIONS)
+
+
+def _zip_entries(zf):
+    return [
+        info for info in zf.infolist()
+        if not info.is_dir() and not info.filename.startswith('__MACOSX/') and _is_resume_name(info.filename)
+    ]
+
+
+def count_upload_entries(files):
+    """Number of resume files in the uploads, counting ZIP members from the central directory only"""
+    total = 0
+    for file in files:
+        if file.name.lower().endswith('.zip'):
+            file.seek(0)
+            try:
+                with zipfile.ZipFile(file) as zf:
+                    total += len(_zip_entries(zf))
+            except zipfile.BadZipFile:
+                total += 1
+        else:
+            total += 1
+    return total
+
+
+def iter_upload_entries(files, max_file_bytes=MAX_FILE_BYTES):
+    """Yield (name, data, error) for each resume file, reading ZIP members one at a time"""
+    for file in files:
+        file.seek(0)
+        if file.name.lower().endswith('.zip'):
+            try:
+                with zipfile.ZipFile(file) as zf:
+                    for info in _zip_entries(zf):
+                        if info.file_size > max_file_bytes:
+                            yield info.filename, None, "file too large"
+                            continue
+                        with zf.open(info) as member:
+                            yield info.filename, member.read(max_file_bytes + 1), None
+            except zipfile.BadZipFile as e:
+                yield file.name, None, f"invalid ZIP archive ({e})"
+        else:
+            data = file.read(max_file_bytes + 1)
+            if len(data) > max_file_bytes:
+                yield file.name, None, "file too large"
+            else:
+                yield file.name, data, None
+
+
+def ingest_uploads(files, seen_hashes, next_number=1, capacity=None, batch_size=DEFAULT_BATCH_SIZE,
+                   report=None, text_cache=None, workers=None, near_duplicates=None, lock=None):
+    """Extract uploads lazily and yield (files_processed, batch) with new, unique resumes
+
+    seen_hashes is updated in place, so ingesting the same files twice adds
+    nothing. Ingestion stops once capacity resumes have been accepted.
+    report, if given, collects added/duplicate counts and skipped files.
+    PDF and DOCX files are parsed in a worker pool, with text cached in
+    text_cache by file hash. With a NearDuplicateIndex as near_duplicates,
+    resumes close to one already indexed are not added but listed in
+    report['variants'] against the canonical resume's hash. When seen_hashes
+    and near_duplicates are shared, pass the lock guarding them: it is held
+    while each resume is checked and recorded, not while files are parsed.
+    """
+    if report is None:
+        report = {}
+    report.setdefault('added', 0)
+    report.setdefault('duplicates', 0)
+    report.setdefault('near_duplicates', 0)
+    report.setdefault('variants', [])
+    report.setdefault('skipped', [])
+
+    if lock is None:
+        lock = nullcontext()
+    batch = []
+    processed = 0
+    with ExtractionPool(workers=workers, cache=text_cache) as pool:
+        for name, content, error in pool.iter_extracted(iter_upload_entries(files)):
+            processed += 1
+            if error:
+                report['skipped'].append((name, error))
+                continue
+            if capacity is not None and report['added'] >= capacity:
+                report['skipped'].append((name, "resume store is full"))
+                continue
+
+            digest = content_hash(content)
+            name = os.path.splitext(os.path.basename(name))[0]
+            with lock:
+                if digest in seen_hashes:
+                    report['duplicates'] += 1
+                    continue
+                seen_hashes.add(digest)
+                match = near_duplicates.find_or_add(content, digest) if near_duplicates is not None else None
+            if match is not None:
+                report['near_duplicates'] += 1
+                report['variants'].append({'name': name, 'hash': digest, 'canonical': match[0],
+                                           'similarity': match[1]})
+                continue
+
+            batch.append({
+                'name': name,
+                'email': f"candidate{next_number + report['added']}@email.com",
+                'content': content
+            })
+            report['added'] += 1
+            if len(batch) >= batch_size:
+                yield processed, batch
+                batch = []
+
+    if batch or processed:
+        yield processed, batch
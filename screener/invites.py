@@ -0,0 +1,382 @@
+import argparse
+import asyncio
+import os
+import smtplib
+import ssl
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from datetime import time as clock
+from email.message import EmailMessage
+from email.utils import formataddr
+
+INTERVIEW_DURATIONS = {
+    "30 minutes": 30,
+    "45 minutes": 45,
+    "1 hour": 60,
+    "1.5 hours": 90,
+}
+# Interviews are booked on weekdays and must end by this time
+DAY_END = clock(17, 0)
+
+# Open SMTP connections, invites per second and attempts per invite
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE = 50.0
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF = 0.5
+SMTP_TIMEOUT = 30
+
+INVITE_TEMPLATE = """Dear {name},
+
+We are pleased to invite you for an interview for the position of {position}.
+
+Interview Details:
+- Date: {date}
+- Time: {time}
+- Duration: {duration}
+- Type: {interview_type}
+{meeting_line}
+
+{notes_block}
+
+We look forward to speaking with you!
+
+Best regards"""
+
+
+def _ics_text(value):
+    """value as an iCalendar TEXT value, escaped per RFC 5545 section 3.3.11"""
+    value = value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+    return value.replace('\r\n', '\\n').replace('\n', '\\n').replace('\r', '\\n')
+
+
+def _ics_param(value):
+    """value as a quoted iCalendar parameter value, which can hold neither quotes nor line breaks"""
+    return '"' + ''.join(' ' if char in '"\r\n' else char for char in value) + '"'
+
+
+@dataclass(frozen=True)
+class SMTPSettings:
+    """Where and how invites are sent; defaults come from SCREENER_SMTP_* environment variables"""
+    host: str = field(default_factory=lambda: os.environ.get('SCREENER_SMTP_HOST', 'localhost'))
+    port: int = field(default_factory=lambda: int(os.environ.get('SCREENER_SMTP_PORT', '1025')))
+    sender: str = field(default_factory=lambda: os.environ.get('SCREENER_SMTP_SENDER', 'recruiting@example.com'))
+    username: str = field(default_factory=lambda: os.environ.get('SCREENER_SMTP_USER', ''))
+    password: str = field(default_factory=lambda: os.environ.get('SCREENER_SMTP_PASSWORD', ''), repr=False)
+    starttls: bool = field(default_factory=lambda: os.environ.get('SCREENER_SMTP_STARTTLS', '') == '1')
+
+
+@dataclass(frozen=True)
+class Invite:
+    """One interview invitation: candidate, slot and the details shown in the email"""
+    name: str
+    email: str
+    start: datetime
+    duration: str
+    interview_type: str
+    position: str
+    meeting_link: str = ''
+    notes: str = ''
+
+    @property
+    def end(self):
+        return self.start + timedelta(minutes=INTERVIEW_DURATIONS[self.duration])
+
+    def body(self):
+        return INVITE_TEMPLATE.format(
+            name=self.name,
+            position=self.position,
+            date=self.start.date(),
+            time=self.start.time(),
+            duration=self.duration,
+            interview_type=self.interview_type,
+            meeting_line=f"- Meeting Link: {self.meeting_link}" if self.meeting_link else "",
+            notes_block=f"Additional Notes:\n{self.notes}" if self.notes else ""
+        )
+
+    def calendar(self, sender):
+        """iCalendar request for the slot, so mail clients offer to add it to the calendar"""
+        stamp = '%Y%m%dT%H%M%S'
+        lines = [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//AI Resume Screener//Interview Invites//EN',
+            'METHOD:REQUEST',
+            'BEGIN:VEVENT',
+            f'UID:{uuid.uuid4()}',
+            f"DTSTAMP:{datetime.now(timezone.utc).strftime(stamp)}Z",
+            f'DTSTART:{self.start.strftime(stamp)}',
+            f'DTEND:{self.end.strftime(stamp)}',
+            f'SUMMARY:{_ics_text(f"{self.interview_type} - {self.position}")}',
+            f'LOCATION:{_ics_text(self.meeting_link)}',
+            f'ORGANIZER:mailto:{sender}',
+            f'ATTENDEE;CN={_ics_param(self.name)};RSVP=TRUE:mailto:{self.email}',
+            'END:VEVENT',
+            'END:VCALENDAR',
+        ]
+        return '\r\n'.join(lines) + '\r\n'
+
+    def message(self, sender):
+        msg = EmailMessage()
+        msg['From'] = sender
+        msg['To'] = formataddr((self.name, self.email))
+        msg['Subject'] = f'Interview Invitation: {self.position}'
+        msg.set_content(self.body())
+        msg.add_attachment(self.calendar(sender), subtype='calendar', filename='invite.ics')
+        return msg
+
+
+def assign_slots(count, first_slot, duration_minutes, gap_minutes=0, day_end=DAY_END):
+    """Start times for count back-to-back interviews from first_slot
+
+    Slots run through each weekday until the next one would end after
+    day_end, then continue the next weekday at first_slot's time of day.
+    """
+    duration = timedelta(minutes=duration_minutes)
+    step = duration + timedelta(minutes=gap_minutes)
+    day_start = first_slot.time()
+    if datetime.combine(first_slot.date(), day_start) + duration > datetime.combine(first_slot.date(), day_end):
+        raise ValueError(f"a {duration_minutes}-minute interview starting at {day_start:%H:%M} "
+                         f"ends after {day_end:%H:%M}")
+    slots = []
+    start = first_slot
+    while len(slots) < count:
+        if start.weekday() >= 5 or start + duration > datetime.combine(start.date(), day_end):
+            start = datetime.combine(start.date() + timedelta(days=1), day_start)
+            continue
+        slots.append(start)
+        start += step
+    return slots
+
+
+class RateLimiter:
+    """Token bucket: at most rate acquisitions per second, in bursts of up to burst"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.rate:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+class SMTPPool:
+    """Up to size SMTP connections, opened on first use and reused for every later message
+
+    smtplib blocks, so each send runs on a dedicated thread pool while the
+    event loop schedules the rest. A connection that fails is dropped and
+    replaced on the next acquire.
+    """
+
+    def __init__(self, settings, size=DEFAULT_CONCURRENCY):
+        self.settings = settings
+        self.size = size
+        self.connections_opened = 0
+        self._idle = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='smtp')
+
+    def _connect(self):
+        settings = self.settings
+        conn = smtplib.SMTP(settings.host, settings.port, timeout=SMTP_TIMEOUT)
+        if settings.starttls:
+            conn.starttls(context=ssl.create_default_context())
+        if settings.username:
+            conn.login(settings.username, settings.password)
+        self.connections_opened += 1
+        return conn
+
+    def _send(self, conn, message):
+        if conn is None:
+            conn = self._connect()
+        try:
+            conn.send_message(message)
+        except BaseException:
+            _close(conn)
+            raise
+        return conn
+
+    async def send(self, message):
+        """Send one message over a pooled connection, opening one if none is idle"""
+        conn = await self._idle.get()
+        try:
+            conn = await asyncio.get_running_loop().run_in_executor(self._executor, self._send, conn, message)
+        except BaseException:
+            conn = None
+            raise
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def close(self):
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            if conn is not None:
+                await asyncio.get_running_loop().run_in_executor(self._executor, _quit, conn)
+        self._executor.shutdown(wait=False)
+
+
+def _quit(conn):
+    try:
+        conn.quit()
+    except (smtplib.SMTPException, OSError):
+        _close(conn)
+
+
+def _close(conn):
+    try:
+        conn.close()
+    except OSError:
+        pass
+
+
+def _is_transient(error):
+    # 4xx replies and dropped connections are worth retrying; 5xx rejections are not
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError))
+
+
+async def send_invites_async(invites, settings=None, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                             retries=DEFAULT_RETRIES, progress=None):
+    """Send invites concurrently over pooled SMTP connections; returns one status dict per invite, in order
+
+    rate caps invites per second (None for no cap). Transient failures are
+    retried up to retries times with exponential backoff. progress, if
+    given, is called with the number of invites finished after each one.
+    """
+    settings = settings or SMTPSettings()
+    pool = SMTPPool(settings, concurrency)
+    limiter = RateLimiter(rate, burst=concurrency)
+    done = 0
+
+    async def deliver(invite):
+        nonlocal done
+        started = time.perf_counter()
+        status = {'name': invite.name, 'email': invite.email, 'slot': invite.start, 'status': 'sent',
+                  'attempts': 0, 'error': ''}
+        try:
+            # Built once, before any attempt; a header that can't be encoded fails this invite, not the batch
+            message = invite.message(settings.sender)
+        except ValueError as e:
+            status['status'] = 'failed'
+            status['error'] = f"{type(e).__name__}: {e}"
+        else:
+            for attempt in range(1, retries + 2):
+                await limiter.wait()
+                status['attempts'] = attempt
+                try:
+                    await pool.send(message)
+                    status['error'] = ''
+                    break
+                except (smtplib.SMTPException, OSError) as e:
+                    status['error'] = f"{type(e).__name__}: {e}"
+                    if not _is_transient(e) or attempt > retries:
+                        status['status'] = 'failed'
+                        break
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+        status['seconds'] = round(time.perf_counter() - started, 3)
+        done += 1
+        if progress is not None:
+            progress(done)
+        return status
+
+    try:
+        return await asyncio.gather(*(deliver(invite) for invite in invites))
+    finally:
+        await pool.close()
+
+
+def send_invites(invites, settings=None, **kwargs):
+    """Blocking wrapper around send_invites_async, for callers without an event loop"""
+    return asyncio.run(send_invites_async(invites, settings, **kwargs))
+
+
+async def _smtp_session(reader, writer, delay, received):
+    # Just enough of RFC 5321 for smtplib: accept every message and count it
+    writer.write(b'220 localhost screener SMTP stand-in\r\n')
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        command = line[:4].upper()
+        if command == b'EHLO':
+            writer.write(b'250-localhost\r\n250 8BITMIME\r\n')
+        elif command == b'DATA':
+            writer.write(b'354 End data with <CR><LF>.<CR><LF>\r\n')
+            await writer.drain()
+            while (await reader.readline()) not in (b'.\r\n', b''):
+                pass
+            if delay:
+                await asyncio.sleep(delay)
+            received.append(time.time())
+            writer.write(b'250 OK\r\n')
+        elif command == b'QUIT':
+            writer.write(b'221 Bye\r\n')
+            break
+        elif command in (b'HELO', b'MAIL', b'RCPT', b'RSET', b'NOOP'):
+            writer.write(b'250 OK\r\n')
+        else:
+            writer.write(b'502 Command not implemented\r\n')
+        await writer.drain()
+    await writer.drain()
+    writer.close()
+
+
+async def serve_smtp_stand_in(host='localhost', port=1025, delay=0.0, received=None):
+    """Local SMTP server that accepts and discards every message, for trying invites out
+
+    delay simulates a slow server, in seconds per message. Accepted
+    messages are counted by appending their arrival time to received.
+    """
+    received = [] if received is None else received
+    return await asyncio.start_server(lambda r, w: _smtp_session(r, w, delay, received), host, port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m screener.invites',
+        description="Run a local SMTP stand-in that accepts interview invites without delivering them."
+    )
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=1025)
+    parser.add_argument('--delay', type=float, default=0.0, help="seconds to wait before accepting each message")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        received = []
+        server = await serve_smtp_stand_in(args.host, args.port, args.delay, received)
+        print(f"SMTP stand-in listening on {args.host}:{args.port} (Ctrl+C to stop)")
+        async with server:
+            while True:
+                count = len(received)
+                await asyncio.sleep(1)
+                if len(received) > count:
+                    print(f"accepted {len(received) - count} message(s), {len(received)} in total")
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
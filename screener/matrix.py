@@ -0,0 +1,98 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from .batch import resume_features, score_features
+from .parallel import DEFAULT_CHUNK_SIZE
+from .store import CandidateStore
+from .vectors import embed
+
+# A line of three or more dashes separates job descriptions in one text
+JOB_SEPARATOR = re.compile(r'^\s*-{3,}\s*$', re.M)
+
+
+def split_job_descriptions(text):
+    """Split text holding several job descriptions, separated by "---" lines, into a list"""
+    return [part.strip() for part in JOB_SEPARATOR.split(text) if part.strip()]
+
+
+def job_title(job_desc):
+    """First non-blank line of a job description"""
+    return next((line.strip() for line in job_desc.splitlines() if line.strip()), '')
+
+
+def iter_score_matrix(resumes, job_profiles, chunk_size=DEFAULT_CHUNK_SIZE, vectors=None):
+    """Score resumes against every job profile chunk by chunk, yielding (resumes_done, scores)
+
+    Each chunk's texts are parsed once into resume features, or read from
+    a CandidateStore's stored features, then scored against each profile
+    with array ops; scores is an int16 array with one row per resume and
+    one column per profile. vectors, such as VectorStore.vectors, supplies
+    the resumes' embeddings for semantic scoring instead of re-embedding.
+    """
+    if not job_profiles:
+        raise ValueError("no job profiles to score against")
+    matcher = job_profiles[0].matcher
+    if any(p.matcher.fingerprint != matcher.fingerprint for p in job_profiles):
+        raise ValueError("job profiles must share one skill taxonomy")
+    embeddings = any(p.semantic_weight for p in job_profiles)
+
+    done = 0
+    for start in range(0, len(resumes), chunk_size):
+        stop = min(start + chunk_size, len(resumes))
+        embed_texts = embeddings and vectors is None
+        if isinstance(resumes, CandidateStore):
+            features = resumes.features(start, stop, matcher)
+            if embed_texts:
+                features['embedding'] = embed(resumes.text(i) for i in range(start, stop))
+        else:
+            features = resume_features((r['content'] for r in resumes[start:stop]), matcher, embeddings=embed_texts)
+        if embeddings and vectors is not None:
+            features['embedding'] = vectors[start:stop]
+        scores = np.empty((stop - start, len(job_profiles)), dtype=np.int16)
+        for column, job_profile in enumerate(job_profiles):
+            scores[:, column] = score_features(features, job_profile)['score']
+        done += stop - start
+        yield done, scores
+
+
+def score_matrix(resumes, job_profiles, chunk_size=DEFAULT_CHUNK_SIZE):
+    """N×M overall scores of N resumes against M job profiles, each resume parsed once"""
+    chunks = [scores for _, scores in iter_score_matrix(resumes, job_profiles, chunk_size)]
+    if not chunks:
+        return np.zeros((0, len(job_profiles)), dtype=np.int16)
+    return np.concatenate(chunks)
+
+
+def best_fit(scores):
+    """(job column, score) of each resume's best-scoring job; ties go to the earlier job"""
+    jobs = np.argmax(scores, axis=1)
+    return jobs, scores[np.arange(len(scores)), jobs]
+
+
+def matrix_frame(scores, titles, names, emails):
+    """One row per resume with its best-fit job and a score column per job, best fits first"""
+    jobs, best = best_fit(scores)
+    frame = pd.DataFrame({
+        'Name': names,
+        'Email': emails,
+        'Best Fit': [titles[j] for j in jobs],
+        'Best Score': best,
+    })
+    for column, title in enumerate(titles):
+        frame[title] = scores[:, column]
+    return frame.sort_values('Best Score', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def top_candidates(scores, job, k):
+    """Rows of the k best resumes for one job column, best first; ties keep resume order"""
+    column = scores[:, job]
+    k = min(k, len(column))
+    if not k:
+        return np.zeros(0, dtype=np.int64)
+    top = np.argpartition(-column.astype(np.int64), k - 1)[:k]
+    # Candidates tied with the k-th score may have been cut arbitrarily; take the earliest
+    cutoff = column[top].min()
+    top = np.concatenate([np.flatnonzero(column > cutoff), np.flatnonzero(column == cutoff)])[:k]
+    return top[np.lexsort((top, -column[top].astype(np.int64)))]
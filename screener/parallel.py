@@ -0,0 +1,47 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .batch import analyze_resumes_batch
+
+DEFAULT_CHUNK_SIZE = 1000
+# Below this many resumes, process start-up costs more than it saves
+PARALLEL_MIN_RESUMES = 5000
+
+_worker_profile = None
+
+
+def _init_worker(job_profile):
+    global _worker_profile
+    _worker_profile = job_profile
+
+
+def _score_chunk(chunk, start):
+    return analyze_resumes_batch(chunk, _worker_profile, start=start)
+
+
+def iter_result_chunks(resumes, job_profile, parallel=False, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None):
+    """Score resumes chunk by chunk, yielding (resumes_done, results_frame) as each chunk finishes"""
+    chunks = [(resumes[i:i + chunk_size], i) for i in range(0, len(resumes), chunk_size)]
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+
+    if not parallel or workers < 2 or len(resumes) < PARALLEL_MIN_RESUMES:
+        done = 0
+        for chunk, start in chunks:
+            done += len(chunk)
+            yield done, analyze_resumes_batch(chunk, job_profile, start=start)
+        return
+
+    # The job profile is sent to each worker once through the initializer;
+    # "spawn" avoids forking the Streamlit server's threads
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(job_profile,)
+    ) as pool:
+        futures = {pool.submit(_score_chunk, chunk, start): len(chunk) for chunk, start in chunks}
+        done = 0
+        for future in as_completed(futures):
+            done += futures[future]
+            yield done, future.result()
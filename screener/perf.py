@@ -0,0 +1,151 @@
+import cProfile
+import io
+import json
+import pstats
+import sys
+import time
+import types
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+import pandas as pd
+
+# Timed events kept for export; older ones are dropped
+MAX_EVENTS = 10_000
+PROFILE_LINES = 40
+
+_DISABLED = nullcontext()
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None))
+_SKIPPED = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+
+class PerfRecorder:
+    """Per-stage timers and counters for the app's hot paths
+
+    While disabled, stage() hands back one shared no-op context and count()
+    returns at once, so instrumented code costs an attribute check. Enabled,
+    each timed stage updates running totals and appends an event for
+    JSON lines export.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.profile_next = False
+        self.profile_report = None
+        self.reset()
+
+    def reset(self):
+        self.stages = {}
+        self.counters = {}
+        self.events = deque(maxlen=MAX_EVENTS)
+
+    def stage(self, name, items=None):
+        """Context manager timing one run of a stage; items is how many things it processed"""
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name, items)
+
+    @contextmanager
+    def _timed(self, name, items):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, items)
+
+    def record(self, name, seconds, items=None):
+        """Add one timed run of a stage measured elsewhere"""
+        if not self.enabled:
+            return
+        totals = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'max': 0.0, 'last': 0.0, 'items': 0})
+        totals['calls'] += 1
+        totals['seconds'] += seconds
+        totals['max'] = max(totals['max'], seconds)
+        totals['last'] = seconds
+        totals['items'] += items or 0
+        self.events.append({'time': time.time(), 'stage': name, 'seconds': round(seconds, 6), 'items': items})
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self):
+        """One row per stage: calls, total, mean, max and last milliseconds, items per second"""
+        rows = [
+            {
+                'stage': name,
+                'calls': t['calls'],
+                'total_ms': round(t['seconds'] * 1000, 1),
+                'mean_ms': round(t['seconds'] * 1000 / t['calls'], 1),
+                'max_ms': round(t['max'] * 1000, 1),
+                'last_ms': round(t['last'] * 1000, 1),
+                'items_per_s': round(t['items'] / t['seconds']) if t['items'] and t['seconds'] else None,
+            }
+            for name, t in self.stages.items()
+        ]
+        columns = ['stage', 'calls', 'total_ms', 'mean_ms', 'max_ms', 'last_ms', 'items_per_s']
+        return pd.DataFrame(rows, columns=columns).sort_values('total_ms', ascending=False, ignore_index=True)
+
+    def to_jsonl(self, extra=None):
+        """Timed events, then one line of counters (and any extra fields), as UTF-8 JSON lines"""
+        lines = [json.dumps(event) for event in self.events]
+        lines.append(json.dumps({'time': time.time(), 'counters': self.counters, **(extra or {})}))
+        return ('\n'.join(lines) + '\n').encode('utf-8')
+
+    def profiling(self):
+        """Profile the enclosed block with cProfile if profile_next is set, once"""
+        if not self.profile_next:
+            return _DISABLED
+        self.profile_next = False
+        return self._profiled()
+
+    @contextmanager
+    def _profiled(self):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(PROFILE_LINES)
+            self.profile_report = out.getvalue()
+
+
+def estimate_size(obj, _seen=None):
+    """Approximate bytes held by obj and everything it references
+
+    Arrays and frames report their buffers; containers and objects are
+    walked through their items, __dict__ and __slots__, counting each
+    object once. Memory-mapped arrays count their full size.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen or isinstance(obj, _SKIPPED):
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) if obj.base is None else obj.nbytes
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, _ATOMIC):
+        return size
+    if isinstance(obj, dict):
+        children = [*obj.keys(), *obj.values()]
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        children = obj
+    else:
+        children = list(getattr(obj, '__dict__', {}).values())
+        for cls in type(obj).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if hasattr(obj, slot):
+                    children.append(getattr(obj, slot))
+    return size + sum(estimate_size(child, seen) for child in children)
+
+
+def session_sizes(state):
+    """Estimated bytes per session state key, largest first; objects shared between keys count once"""
+    seen = set()
+    sizes = {key: estimate_size(state[key], seen) for key in state.keys()}
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+
+from .skills import SkillMatcher, get_matcher
+from .vectors import EMBEDDING_VERSION, embed
+
+YEARS_PATTERN = re.compile(r'(\d+)\+?\s*years?', re.I)
+DEFAULT_MIN_YEARS = 3
+# Share of the overall score given to semantic similarity when it is enabled
+SEMANTIC_WEIGHT = 0.2
+# Cosine similarity to the job description that earns a full semantic score
+SEMANTIC_FULL_MATCH = 0.6
+
+
+@dataclass(frozen=True)
+class JobProfile:
+    """Job description compiled once and reused for every resume"""
+    skills: tuple
+    min_years: int
+    matcher: SkillMatcher = field(repr=False, compare=False)
+    semantic_weight: float = 0.0
+    embedding: np.ndarray = field(default=None, repr=False, compare=False)
+
+    @cached_property
+    def fingerprint(self):
+        """Stable hash of everything that affects scoring against this profile"""
+        semantic = [self.semantic_weight, EMBEDDING_VERSION, self.embedding.tolist()] if self.semantic_weight else None
+        payload = json.dumps([list(self.skills), self.min_years, self.matcher.fingerprint, semantic])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @cached_property
+    def skill_mask(self):
+        """Bitmask of the required skills"""
+        return self.matcher.mask(self.skills)
+
+    @cached_property
+    def skill_words(self):
+        """The required skills' bitmask as one row of uint64 words, for masking arrays"""
+        return self.matcher.pack([self.skill_mask])[0]
+
+    def split(self, mask):
+        """Split the required skills into (matched, missing) for a resume's skill bitmask"""
+        matched = mask & self.skill_mask
+        return self.matcher.expand(matched), self.matcher.expand(self.skill_mask & ~matched)
+
+    def match(self, text):
+        """Split the required skills into (matched, missing) for a resume text"""
+        return self.split(self.matcher.find_mask(text))
+
+    def semantic_scores(self, texts):
+        """0-100 similarity of each resume text to the job description, all zero when disabled"""
+        if not self.semantic_weight:
+            return np.zeros(len(texts))
+        return self.embedding_scores(embed(texts))
+
+    def embedding_scores(self, vectors):
+        """0-100 similarity of each resume embedding (a row of vectors) to the job description"""
+        similarity = vectors @ self.embedding
+        return np.minimum(similarity.astype(np.float64) / SEMANTIC_FULL_MATCH, 1) * 100
+
+
+def compile_job_profile(job_desc, taxonomy_path=None, semantic_weight=0.0):
+    """Build a JobProfile from a job description
+
+    A non-zero semantic_weight blends the resume's text similarity to the
+    job description into the overall score with that weight.
+    """
+    matcher = get_matcher(taxonomy_path)
+    years_match = YEARS_PATTERN.search(job_desc)
+    return JobProfile(
+        skills=tuple(matcher.find_ordered(job_desc)),
+        min_years=int(years_match.group(1)) if years_match else DEFAULT_MIN_YEARS,
+        matcher=matcher,
+        semantic_weight=semantic_weight,
+        embedding=embed([job_desc])[0] if semantic_weight else None
+    )
@@ -0,0 +1,268 @@
+import math
+from bisect import bisect_left, insort
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+from .batch import RESULT_COLUMNS, recommendations, score_classes
+from .skills import mask_words, pack_masks, unpack_masks
+from .stats import ScoreStats
+
+# Keys per bucket; a bucket is split in two once it holds twice this many
+DEFAULT_BUCKET_SIZE = 1000
+# Per-candidate columns kept in arrays, indexed by arrival number (skill_mask has a row
+# of words per candidate); names and emails are kept alongside, and skill lists and
+# labels are rebuilt on demand
+STORED_COLUMNS = {
+    'score': np.int16,
+    'skill_match': np.int16,
+    'experience_match': np.int16,
+    'education_match': np.int16,
+    'semantic_match': np.int16,
+    'skill_mask': np.uint64,
+    'has_leadership': np.bool_,
+    'open_source': np.bool_,
+}
+# Sort keys pack (-score, arrival) into one int: -score * ARRIVAL_SPAN + arrival
+ARRIVAL_SPAN = 1 << 40
+
+
+class SortedKeys:
+    """Sorted list kept in bounded buckets, so an insert or delete only shifts one bucket"""
+
+    def __init__(self, bucket_size=DEFAULT_BUCKET_SIZE):
+        self.bucket_size = bucket_size
+        self._buckets = []
+        # Largest key of each bucket, bisected to find the bucket for a key
+        self._maxes = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._buckets)
+
+    def add(self, key):
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+        else:
+            i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+            bucket = self._buckets[i]
+            insort(bucket, key)
+            self._maxes[i] = bucket[-1]
+            if len(bucket) > 2 * self.bucket_size:
+                half = self.bucket_size
+                self._buckets[i:i + 1] = [bucket[:half], bucket[half:]]
+                self._maxes[i:i + 1] = [bucket[half - 1], bucket[-1]]
+        self._len += 1
+
+    def remove(self, key):
+        i = bisect_left(self._maxes, key)
+        bucket = self._buckets[i] if i < len(self._buckets) else []
+        j = bisect_left(bucket, key)
+        if j == len(bucket) or bucket[j] != key:
+            raise KeyError(key)
+        del bucket[j]
+        if bucket:
+            self._maxes[i] = bucket[-1]
+        else:
+            del self._buckets[i]
+            del self._maxes[i]
+        self._len -= 1
+
+    def first(self):
+        return self._buckets[0][0]
+
+    def count_below(self, key):
+        """Number of keys strictly less than key"""
+        i = bisect_left(self._maxes, key)
+        inside = bisect_left(self._buckets[i], key) if i < len(self._buckets) else 0
+        return sum(len(b) for b in self._buckets[:i]) + inside
+
+    def slice(self, start, stop):
+        """Keys at positions start up to stop, skipping whole buckets before start"""
+        keys = []
+        offset = 0
+        for bucket in self._buckets:
+            end = offset + len(bucket)
+            if end > start:
+                keys.extend(bucket[max(start - offset, 0):stop - offset])
+                if end >= stop:
+                    break
+            offset = end
+        return keys
+
+
+class LiveRanking:
+    """Ranked results that take new and removed resumes without rescoring or re-sorting the rest
+
+    Candidates are keyed by a stable id (the app uses the content hash) and
+    ordered by score, highest first, then by arrival, which matches
+    rank_results. Count, top score and the pool aggregates in stats (sums,
+    score distribution, skill coverage) stay current on every change.
+    Scores, flags and skill bitmasks live in compact arrays, so each
+    candidate costs a few dozen bytes rather than a dict of Python objects;
+    matched and missing skill names are expanded against job_profile only
+    when a frame is built. Removed candidates keep their array slots until
+    clear().
+    """
+
+    def __init__(self, job_profile=None, bucket_size=DEFAULT_BUCKET_SIZE):
+        self.job_profile = job_profile
+        self._order = SortedKeys(bucket_size)
+        # key -> packed sort key; the arrival number in it indexes the columns
+        self._sort_keys = {}
+        # arrival -> key
+        self._keys = []
+        self._names = []
+        self._emails = []
+        self._columns = {name: np.zeros(0, dtype=dtype) for name, dtype in STORED_COLUMNS.items()}
+        words = job_profile.matcher.words if job_profile is not None else 1
+        self._columns['skill_mask'] = np.zeros((0, words), dtype=STORED_COLUMNS['skill_mask'])
+        self.stats = ScoreStats(words)
+        self._frame = None
+
+    def __len__(self):
+        return len(self._sort_keys)
+
+    def __contains__(self, key):
+        return key in self._sort_keys
+
+    def _reserve(self, rows, words):
+        capacity = len(self._columns['score'])
+        if rows <= capacity and words <= self._columns['skill_mask'].shape[1]:
+            return
+        if rows > capacity:
+            capacity = max(rows, 2 * capacity, 1024)
+        for name, column in self._columns.items():
+            if column.ndim == 2:
+                # Masks widen when a ranking without a job profile meets a wider one
+                grown = np.zeros((capacity, max(words, column.shape[1])), dtype=column.dtype)
+                grown[:len(column), :column.shape[1]] = column
+            else:
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:len(column)] = column
+            self._columns[name] = grown
+
+    def add(self, results, keys):
+        """Insert scored rows, where keys[row's resume_id] is that resume's key
+
+        A key that is already ranked is replaced, so a changed resume can be
+        re-added under its old key. The row's resume_id becomes its arrival
+        number, which stays the same while other candidates come and go.
+        """
+        results = results.sort_values('resume_id')
+        start = len(self._names)
+        stop = start + len(results)
+        if self.job_profile is not None:
+            words = self.job_profile.matcher.words
+        else:
+            words = mask_words(max((int(mask).bit_length() for mask in results['skill_mask']), default=0))
+        self._reserve(stop, words)
+        for name, dtype in STORED_COLUMNS.items():
+            if name == 'skill_mask':
+                column = self._columns[name]
+                column[start:stop] = pack_masks(results[name], column.shape[1])
+            else:
+                self._columns[name][start:stop] = results[name].to_numpy().astype(dtype)
+        self._names.extend(results['name'])
+        self._emails.extend(results['email'])
+        self._keys.extend(keys[resume_id] for resume_id in results['resume_id'].tolist())
+        self.stats.add({name: column[start:stop] for name, column in self._columns.items()})
+
+        for arrival, resume_id, score in zip(range(start, stop), results['resume_id'].tolist(),
+                                             results['score'].tolist()):
+            key = keys[resume_id]
+            if key in self._sort_keys:
+                self.remove(key)
+            sort_key = -score * ARRIVAL_SPAN + arrival
+            self._order.add(sort_key)
+            self._sort_keys[key] = sort_key
+        self._frame = None
+
+    def remove(self, key):
+        """Drop one candidate; unknown keys are ignored"""
+        sort_key = self._sort_keys.pop(key, None)
+        if sort_key is None:
+            return
+        self._order.remove(sort_key)
+        arrival = sort_key % ARRIVAL_SPAN
+        self.stats.remove({name: column[arrival] for name, column in self._columns.items()})
+        self._frame = None
+
+    def clear(self):
+        self.__init__(self.job_profile, self._order.bucket_size)
+
+    def key(self, arrival):
+        """The key of the candidate whose rows carry this resume_id"""
+        return self._keys[arrival]
+
+    @property
+    def top_score(self):
+        return -(self._order.first() // ARRIVAL_SPAN) if self._sort_keys else None
+
+    @property
+    def mean_score(self):
+        return self.stats.mean('score')
+
+    def count_at_least(self, min_score):
+        """Number of candidates scoring min_score or more"""
+        return self._order.count_below((1 - math.ceil(min_score)) * ARRIVAL_SPAN)
+
+    def skill_words(self, resume_ids):
+        """Packed (N, words) skill masks of the rows with these resume_ids, e.g. a results frame's column"""
+        return self._columns['skill_mask'][np.asarray(resume_ids, dtype=np.int64)]
+
+    def _results_frame(self, sort_keys):
+        arrivals = np.array(sort_keys, dtype=np.int64) % ARRIVAL_SPAN
+        columns = {name: column[arrivals] for name, column in self._columns.items()}
+        masks = columns.pop('skill_mask')
+        frame = pd.DataFrame({
+            'resume_id': arrivals,
+            'name': [self._names[a] for a in arrivals],
+            'email': [self._emails[a] for a in arrivals],
+            # Scores are widened back to the int64 the scorers produce
+            **{
+                name: values.astype(np.int64) if values.dtype == np.int16 else values
+                for name, values in columns.items()
+            },
+            'skill_mask': unpack_masks(masks),
+        })
+        if self.job_profile is not None:
+            required = self.job_profile.skill_words
+            matched = masks & required
+            frame['matched_skills'] = self.job_profile.matcher.expand_many(matched)
+            frame['missing_skills'] = self.job_profile.matcher.expand_many(required & ~matched)
+        else:
+            frame['matched_skills'] = frame['missing_skills'] = [[] for _ in arrivals]
+        frame['recommendation'] = recommendations(frame['score'])
+        frame['score_class'] = score_classes(frame['score'])
+        return frame[RESULT_COLUMNS]
+
+    def slice(self, start, stop):
+        """Ranked rows start up to stop as a results frame"""
+        return self._results_frame(self._order.slice(start, stop))
+
+    def top(self, k):
+        """The k best candidates as a results frame"""
+        return self.slice(0, k)
+
+    def iter_chunks(self, chunk_rows):
+        """Ranked rows as consecutive results frames of at most chunk_rows, for streaming exports"""
+        keys = []
+        for sort_key in self._order:
+            keys.append(sort_key)
+            if len(keys) == chunk_rows:
+                yield self._results_frame(keys)
+                keys = []
+        if keys:
+            yield self._results_frame(keys)
+
+    def frame(self):
+        """Every ranked row as a results frame, rebuilt only after a change"""
+        if self._frame is None:
+            self._frame = self._results_frame(list(self._order))
+        return self._frame
@@ -0,0 +1,124 @@
+import re
+import zipfile
+from collections import OrderedDict
+from datetime import datetime
+
+from .batch import SCORING_VERSION, generate_insights
+
+DEFAULT_MAX_REPORTS = 1000
+
+# Compiled once; filled per candidate with str.format
+REPORT_TEMPLATE = """CANDIDATE ANALYSIS REPORT
+==================================================
+
+Name: {name}
+Email: {email}
+Position: {position}
+
+OVERALL SCORE: {score}%
+Recommendation: {recommendation}
+
+DETAILED SCORES:
+- Skills Match: {skill_match}%
+- Experience Match: {experience_match}%
+- Education Match: {education_match}%
+
+MATCHED SKILLS:
+{matched}
+
+MISSING SKILLS:
+{missing}
+
+AI INSIGHTS:
+{insights}
+
+---
+Generated by AI Resume Screener
+Date: {date}
+"""
+
+_UNSAFE_FILE_CHARS = re.compile(r'[^\w.-]+')
+
+
+def render_report(result, position, now=None):
+    """Fill the report template for one result row"""
+    return REPORT_TEMPLATE.format(
+        name=result['name'],
+        email=result['email'],
+        position=position,
+        score=result['score'],
+        recommendation=result['recommendation'],
+        skill_match=result['skill_match'],
+        experience_match=result['experience_match'],
+        education_match=result['education_match'],
+        matched='\n'.join('✓ ' + s for s in result['matched_skills']),
+        missing='\n'.join('✗ ' + s for s in result['missing_skills']),
+        insights='\n'.join(generate_insights(result)),
+        date=(now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+    )
+
+
+def report_file_name(result):
+    return f"{result['name'].replace(' ', '_')}_analysis.txt"
+
+
+class ReportCache:
+    """Rendered reports keyed by scoring version, job profile, candidate and position
+
+    Candidates are identified by a stable key such as their content hash,
+    not by resume_id, which only numbers rows within one ranking. Reports
+    are rendered on first request only; the least recently used are
+    dropped beyond max_entries.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_REPORTS):
+        self.max_entries = max_entries
+        self._reports = OrderedDict()
+
+    def __len__(self):
+        return len(self._reports)
+
+    @staticmethod
+    def _key(candidate, job_profile, position):
+        return SCORING_VERSION, job_profile.fingerprint, candidate, position
+
+    def get(self, candidate, job_profile, position):
+        """The cached report for a candidate, or None if it has not been rendered"""
+        key = self._key(candidate, job_profile, position)
+        if key in self._reports:
+            self._reports.move_to_end(key)
+        return self._reports.get(key)
+
+    def render(self, result, candidate, job_profile, position):
+        """The report for candidate's result row, rendering and caching it if needed"""
+        report = self.get(candidate, job_profile, position)
+        if report is None:
+            report = render_report(result, position)
+            self._reports[self._key(candidate, job_profile, position)] = report
+            while len(self._reports) > self.max_entries:
+                self._reports.popitem(last=False)
+        return report
+
+    def clear(self):
+        self._reports.clear()
+
+
+def write_report_archive(chunks, out, position, min_score=0):
+    """Write a ZIP with one report per candidate scoring at least min_score, a chunk at a time
+
+    chunks is an iterable of results frames in rank order; reading stops at
+    the first candidate below min_score. Each report is rendered, compressed
+    and dropped before the next. Returns the number of reports written.
+    """
+    written = 0
+    now = datetime.now()
+    with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for chunk in chunks:
+            for result in chunk[chunk['score'] >= min_score].to_dict('records'):
+                written += 1
+                # Rank prefix keeps names unique and the archive in shortlist order
+                name = _UNSAFE_FILE_CHARS.sub('_', report_file_name(result))
+                zf.writestr(f"{written:05d}_{name}", render_report(result, position, now))
+            if len(chunk) and chunk['score'].iloc[-1] < min_score:
+                break
+    return written
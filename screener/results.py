@@ -0,0 +1,35 @@
+import math
+
+from .skills import get_matcher
+
+
+def filter_results(results, min_score=0, recommendations=None, required_skills=None, matcher=None,
+                   skill_words=None):
+    """Return the ranked rows matching a score floor, recommendation labels and required skills
+
+    skill_words, if given, holds the rows' skill masks already packed as an
+    (N, words) uint64 array (see LiveRanking.skill_words); otherwise they are
+    packed from the skill_mask column.
+    """
+    mask = results['score'] >= min_score
+    if recommendations:
+        mask &= results['recommendation'].isin(recommendations)
+    if required_skills:
+        matcher = matcher or get_matcher()
+        if skill_words is None:
+            skill_words = matcher.pack(results['skill_mask'])
+        # "Has all of these" is a bitwise AND and compare over every row's mask words at once
+        required = matcher.pack([matcher.mask(required_skills)])
+        mask &= ((skill_words & required) == required).all(axis=1)
+    return results[mask]
+
+
+def page_count(n_rows, page_size):
+    """Number of pages needed to show n_rows, never less than one"""
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def get_page(results, page, page_size):
+    """Slice out one 1-based page of a results frame"""
+    start = (page - 1) * page_size
+    return results.iloc[start:start + page_size]
@@ -0,0 +1,40 @@
+SAMPLE_RESUMES = [
+    {
+        "name": "Alex Johnson",
+        "email": "alex.johnson@email.com",
+        "content": """Full Stack Developer with 6 years of experience. Expert in React, Node.js, and Python. 
+        Strong background in AWS cloud services. Built multiple SaaS applications from scratch. 
+        Proficient in PostgreSQL, MongoDB, Docker. BS in Computer Science from MIT. 
+        Led team of 4 developers. Implemented CI/CD pipelines using Jenkins."""
+    },
+    {
+        "name": "Sarah Chen",
+        "email": "sarah.chen@email.com",
+        "content": """Software Engineer with 3 years experience. Skilled in JavaScript, React, and Node.js.
+        Some experience with Python. Working knowledge of AWS. Completed several web projects.
+        Bachelor's in Software Engineering. Good team player and fast learner."""
+    },
+    {
+        "name": "Michael Rodriguez",
+        "email": "m.rodriguez@email.com",
+        "content": """Senior Developer with 8 years experience. Deep expertise in JavaScript, TypeScript, React, Node.js.
+        Python and FastAPI for microservices. PostgreSQL and Redis expert. 
+        AWS and GCP certified. Kubernetes and Docker in production. Led multiple teams.
+        MS in Computer Science. Open source contributor."""
+    },
+    {
+        "name": "Emily Watson",
+        "email": "emily.w@email.com",
+        "content": """Front-end Developer with 4 years experience. Strong React and JavaScript skills.
+        Basic Node.js knowledge. Worked with REST APIs. Some MongoDB experience.
+        Good at UI/UX design. Bachelor's in Design. Team collaboration skills."""
+    },
+    {
+        "name": "David Kim",
+        "email": "d.kim@email.com",
+        "content": """Full Stack Engineer with 7 years experience. JavaScript, TypeScript, React expert.
+        Node.js and Python backend development. FastAPI and Express. PostgreSQL and MongoDB.
+        AWS infrastructure and Lambda. Docker containers. CI/CD with GitHub Actions.
+        Bachelor's CS. Mentored junior developers."""
+    }
+]
@@ -0,0 +1,124 @@
+import pandas as pd
+
+from .profile import YEARS_PATTERN, compile_job_profile
+
+
+def extract_requirements(job_desc):
+    """Extract skills and requirements from job description"""
+    profile = compile_job_profile(job_desc)
+    return {'skills': list(profile.skills), 'min_years': profile.min_years}
+
+
+def analyze_resume(resume, job_profile):
+    """Analyze a single resume against a compiled job profile (or raw job description)"""
+    if isinstance(job_profile, str):
+        job_profile = compile_job_profile(job_profile)
+    resume_lower = resume['content'].lower()
+
+    # Skill matching
+    skill_mask = job_profile.matcher.find_mask(resume['content'])
+    matched_skills, missing_skills = job_profile.split(skill_mask)
+    skill_score = (len(matched_skills) / len(job_profile.skills) * 100) if job_profile.skills else 0
+
+    # Experience matching
+    exp_match = YEARS_PATTERN.search(resume['content'])
+    if exp_match:
+        years = int(exp_match.group(1))
+        # A job asking for "0+ years" is met by any stated experience
+        exp_score = min((years / job_profile.min_years) * 100, 100) if job_profile.min_years else 100
+    else:
+        exp_score = 30
+
+    # Education matching
+    if 'master' in resume_lower or 'ms' in resume_lower:
+        edu_score = 100
+    elif 'bachelor' in resume_lower or 'bs' in resume_lower:
+        edu_score = 80
+    else:
+        edu_score = 50
+
+    # Leadership
+    has_leadership = any(word in resume_lower for word in ['lead', 'led', 'mentor'])
+    leadership_bonus = 10 if has_leadership else 0
+
+    # Semantic similarity to the job description, when enabled
+    semantic_score = float(job_profile.semantic_scores([resume['content']])[0])
+
+    # Overall score
+    base_score = (
+        (skill_score * 0.5) + 
+        (exp_score * 0.3) + 
+        (edu_score * 0.15) + 
+        (leadership_bonus * 0.05)
+    )
+    weight = job_profile.semantic_weight
+    overall_score = int(base_score * (1 - weight) + semantic_score * weight)
+
+    # Generate insights
+    insights = []
+    if overall_score >= 80:
+        insights.append("⭐ Excellent match for the position")
+        insights.append("🎯 Strong technical skills aligned with requirements")
+    elif overall_score >= 65:
+        insights.append("✅ Good candidate with relevant experience")
+        insights.append("📈 Meets most core requirements")
+    else:
+        insights.append("⚠️ Limited alignment with job requirements")
+        insights.append("📚 May need additional training or experience")
+
+    if has_leadership:
+        insights.append("👥 Demonstrated leadership and mentoring experience")
+
+    if 'open source' in resume_lower:
+        insights.append("💻 Active open source contributor")
+
+    # Recommendation
+    if overall_score >= 80:
+        recommendation = "Strong Hire - Schedule Interview"
+    elif overall_score >= 70:
+        recommendation = "Recommended for Interview"
+    elif overall_score >= 60:
+        recommendation = "Consider for Phone Screen"
+    else:
+        recommendation = "Not Recommended"
+
+    return {
+        **resume,
+        'score': overall_score,
+        'skill_match': int(skill_score),
+        'experience_match': int(exp_score),
+        'education_match': int(edu_score),
+        'semantic_match': int(semantic_score),
+        'matched_skills': matched_skills,
+        'missing_skills': missing_skills,
+        'skill_mask': skill_mask,
+        'insights': insights,
+        'recommendation': recommendation
+    }
+
+
+def get_score_class(score):
+    """Get CSS class for score"""
+    if score >= 80:
+        return 'score-excellent'
+    elif score >= 70:
+        return 'score-good'
+    elif score >= 60:
+        return 'score-fair'
+    else:
+        return 'score-poor'
+
+
+def export_to_csv(results):
+    """Export results to CSV"""
+    return pd.DataFrame({
+        'Name': results['name'],
+        'Email': results['email'],
+        'Overall Score': results['score'],
+        'Skills Match': results['skill_match'],
+        'Experience Match': results['experience_match'],
+        'Education Match': results['education_match'],
+        'Recommendation': results['recommendation'],
+        'Matched Skills': results['matched_skills'].str.join(', '),
+        'Missing Skills': results['missing_skills'].str.join(', ')
+    })
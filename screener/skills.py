@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), 'taxonomy.json')
+# Skill sets are bitmasks, one bit per taxonomy skill. Arrays hold each mask as a row of
+# uint64 words, least significant first, as many as the taxonomy needs
+WORD_BITS = 64
+
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def mask_words(n_skills):
+    """uint64 words per mask for a taxonomy of n_skills"""
+    return max(1, -(-n_skills // WORD_BITS))
+
+
+def pack_masks(masks, words):
+    """(N, words) uint64 array from N int bitmasks"""
+    masks = list(masks)
+    if words == 1:
+        return np.fromiter(masks, dtype=np.uint64, count=len(masks)).reshape(-1, 1)
+    data = b''.join(int(mask).to_bytes(words * 8, 'little') for mask in masks)
+    return np.frombuffer(data, dtype='<u8').reshape(-1, words).astype(np.uint64)
+
+
+def unpack_masks(words):
+    """Object array of int bitmasks from an (N, W) uint64 array, as results frames hold them"""
+    words = np.asarray(words, dtype=np.uint64)
+    if words.shape[1] == 1:
+        masks = words[:, 0].tolist()
+    else:
+        data = words.astype('<u8').tobytes()
+        size = words.shape[1] * 8
+        masks = [int.from_bytes(data[i:i + size], 'little') for i in range(0, len(data), size)]
+    unpacked = np.empty(len(masks), dtype=object)
+    unpacked[:] = masks
+    return unpacked
+
+
+def popcount(masks):
+    """Number of set bits in each element of an array of uint64 words"""
+    masks = np.asarray(masks, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(masks).astype(np.int64)
+    # NumPy < 2.0: count bits a byte at a time with a lookup table
+    as_bytes = masks.reshape(-1, 1).view(np.uint8)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=1).reshape(masks.shape)
+
+
+class SkillMatcher:
+    """Find every taxonomy skill in a text with a single regex pass"""
+
+    def __init__(self, taxonomy):
+        # taxonomy: {canonical skill: [aliases]}, in display order
+        self.skills = tuple(taxonomy)
+        self.words = mask_words(len(self.skills))
+        self.bits = {skill: 1 << i for i, skill in enumerate(self.skills)}
+        # skill -> (word, bit within the word), for testing mask arrays
+        self.word_bits = {
+            skill: (i // WORD_BITS, np.uint64(1 << (i % WORD_BITS))) for i, skill in enumerate(self.skills)
+        }
+        self._canonical = {}
+        for skill, aliases in taxonomy.items():
+            for term in (skill, *aliases):
+                self._canonical.setdefault(term.lower(), skill)
+        self._term_bits = {term: self.bits[skill] for term, skill in self._canonical.items()}
+
+        # All terms folded into one prefix trie, so the regex engine walks the
+        # text once instead of retrying every term at every position
+        first_chars = ''.join(sorted({t[0] for t in self._canonical}))
+        self.pattern = re.compile(
+            r'(?<!\w)(?=[' + re.escape(first_chars) + r'])'
+            + _trie_pattern(self._canonical) + r'(?!\w)'
+        )
+        self.fingerprint = hashlib.sha256(
+            json.dumps(sorted(self._canonical.items())).encode('utf-8')
+        ).hexdigest()
+
+    def canonical(self, term):
+        """Map a matched term or alias to its canonical skill name"""
+        return self._canonical[term.lower()]
+
+    def find(self, text):
+        """Return the set of canonical skills mentioned in text"""
+        canonical = self._canonical
+        return {canonical[term] for term in self.pattern.findall(text.lower())}
+
+    def find_ordered(self, text):
+        """Return the skills mentioned in text, in taxonomy order"""
+        found = self.find(text)
+        return [s for s in self.skills if s in found]
+
+    def find_mask(self, text):
+        """Bitmask of the skills mentioned in text"""
+        mask = 0
+        for term in self.pattern.findall(text.lower()):
+            mask |= self._term_bits[term]
+        return mask
+
+    def mask(self, skills):
+        """Bitmask of canonical skill names"""
+        mask = 0
+        for skill in skills:
+            mask |= self.bits[skill]
+        return mask
+
+    def pack(self, masks):
+        """(N, words) uint64 array from int bitmasks over this taxonomy"""
+        return pack_masks(masks, self.words)
+
+    def expand(self, mask):
+        """Skill names set in a bitmask, in taxonomy order"""
+        mask = int(mask)
+        return [s for s in self.skills if mask & self.bits[s]]
+
+    def expand_many(self, masks):
+        """Skill name lists for an (N, words) array of masks; rows with the same mask share one list"""
+        lists = {}
+        expanded = []
+        for mask in unpack_masks(masks):
+            if mask not in lists:
+                lists[mask] = self.expand(mask)
+            expanded.append(lists[mask])
+        return expanded
+
+
+def _trie_pattern(terms):
+    """Build a regex alternation from a prefix trie of lowercase terms"""
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[None] = True
+
+    def build(node):
+        alts = [re.escape(ch) + build(child) for ch, child in node.items() if ch is not None]
+        if not alts:
+            return ''
+        if None in node:
+            # A term ends here; the greedy "?" still prefers the longer term
+            return '(?:' + '|'.join(alts) + ')?'
+        return alts[0] if len(alts) == 1 else '(?:' + '|'.join(alts) + ')'
+
+    return build(trie)
+
+
+def load_taxonomy(path=None):
+    """Load a {skill: [aliases]} taxonomy from a JSON file"""
+    with open(path or DEFAULT_TAXONOMY_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    return {skill: list(aliases or []) for skill, aliases in data.items()}
+
+
+@lru_cache(maxsize=8)
+def get_matcher(path=None):
+    """Return the compiled matcher for a taxonomy file, built once per process"""
+    return SkillMatcher(load_taxonomy(path))
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from .batch import recommendations
+from .skills import WORD_BITS
+
+# Overall scores are whole numbers in 0..MAX_SCORE
+MAX_SCORE = 100
+# Component scores kept as running sums, for their pool averages
+SUMMED_COLUMNS = ('score', 'skill_match', 'experience_match', 'education_match', 'semantic_match')
+# Recommendation labels, best first
+RECOMMENDATIONS = (
+    "Strong Hire - Schedule Interview", "Recommended for Interview", "Consider for Phone Screen", "Not Recommended"
+)
+
+_SCORE_LABELS = recommendations(np.arange(MAX_SCORE + 1))
+
+
+class ScoreStats:
+    """Pool-wide aggregates of scored candidates, updated as candidates are added and removed
+
+    Keeps running sums of each score column, a count per overall score and
+    a count per skill bit. Scores are whole numbers from 0 to 100, so the
+    per-score counts are both the histogram and an exact quantile sketch:
+    percentiles, score bands and recommendation breakdowns are read off
+    101 counters, whatever the pool size.
+    """
+
+    def __init__(self, words=1):
+        self.count = 0
+        self.sums = dict.fromkeys(SUMMED_COLUMNS, 0)
+        self.leaders = 0
+        self.open_source = 0
+        self.score_counts = np.zeros(MAX_SCORE + 1, dtype=np.int64)
+        self.skill_counts = np.zeros(words * WORD_BITS, dtype=np.int64)
+
+    def __len__(self):
+        return self.count
+
+    def copy(self):
+        """An independent snapshot, to read while the pool keeps changing"""
+        snapshot = ScoreStats.__new__(ScoreStats)
+        snapshot.__dict__.update(self.__dict__)
+        snapshot.sums = dict(self.sums)
+        snapshot.score_counts = self.score_counts.copy()
+        snapshot.skill_counts = self.skill_counts.copy()
+        return snapshot
+
+    def add(self, columns):
+        """Count candidates given as arrays by column: the SUMMED_COLUMNS, has_leadership, open_source and skill_mask"""
+        scores = np.clip(np.asarray(columns['score'], dtype=np.int64), 0, MAX_SCORE)
+        self.count += len(scores)
+        for name in SUMMED_COLUMNS:
+            self.sums[name] += int(np.asarray(columns[name], dtype=np.int64).sum())
+        self.leaders += int(np.count_nonzero(columns['has_leadership']))
+        self.open_source += int(np.count_nonzero(columns['open_source']))
+        self.score_counts += np.bincount(scores, minlength=MAX_SCORE + 1)
+        # One row of bits per mask, least significant first
+        masks = np.asarray(columns['skill_mask'], dtype='<u8')
+        counts = np.unpackbits(masks.view(np.uint8).reshape(len(masks), masks.shape[1] * 8), axis=1, bitorder='little').sum(
+            axis=0, dtype=np.int64
+        )
+        if len(counts) > len(self.skill_counts):
+            counts[:len(self.skill_counts)] += self.skill_counts
+            self.skill_counts = counts
+        else:
+            self.skill_counts[:len(counts)] += counts
+
+    def remove(self, row):
+        """Uncount one candidate, given as a mapping of the same columns to its values"""
+        self.count -= 1
+        for name in SUMMED_COLUMNS:
+            self.sums[name] -= int(row[name])
+        self.leaders -= bool(row['has_leadership'])
+        self.open_source -= bool(row['open_source'])
+        self.score_counts[min(max(int(row['score']), 0), MAX_SCORE)] -= 1
+        mask = int.from_bytes(np.asarray(row['skill_mask'], dtype='<u8').tobytes(), 'little')
+        while mask:
+            bit = mask & -mask
+            self.skill_counts[bit.bit_length() - 1] -= 1
+            mask ^= bit
+
+    def mean(self, name='score'):
+        """Pool average of a score column, or None for an empty pool"""
+        return self.sums[name] / self.count if self.count else None
+
+    def quantile(self, q):
+        """Nearest-rank q-quantile of the scores (0.5 for the median), or None for an empty pool"""
+        if not self.count:
+            return None
+        rank = max(1, int(np.ceil(q * self.count)))
+        return int(np.searchsorted(np.cumsum(self.score_counts), rank))
+
+    def histogram(self, bin_width=10):
+        """Candidates per score band of bin_width points, the last band taking in MAX_SCORE, as a Series"""
+        starts = list(range(0, MAX_SCORE, bin_width))
+        counts = np.add.reduceat(self.score_counts, starts)
+        labels = [f"{start}-{start + bin_width - 1}" for start in starts[:-1]] + [f"{starts[-1]}-{MAX_SCORE}"]
+        return pd.Series(counts, index=pd.Index(labels, name='score'), name='candidates')
+
+    def recommendation_counts(self):
+        """Candidates per recommendation, best first"""
+        return {label: int(self.score_counts[_SCORE_LABELS == label].sum()) for label in RECOMMENDATIONS}
+
+    def skill_coverage(self, matcher, skills=None):
+        """Candidates having each skill (all of matcher's by default), most common first
+
+        A frame with skill, candidates and coverage (percent of the pool).
+        """
+        skills = matcher.skills if skills is None else skills
+        counts = [int(self.skill_counts[matcher.bits[skill].bit_length() - 1]) for skill in skills]
+        frame = pd.DataFrame({'skill': list(skills), 'candidates': counts})
+        frame['coverage'] = frame['candidates'] / self.count * 100 if self.count else 0.0
+        return frame.sort_values('candidates', ascending=False, kind='stable', ignore_index=True)
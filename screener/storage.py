@@ -0,0 +1,311 @@
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from .batch import FEATURE_COLUMNS
+from .cache import CACHE_DIR
+from .store import _ZDICT
+
+DEFAULT_DB_PATH = os.environ.get('SCREENER_DB_PATH', os.path.join(CACHE_DIR, 'screener.sqlite3'))
+# Rows per executemany call when saving or loading in bulk
+BATCH_ROWS = 10_000
+# Stored texts are zlib streams against the store's preset dictionary; a changed dictionary can't read them
+TEXT_FORMAT = hashlib.sha256(_ZDICT).hexdigest()[:16]
+
+# Score columns saved per (requisition, candidate)
+RESULT_SCORES = ['score', 'skill_match', 'experience_match', 'education_match', 'semantic_match']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    text BLOB NOT NULL,
+    taxonomy TEXT NOT NULL,
+    skill_mask BLOB NOT NULL,
+    years REAL,
+    education INTEGER NOT NULL,
+    has_leadership INTEGER NOT NULL,
+    open_source INTEGER NOT NULL,
+    embedding_index BLOB,
+    embedding_value BLOB
+);
+CREATE INDEX IF NOT EXISTS candidates_email ON candidates (email);
+CREATE TABLE IF NOT EXISTS requisitions (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    job_description TEXT NOT NULL,
+    semantic_weight REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    requisition INTEGER NOT NULL REFERENCES requisitions (id) ON DELETE CASCADE,
+    candidate INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    score INTEGER NOT NULL,
+    skill_match INTEGER NOT NULL,
+    experience_match INTEGER NOT NULL,
+    education_match INTEGER NOT NULL,
+    semantic_match INTEGER NOT NULL,
+    PRIMARY KEY (requisition, candidate)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_candidate ON results (candidate);
+"""
+
+
+class StorageError(Exception):
+    """Saved data could not be read back or written"""
+
+
+def _load_masks(values):
+    """(N, W) uint64 skill masks from stored little-endian word blobs"""
+    # Files saved before masks had several words hold each one as a signed 64-bit integer
+    blobs = [v if isinstance(v, bytes) else int(v).to_bytes(8, 'little', signed=True) for v in values]
+    size = max(map(len, blobs), default=8)
+    data = b''.join(blob.ljust(size, b'\0') for blob in blobs)
+    return np.frombuffer(data, dtype='<u8').reshape(-1, size // 8).astype(np.uint64)
+
+
+class Storage(ABC):
+    """Persistence for the candidate pool and its scores; backends implement each abstract method
+
+    Candidates are exchanged as CandidateStore.columns() dicts (plus an
+    optional 'embedding' matrix of VectorStore rows) and keyed by content
+    hash. Requisitions are keyed by their job profile's fingerprint, and
+    results by requisition fingerprint and candidate hash.
+    """
+
+    @abstractmethod
+    def save_candidates(self, columns):
+        """Insert or update candidates in one transaction"""
+
+    @abstractmethod
+    def delete_candidates(self, hashes):
+        """Delete candidates by content hash, with their results"""
+
+    @abstractmethod
+    def load_candidates(self, dim=None):
+        """Every saved candidate, in the order first saved, as columns
+
+        'embedding' is included as a (N, dim) matrix when dim is given and
+        every candidate was saved with one.
+        """
+
+    @abstractmethod
+    def count_candidates(self):
+        """How many candidates are saved"""
+
+    @abstractmethod
+    def save_requisition(self, requisition):
+        """Insert or update a requisition dict: fingerprint, title, job_description, semantic_weight"""
+
+    @abstractmethod
+    def requisitions(self):
+        """Saved requisitions, most recently updated first"""
+
+    @abstractmethod
+    def save_results(self, fingerprint, hashes, results):
+        """Insert or update the RESULT_SCORES of a results frame against a saved requisition, row i belonging to hashes[i]"""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every candidate, requisition and result"""
+
+    def close(self):
+        pass
+
+
+class SQLiteStorage(Storage):
+    """Storage in one SQLite file in WAL mode, so readers never wait on the writer
+
+    Each thread gets its own connection. Texts are stored as the store's
+    compressed bytes and features as columns, so a saved pool reloads
+    without reparsing; embeddings are stored sparsely (bucket indices and
+    values).
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('text_format', ?)", (TEXT_FORMAT,))
+        stored_format = conn.execute("SELECT value FROM meta WHERE key = 'text_format'").fetchone()[0]
+        if stored_format != TEXT_FORMAT:
+            raise StorageError(f"{path} holds texts compressed with a different dictionary")
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            # WAL makes NORMAL durable against application crashes, and much faster than FULL
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            self._local.conn = conn
+        return conn
+
+    def save_candidates(self, columns):
+        embeddings = columns.get('embedding')
+        rows = []
+        for i, (content_hash, name, email, text) in enumerate(
+                zip(columns['hash'], columns['name'], columns['email'], columns['text'])):
+            if embeddings is not None:
+                buckets = np.flatnonzero(embeddings[i])
+                sparse = (buckets.astype(np.uint16).tobytes(), embeddings[i][buckets].astype(np.float32).tobytes())
+            else:
+                sparse = (None, None)
+            years = columns['years'][i]
+            rows.append((
+                content_hash, name, email, text, columns['taxonomy'],
+                columns['skill_mask'][i].astype('<u8').tobytes(),
+                None if np.isnan(years) else float(years),
+                int(columns['education'][i]), int(columns['has_leadership'][i]), int(columns['open_source'][i]),
+                *sparse,
+            ))
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                'INSERT INTO candidates (hash, name, email, text, taxonomy, skill_mask, years, education, '
+                'has_leadership, open_source, embedding_index, embedding_value) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (hash) DO UPDATE SET name = excluded.name, email = excluded.email, '
+                'text = excluded.text, taxonomy = excluded.taxonomy, skill_mask = excluded.skill_mask, '
+                'years = excluded.years, education = excluded.education, '
+                'has_leadership = excluded.has_leadership, open_source = excluded.open_source, '
+                'embedding_index = excluded.embedding_index, embedding_value = excluded.embedding_value',
+                rows
+            )
+
+    def delete_candidates(self, hashes):
+        conn = self._connect()
+        with conn:
+            # Their results go too, by cascade
+            conn.executemany('DELETE FROM candidates WHERE hash = ?', ((h,) for h in hashes))
+
+    def load_candidates(self, dim=None):
+        """Every saved candidate as columns; 'embedding' is a dense matrix when every row has one"""
+        rows = self._connect().execute(
+            'SELECT hash, name, email, text, taxonomy, skill_mask, years, education, has_leadership, open_source, '
+            'embedding_index, embedding_value FROM candidates ORDER BY id'
+        ).fetchall()
+        (hashes, names, emails, texts, taxonomies, masks, years, education, leadership, open_source,
+         embedding_index, embedding_value) = zip(*rows) if rows else ([],) * 12
+        columns = {
+            'name': list(names),
+            'email': list(emails),
+            'hash': list(hashes),
+            'text': list(texts),
+            # Mixed taxonomies are reparsed on load, as if none matched
+            'taxonomy': taxonomies[0] if len(set(taxonomies)) == 1 else None,
+            'skill_mask': _load_masks(masks),
+            'years': np.array([np.nan if y is None else y for y in years], dtype=FEATURE_COLUMNS['years']),
+            'education': np.array(education, dtype=FEATURE_COLUMNS['education']),
+            'has_leadership': np.array(leadership, dtype=FEATURE_COLUMNS['has_leadership']),
+            'open_source': np.array(open_source, dtype=FEATURE_COLUMNS['open_source']),
+        }
+        if dim and rows and all(i is not None for i in embedding_index):
+            lengths = [len(i) // 2 for i in embedding_index]
+            matrix = np.zeros((len(rows), dim), dtype=np.float32)
+            matrix[
+                np.repeat(np.arange(len(rows)), lengths),
+                np.frombuffer(b''.join(embedding_index), dtype=np.uint16)
+            ] = np.frombuffer(b''.join(embedding_value), dtype=np.float32)
+            columns['embedding'] = matrix
+        return columns
+
+    def count_candidates(self):
+        return self._connect().execute('SELECT COUNT(*) FROM candidates').fetchone()[0]
+
+    def save_requisition(self, requisition):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                'INSERT INTO requisitions (fingerprint, title, job_description, semantic_weight, updated_at) '
+                'VALUES (?, ?, ?, ?, ?) ON CONFLICT (fingerprint) DO UPDATE SET title = excluded.title, '
+                'job_description = excluded.job_description, updated_at = excluded.updated_at',
+                (requisition['fingerprint'], requisition['title'], requisition['job_description'],
+                 requisition['semantic_weight'], time.time())
+            )
+
+    def requisitions(self):
+        rows = self._connect().execute(
+            'SELECT fingerprint, title, job_description, semantic_weight FROM requisitions ORDER BY updated_at DESC'
+        )
+        return [dict(zip(('fingerprint', 'title', 'job_description', 'semantic_weight'), row)) for row in rows]
+
+    def save_results(self, fingerprint, hashes, results):
+        scores = zip(*(results[c].tolist() for c in RESULT_SCORES))
+        conn = self._connect()
+        with conn:
+            row = conn.execute('SELECT id FROM requisitions WHERE fingerprint = ?', (fingerprint,)).fetchone()
+            if row is None:
+                raise StorageError(f"requisition {fingerprint} has not been saved")
+            # Candidates not (yet) saved are skipped by the join
+            conn.executemany(
+                f"INSERT OR REPLACE INTO results (requisition, candidate, {', '.join(RESULT_SCORES)}) "
+                f"SELECT ?, id, {', '.join('?' * len(RESULT_SCORES))} FROM candidates WHERE hash = ?",
+                ((row[0], *scores_row, h) for h, scores_row in zip(hashes, scores))
+            )
+
+    def clear(self):
+        conn = self._connect()
+        with conn:
+            conn.execute('DELETE FROM results')
+            conn.execute('DELETE FROM requisitions')
+            conn.execute('DELETE FROM candidates')
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class WriteBehind:
+    """Queue of Storage writes applied in order by one background thread, so callers never wait on disk
+
+    submit returns at once; reads go straight to the storage after flush()
+    when they must see every queued write. Failed writes are kept in
+    errors rather than raised in the caller.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.errors = []
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='storage-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self):
+        return self._queue.unfinished_tasks
+
+    def submit(self, method, *args):
+        """Queue storage.method(*args); arguments must not be mutated afterwards"""
+        self._queue.put((method, args))
+
+    def flush(self):
+        """Block until every queued write has been applied"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            method, args = self._queue.get()
+            try:
+                getattr(self.storage, method)(*args)
+            except Exception as e:
+                self.errors.append(f"{method}: {type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
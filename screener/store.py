@@ -0,0 +1,149 @@
+import sys
+import zlib
+from collections.abc import Sequence
+
+import numpy as np
+
+from .batch import FEATURE_COLUMNS, resume_features
+from .cache import content_hash
+from .samples import SAMPLE_RESUMES
+from .skills import get_matcher
+
+COMPRESSION_LEVEL = 6
+# Preset dictionary of typical resume wording, so zlib compresses even short texts well
+_ZDICT = '\n'.join(r['content'] for r in SAMPLE_RESUMES).encode('utf-8')
+
+
+def compress_text(text):
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=_ZDICT)
+    return compressor.compress(text.encode('utf-8')) + compressor.flush()
+
+
+def decompress_text(data):
+    return zlib.decompressobj(zdict=_ZDICT).decompress(data).decode('utf-8')
+
+
+class CandidateStore(Sequence):
+    """Resumes held column-wise: names and emails in lists, each text stored once and compressed
+
+    Indexing returns resume dicts built on demand, so the store stands in
+    for a list of resume dicts wherever scoring code reads one. Read
+    names, emails and content hashes from the columns to avoid
+    decompressing text. Each text is also parsed once on arrival into the
+    job-independent features of FEATURE_COLUMNS (skill bitmask against
+    matcher's taxonomy, years, education, flags), kept in arrays so any
+    job profile can be scored with analyze_features_batch.
+    """
+
+    __slots__ = ('names', 'emails', 'hashes', 'compress', 'matcher', '_texts', '_features')
+
+    def __init__(self, resumes=(), compress=True, matcher=None):
+        self.names = []
+        self.emails = []
+        self.hashes = []
+        self.compress = compress
+        self.matcher = matcher or get_matcher()
+        self._texts = []
+        self._features = {name: np.zeros(0, dtype=dtype) for name, dtype in FEATURE_COLUMNS.items()}
+        self._features['skill_mask'] = np.zeros((0, self.matcher.words), dtype=FEATURE_COLUMNS['skill_mask'])
+        self.extend(resumes)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {'name': self.names[index], 'email': self.emails[index], 'content': self.text(index)}
+
+    def text(self, index):
+        text = self._texts[index]
+        return decompress_text(text) if self.compress else text
+
+    @classmethod
+    def from_columns(cls, columns, compress=True, matcher=None):
+        """Rebuild a store from columns(), without recompressing or reparsing
+
+        Features are reparsed only if they were extracted with a different
+        taxonomy than matcher's (columns['taxonomy'] holds that fingerprint).
+        """
+        store = cls(compress=compress, matcher=matcher)
+        if columns.get('taxonomy') != store.matcher.fingerprint:
+            store.extend(
+                {'name': name, 'email': email, 'content': decompress_text(text)}
+                for name, email, text in zip(columns['name'], columns['email'], columns['text'])
+            )
+            return store
+        store.names = list(columns['name'])
+        store.emails = list(columns['email'])
+        store.hashes = list(columns['hash'])
+        store._texts = list(columns['text']) if compress else [decompress_text(t) for t in columns['text']]
+        store._reserve(len(store._texts))
+        for name, dtype in FEATURE_COLUMNS.items():
+            store._features[name][:len(store)] = np.asarray(columns[name], dtype=dtype)
+        return store
+
+    def columns(self, start=0, stop=None):
+        """Resumes start up to stop as column lists and arrays: name, email, hash, compressed text and features"""
+        stop = len(self) if stop is None else stop
+        texts = self._texts[start:stop]
+        return {
+            'name': self.names[start:stop],
+            'email': self.emails[start:stop],
+            'hash': self.hashes[start:stop],
+            'text': texts if self.compress else [compress_text(t) for t in texts],
+            'taxonomy': self.matcher.fingerprint,
+            **self.features(start, stop),
+        }
+
+    def extend(self, resumes):
+        contents = []
+        for resume in resumes:
+            self.names.append(resume['name'])
+            self.emails.append(resume['email'])
+            self.hashes.append(content_hash(resume['content']))
+            self._texts.append(compress_text(resume['content']) if self.compress else resume['content'])
+            contents.append(resume['content'])
+        if contents:
+            stop = len(self)
+            start = stop - len(contents)
+            self._reserve(stop)
+            for name, values in resume_features(contents, self.matcher).items():
+                self._features[name][start:stop] = values
+
+    def _reserve(self, rows):
+        capacity = len(self._features['skill_mask'])
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, 1024)
+        for name, column in self._features.items():
+            grown = np.zeros((capacity, *column.shape[1:]), dtype=column.dtype)
+            grown[:len(column)] = column
+            self._features[name] = grown
+
+    def pop(self, index=-1):
+        """Remove and return one resume dict, shifting later ones down like list.pop"""
+        resume = self[index]
+        position = range(len(self))[index]
+        del self.names[index], self.emails[index], self.hashes[index], self._texts[index]
+        for column in self._features.values():
+            column[position:len(self)] = column[position + 1:len(self) + 1]
+        return resume
+
+    def features(self, start=0, stop=None, matcher=None):
+        """Features of resumes start up to stop, as resume_features returns them
+
+        Given a matcher over a different taxonomy than the store's, skill
+        bitmasks are recomputed from the texts; the rest never are.
+        """
+        stop = len(self) if stop is None else stop
+        features = {name: column[start:stop].copy() for name, column in self._features.items()}
+        if matcher is not None and matcher.fingerprint != self.matcher.fingerprint:
+            features['skill_mask'] = matcher.pack(matcher.find_mask(self.text(i)) for i in range(start, stop))
+        return features
+
+    def nbytes(self):
+        """Approximate memory held by the store, including its strings and feature arrays"""
+        columns = (self.names, self.emails, self.hashes, self._texts)
+        strings = sum(sys.getsizeof(c) + sum(sys.getsizeof(v) for v in c) for c in columns)
+        return strings + sum(column.nbytes for column in self._features.values())
@@ -0,0 +1,200 @@
+import math
+import re
+import tempfile
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+# Bump whenever tokenizing or hashing changes so cached scores are recomputed
+EMBEDDING_VERSION = 1
+DEFAULT_DIM = 512
+# Rows held in RAM before the matrix moves to a memory-mapped temporary file
+DEFAULT_MAX_RAM_ROWS = 50_000
+# Rows embedded or scored per step, bounding temporary memory
+EMBED_CHUNK_ROWS = 4096
+SEARCH_CHUNK_ROWS = 65_536
+DEFAULT_TOP_K = 50
+# Clusters probed per query by the approximate index
+DEFAULT_N_PROBE = 8
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the this to was we were will
+with you your i my me he she they them their his her who what which while also all any can into more
+""".split())
+
+
+def tokenize(text):
+    """Lowercase word tokens, keeping terms such as "node.js" and "c#" whole, minus stop words"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+
+@lru_cache(maxsize=1 << 18)
+def _token_hash(token):
+    return zlib.crc32(token.encode('utf-8'))
+
+
+def term_counts(texts, dim=DEFAULT_DIM):
+    """Log-scaled hashed term frequencies (1 + log tf) for each text, one float32 row per text"""
+    texts = list(texts)
+    rows, cols = [], []
+    for row, text in enumerate(texts):
+        buckets = [_token_hash(t) % dim for t in tokenize(text)]
+        rows.extend([row] * len(buckets))
+        cols.extend(buckets)
+    counts = np.bincount(
+        np.array(rows, dtype=np.int64) * dim + np.array(cols, dtype=np.int64),
+        minlength=len(texts) * dim
+    ).reshape(len(texts), dim).astype(np.float32)
+    present = counts > 0
+    counts[present] = 1 + np.log(counts[present])
+    return counts
+
+
+def normalize_rows(matrix):
+    """Scale each row to unit length; all-zero rows stay zero"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def embed(texts, dim=DEFAULT_DIM):
+    """Unit-length hashed log-tf vectors, comparable by dot product"""
+    return normalize_rows(term_counts(texts, dim))
+
+
+def similarity(text, other, dim=DEFAULT_DIM):
+    """Cosine similarity of two texts' hashed log-tf vectors, between 0 and 1"""
+    a, b = embed([text, other], dim)
+    return float(a @ b)
+
+
+class VectorStore:
+    """Resume embeddings in one float32 matrix with cosine top-K search against a query text
+
+    Rows mirror the resume list: add_many appends and remove shifts later
+    rows down, like SkillIndex. Resume vectors are unit-length log-tf;
+    queries are weighted by IDF over the pool (SMART lnc.ltc), so
+    adding resumes never rewrites stored rows. Once the pool outgrows
+    max_ram_rows the matrix moves to a memory-mapped temporary file.
+    """
+
+    def __init__(self, dim=DEFAULT_DIM, max_ram_rows=DEFAULT_MAX_RAM_ROWS):
+        self.dim = dim
+        self.max_ram_rows = max_ram_rows
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self._file = None
+        self._len = 0
+        # Number of resumes containing a term in each bucket, for query IDF
+        self.doc_freq = np.zeros(dim, dtype=np.int64)
+        # Approximate index: unit centroids and the nearest centroid of each row
+        self.centroids = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def memory_mapped(self):
+        return self._file is not None
+
+    @property
+    def vectors(self):
+        return self._matrix[:self._len]
+
+    def _reserve(self, rows):
+        capacity = len(self._matrix)
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, 1024)
+        if capacity > self.max_ram_rows:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile(prefix='screener-vectors-')
+            self._file.truncate(capacity * self.dim * 4)
+            grown = np.memmap(self._file, dtype=np.float32, mode='r+', shape=(capacity, self.dim))
+            if not isinstance(self._matrix, np.memmap):
+                grown[:self._len] = self._matrix[:self._len]
+        else:
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:self._len] = self._matrix[:self._len]
+        self._matrix = grown
+        self._assignments = np.resize(self._assignments, capacity)
+
+    def add_many(self, texts):
+        """Embed resume texts and append them after the rows already stored"""
+        texts = list(texts)
+        for offset in range(0, len(texts), EMBED_CHUNK_ROWS):
+            self.add_vectors(embed(texts[offset:offset + EMBED_CHUNK_ROWS], self.dim))
+
+    def add_vectors(self, vectors):
+        """Append rows already embedded with embed(), such as ones saved from another store"""
+        start = self._len
+        self._reserve(start + len(vectors))
+        self._matrix[start:start + len(vectors)] = vectors
+        self._len += len(vectors)
+        self.doc_freq += (vectors > 0).sum(axis=0)
+        if self.centroids is not None:
+            self._assignments[start:self._len] = np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def remove(self, position):
+        """Drop one row and shift later rows down, mirroring list.pop"""
+        self.doc_freq -= self._matrix[position] > 0
+        self._matrix[position:self._len - 1] = self._matrix[position + 1:self._len]
+        self._assignments[position:self._len - 1] = self._assignments[position + 1:self._len]
+        self._len -= 1
+
+    def idf(self):
+        return np.log((1 + self._len) / (1 + self.doc_freq)).astype(np.float32) + 1
+
+    def query_vector(self, text):
+        """IDF-weighted unit vector for a query text against the current pool"""
+        return normalize_rows(term_counts([text], self.dim) * self.idf())[0]
+
+    def build_index(self, n_lists=None, iterations=5, sample_rows=50_000, seed=0):
+        """Cluster the rows (spherical k-means) so approximate searches only scan the nearest clusters"""
+        if not self._len:
+            return
+        n_lists = n_lists or max(1, int(math.sqrt(self._len)))
+        rng = np.random.default_rng(seed)
+        sample = self.vectors[np.sort(rng.choice(self._len, min(self._len, sample_rows), replace=False))]
+        centroids = sample[rng.choice(len(sample), min(n_lists, len(sample)), replace=False)]
+        for _ in range(iterations):
+            nearest = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, nearest, sample)
+            # Empty clusters keep their previous centroid
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+        self.centroids = centroids
+        for start in range(0, self._len, SEARCH_CHUNK_ROWS):
+            chunk = self._matrix[start:min(start + SEARCH_CHUNK_ROWS, self._len)]
+            self._assignments[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+
+    def search(self, text, k=DEFAULT_TOP_K, approximate=False, n_probe=DEFAULT_N_PROBE):
+        """(positions, similarities) of the k rows most similar to a query text, best first
+
+        approximate=True scans only the n_probe clusters nearest the query,
+        building the cluster index on first use.
+        """
+        query = self.query_vector(text)
+        if approximate:
+            if self.centroids is None:
+                self.build_index()
+            probes = np.argsort(self.centroids @ query)[::-1][:n_probe]
+            rows = np.flatnonzero(np.isin(self._assignments[:self._len], probes))
+            scores = self._matrix[rows] @ query if len(rows) else np.zeros(0, dtype=np.float32)
+        else:
+            rows = None
+            scores = np.empty(self._len, dtype=np.float32)
+            for start in range(0, self._len, SEARCH_CHUNK_ROWS):
+                stop = min(start + SEARCH_CHUNK_ROWS, self._len)
+                scores[start:stop] = self._matrix[start:stop] @ query
+
+        k = min(k, len(scores))
+        if not k:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        positions = top if rows is None else rows[top]
+        return positions.astype(np.int64), scores[top]
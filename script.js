@@ -146,7 +146,10 @@ function removeResume(index) {
     updateUploadedFiles();
 }
 
-// Analyze resumes with AI
+// Scoring API (python -m screener.api); set window.SCREENER_API_URL before this script to point elsewhere
+const SCORING_API_URL = window.SCREENER_API_URL || 'http://127.0.0.1:8765';
+
+// Analyze resumes with the scoring API, the whole batch in one request
 async function analyzeResumes() {
     if (state.resumes.length === 0) {
         showNotification('Please upload or add resumes first', 'error');
@@ -160,134 +163,60 @@ async function analyzeResumes() {
     }
 
     showProcessing();
-    state.results = [];
-
-    for (let i = 0; i < state.resumes.length; i++) {
-        updateProgress((i / state.resumes.length) * 100);
-        await sleep(1000); // Simulate API call
-
-        const result = await analyzeResume(state.resumes[i], jobDesc);
-        state.results.push(result);
+    updateProgress(10);
+
+    let response;
+    try {
+        response = await scoreResumes(state.resumes, jobDesc);
+    } catch (error) {
+        hideProcessing();
+        showNotification(`Scoring failed: ${error.message}`, 'error');
+        return;
     }
 
+    state.results = response.results.map(toResult);
     updateProgress(100);
-    await sleep(500);
     hideProcessing();
 
     displayResults();
-    showNotification('Analysis complete!', 'success');
-}
-
-// Analyze single resume (simulated AI)
-async function analyzeResume(resume, jobDesc) {
-    // Extract requirements
-    const requirements = extractRequirements(jobDesc);
-    const resumeLower = resume.content.toLowerCase();
-    
-    // Calculate matches
-    let skillScore = 0;
-    let expScore = 0;
-    let eduScore = 0;
-    
-    // Skill matching
-    const skillMatches = requirements.skills.filter(skill => 
-        resumeLower.includes(skill.toLowerCase())
-    );
-    skillScore = (skillMatches.length / requirements.skills.length) * 100;
-    
-    // Experience matching
-    const expMatch = resume.content.match(/(\d+)\+?\s*years?/i);
-    if (expMatch) {
-        const years = parseInt(expMatch[1]);
-        expScore = Math.min((years / requirements.minYears) * 100, 100);
-    } else {
-        expScore = 30;
+    showNotification(`Analysis complete in ${response.seconds}s`, 'success');
+}
+
+// POST resumes and the job description to the scoring API
+async function scoreResumes(resumes, jobDesc) {
+    let response;
+    try {
+        response = await fetch(`${SCORING_API_URL}/score`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                job_description: jobDesc,
+                resumes: resumes.map(({ name, email, content }) => ({ name, email, content }))
+            })
+        });
+    } catch (error) {
+        throw new Error(`scoring service not reachable at ${SCORING_API_URL} (start it with: python -m screener.api)`);
     }
-    
-    // Education matching
-    if (resumeLower.includes('master') || resumeLower.includes('ms')) eduScore = 100;
-    else if (resumeLower.includes('bachelor') || resumeLower.includes('bs')) eduScore = 80;
-    else eduScore = 50;
-    
-    // Leadership
-    const hasLeadership = resumeLower.includes('lead') || resumeLower.includes('led') || resumeLower.includes('mentor');
-    const leadershipBonus = hasLeadership ? 10 : 0;
-    
-    // Overall score
-    const overallScore = Math.round(
-        (skillScore * 0.5) + 
-        (expScore * 0.3) + 
-        (eduScore * 0.15) + 
-        leadershipBonus * 0.05
-    );
-    
-    return {
-        ...resume,
-        score: overallScore,
-        skillMatch: Math.round(skillScore),
-        experienceMatch: Math.round(expScore),
-        educationMatch: Math.round(eduScore),
-        matchedSkills: skillMatches,
-        missingSkills: requirements.skills.filter(s => !skillMatches.includes(s)),
-        insights: generateInsights(resume, overallScore, hasLeadership),
-        recommendation: getRecommendation(overallScore)
-    };
-}
-
-// Extract requirements from job description
-function extractRequirements(jobDesc) {
-    const skills = [];
-    const techStack = [
-        'JavaScript', 'TypeScript', 'React', 'Node.js', 'Python', 'FastAPI',
-        'PostgreSQL', 'MongoDB', 'AWS', 'GCP', 'Docker', 'Kubernetes',
-        'CI/CD', 'Jenkins', 'GitHub Actions', 'Express', 'Vue', 'Angular'
-    ];
-    
-    techStack.forEach(tech => {
-        if (jobDesc.toLowerCase().includes(tech.toLowerCase())) {
-            skills.push(tech);
-        }
-    });
-    
-    // Extract years of experience
-    const yearsMatch = jobDesc.match(/(\d+)\+?\s*years?/i);
-    const minYears = yearsMatch ? parseInt(yearsMatch[1]) : 3;
-    
-    return { skills, minYears };
-}
-
-// Generate AI insights
-function generateInsights(resume, score, hasLeadership) {
-    const insights = [];
-    
-    if (score >= 80) {
-        insights.push("⭐ Excellent match for the position");
-        insights.push("🎯 Strong technical skills aligned with requirements");
-    } else if (score >= 65) {
-        insights.push("✅ Good candidate with relevant experience");
-        insights.push("📈 Meets most core requirements");
-    } else {
-        insights.push("⚠️ Limited alignment with job requirements");
-        insights.push("📚 May need additional training or experience");
-    }
-    
-    if (hasLeadership) {
-        insights.push("👥 Demonstrated leadership and mentoring experience");
+    const payload = await response.json();
+    if (!response.ok) {
+        throw new Error(payload.error || `HTTP ${response.status}`);
     }
-    
-    if (resume.content.toLowerCase().includes('open source')) {
-        insights.push("💻 Active open source contributor");
-    }
-    
-    return insights;
+    return payload;
 }
 
-// Get recommendation
-function getRecommendation(score) {
-    if (score >= 80) return "Strong Hire - Schedule Interview";
-    if (score >= 70) return "Recommended for Interview";
-    if (score >= 60) return "Consider for Phone Screen";
-    return "Not Recommended";
+// Scoring API result -> the fields displayResults uses
+function toResult(record) {
+    return {
+        ...state.resumes[record.resume_id],
+        score: record.score,
+        skillMatch: record.skill_match,
+        experienceMatch: record.experience_match,
+        educationMatch: record.education_match,
+        matchedSkills: record.matched_skills,
+        missingSkills: record.missing_skills,
+        insights: record.insights,
+        recommendation: record.recommendation
+    };
 }
 
 // Display results
@@ -734,9 +663,5 @@ function showNotification(message, type) {
     setTimeout(() => notification.remove(), 3000);
 }
 
-function sleep(ms) {
-    return new Promise(resolve => setTimeout(resolve, ms));
-}
-
 // Initialize app
 init();
\ No newline at end of file
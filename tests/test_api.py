@@ -0,0 +1,96 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from screener import api
+from screener.api import ScoringServer, score_batch
+
+JOB_DESCRIPTION = "Senior Full Stack Developer: 5+ years with React, Node.js, Python and AWS"
+RESUMES = [
+    {'name': "Strong", 'content': "React, Node.js, Python and AWS developer with 7 years of experience"},
+    {'name': "Partial", 'content': "Python developer with 2 years of experience"},
+    "Plain text resume without a name",
+]
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = ScoringServer(('127.0.0.1', 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def conn(server):
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=10)
+    yield conn
+    conn.close()
+
+
+def post(conn, body, path='/score'):
+    conn.request('POST', path, body if isinstance(body, bytes) else json.dumps(body),
+                 {'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_score_batch_ranks_and_trims():
+    payload = score_batch(JOB_DESCRIPTION, RESUMES, min_score=1, top=2)
+    assert payload['screened'] == 3
+    assert [r['name'] for r in payload['results']] == ["Strong", "Partial"]
+    assert [r['rank'] for r in payload['results']] == [1, 2]
+    assert payload['results'][0]['score'] >= payload['results'][1]['score']
+    assert score_batch(JOB_DESCRIPTION, RESUMES)['results'][-1]['name'] == "Candidate 3"
+
+
+def test_scores_over_http(conn):
+    status, payload = post(conn, {'job_description': JOB_DESCRIPTION, 'resumes': RESUMES, 'top': 1})
+    assert status == 200
+    assert [r['name'] for r in payload['results']] == ["Strong"]
+    conn.request('GET', '/health')
+    response = conn.getresponse()
+    assert response.status == 200 and json.loads(response.read())['status'] == 'ok'
+
+
+@pytest.mark.parametrize('body, message', [
+    (b'{not json', "invalid JSON"),
+    (b'[1, 2]', "must be a JSON object"),
+    ({'resumes': RESUMES}, "'job_description'"),
+    ({'job_description': JOB_DESCRIPTION, 'resumes': []}, "'resumes'"),
+    ({'job_description': JOB_DESCRIPTION, 'resumes': [{'name': "No content"}]}, "resumes[0]"),
+    ({'job_description': JOB_DESCRIPTION, 'resumes': RESUMES, 'top': -1}, "'top'"),
+    ({'job_description': JOB_DESCRIPTION, 'resumes': RESUMES, 'top': True}, "'top'"),
+    ({'job_description': JOB_DESCRIPTION, 'resumes': RESUMES, 'top': 1.5}, "'top'"),
+    ({'job_description': JOB_DESCRIPTION, 'resumes': RESUMES, 'min_score': False}, "'min_score'"),
+    ({'job_description': JOB_DESCRIPTION, 'resumes': RESUMES, 'min_score': "50"}, "'min_score'"),
+])
+def test_invalid_requests_are_rejected(conn, body, message):
+    status, payload = post(conn, body)
+    assert status == 400
+    assert message in payload['error']
+    # The connection stays usable after a rejected request
+    assert post(conn, {'job_description': JOB_DESCRIPTION, 'resumes': RESUMES})[0] == 200
+
+
+def test_oversized_and_unknown_requests(conn, server, monkeypatch):
+    monkeypatch.setattr(api, 'MAX_BODY_BYTES', 10)
+    assert post(conn, {'job_description': JOB_DESCRIPTION})[0] == 413
+    conn.close()
+    status, payload = post(conn, {}, path='/nope')
+    assert status == 404 and 'no such endpoint' in payload['error']
+
+
+def test_unexpected_errors_answer_500(conn, monkeypatch, capsys):
+    def fail(*args, **kwargs):
+        raise RuntimeError("cache unavailable")
+
+    monkeypatch.setattr(api, 'score_batch', fail)
+    status, payload = post(conn, {'job_description': JOB_DESCRIPTION, 'resumes': RESUMES})
+    assert status == 500
+    assert "cache unavailable" in payload['error']
+    assert "RuntimeError" in capsys.readouterr().err
@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+
+from screener import cache as cache_module
+from screener.cache import ResultCache
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Every connection the cache opens, with the statements it ran"""
+    opened = []
+    connect = sqlite3.connect
+
+    def tracked(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        statements = []
+        conn.set_trace_callback(statements.append)
+        opened.append((conn, statements))
+        return conn
+
+    monkeypatch.setattr(cache_module.sqlite3, 'connect', tracked)
+    return opened
+
+
+def is_closed(conn):
+    try:
+        conn.execute('SELECT 1')
+    except sqlite3.ProgrammingError:
+        return True
+    return False
+
+
+def test_connections_are_closed(tmp_path, connections):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite3'))
+    cache.put_many({'a': {'score': 1}})
+    assert cache.get_many(['a', 'b']) == {'a': {'score': 1}}
+    assert len(cache) == 1
+    cache.clear()
+    assert len(connections) == 5
+    assert all(is_closed(conn) for conn, _ in connections)
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite3'), max_entries=10)
+    cache.put_many({f'k{i}': {'i': i} for i in range(10)})
+    assert len(cache) == 10
+    cache.get_many(['k0', 'k1'])
+    cache.put_many({'new': {'i': -1}})
+    kept = set(cache.get_many([f'k{i}' for i in range(10)] + ['new']))
+    assert len(kept) <= 10
+    assert {'k0', 'k1', 'new'} <= kept and 'k2' not in kept
+
+
+def test_table_is_counted_only_near_the_cap(tmp_path, connections):
+    cache = ResultCache(str(tmp_path / 'cache.sqlite3'), max_entries=100)
+    for i in range(50):
+        cache.put_many({f'k{i}': {'i': i}})
+    counts = [s for _, statements in connections for s in statements if 'COUNT(*)' in s]
+    assert len(counts) == 1
+    # Replacing a key is counted as an insert, but never lets the table pass the cap
+    for i in range(200):
+        cache.put_many({f'k{i % 120}': {'i': i}})
+    assert len(cache) <= 100
@@ -0,0 +1,51 @@
+import random
+
+from screener.dedupe import NearDuplicateIndex
+from screener.samples import SAMPLE_RESUMES
+
+WORDS = ("python react aws docker kubernetes postgres led team built scaled services api design data "
+         "pipelines testing mentoring cloud migration latency reliability frontend backend").split()
+
+
+def random_resume(rng, n_words=120):
+    return " ".join(rng.choice(WORDS) + str(rng.randint(0, 99)) for _ in range(n_words))
+
+
+def test_edited_copies_collapse_into_the_original():
+    index = NearDuplicateIndex()
+    for i, resume in enumerate(SAMPLE_RESUMES):
+        assert index.find_or_add(resume['content'], f"sample{i}") is None
+    original = SAMPLE_RESUMES[0]['content']
+    key, similarity = index.find_or_add(original + "\nReferences available on request.", 'edited')
+    assert key == 'sample0' and index.threshold <= similarity < 1
+    # Matches are not indexed themselves
+    assert 'edited' not in index and len(index) == len(SAMPLE_RESUMES)
+    assert index.find_or_add(original.upper(), 'shouted')[0] == 'sample0'
+
+
+def test_removed_and_empty_resumes_never_match():
+    index = NearDuplicateIndex()
+    index.add_texts(['a', 'empty'], [SAMPLE_RESUMES[0]['content'], "  ...  "])
+    assert 'empty' not in index
+    assert index.find_or_add("---", 'blank') is None and 'blank' not in index
+    index.remove('a')
+    index.remove('unknown')
+    assert index.find_or_add(SAMPLE_RESUMES[0]['content'], 'b') is None
+
+
+def test_near_duplicates_found_across_merges():
+    rng = random.Random(0)
+    index = NearDuplicateIndex()
+    resumes = [random_resume(rng) for _ in range(1500)]
+    index.add_texts(range(len(resumes)), resumes)
+    assert len(index) == len(resumes)
+    index.remove(7)
+    for i in (0, 7, 750, 1499):
+        words = resumes[i].split()
+        words[rng.randrange(len(words))] = "edited"
+        match = index.find_or_add(" ".join(words), f"copy{i}")
+        if i == 7:
+            assert match is None
+        else:
+            assert match is not None and match[0] == i
+    assert index.find_or_add(random_resume(rng), 'new') is None
@@ -0,0 +1,68 @@
+import io
+import zipfile
+
+from screener.ingest import count_upload_entries, ingest_uploads, iter_upload_entries
+
+
+def upload(name, data):
+    """An in-memory stand-in for an uploaded file"""
+    file = io.BytesIO(data)
+    file.name = name
+    return file
+
+
+def zip_upload(name, members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for member, data in members.items():
+            zf.writestr(member, data)
+    return upload(name, buffer.getvalue())
+
+
+def ingest(files, **kwargs):
+    seen = kwargs.pop('seen', set())
+    report = {}
+    batches = [batch for _, batch in ingest_uploads(files, seen, report=report, workers=1, **kwargs)]
+    return [resume for batch in batches for resume in batch], report, seen
+
+
+def test_duplicates_are_skipped_within_and_across_uploads():
+    alice = b"Alice Smith\nPython developer with 5 years of experience"
+    files = [
+        upload('alice.txt', alice),
+        zip_upload('batch.zip', {'cv/alice-copy.txt': alice, 'cv/bob.txt': b"Bob Jones\nJava developer"}),
+    ]
+    assert count_upload_entries(files) == 3
+    resumes, report, seen = ingest(files)
+    assert [r['name'] for r in resumes] == ['alice', 'bob']
+    assert [r['email'] for r in resumes] == ['candidate1@email.com', 'candidate2@email.com']
+    assert (report['added'], report['duplicates'], report['skipped']) == (2, 1, [])
+    # The same files again add nothing: seen is updated in place
+    resumes, report, _ = ingest(files, seen=seen)
+    assert resumes == [] and report['duplicates'] == 3
+
+
+def test_unreadable_files_are_reported_not_raised():
+    files = [
+        upload('broken.zip', b"not a zip"),
+        upload('corrupt.docx', b"PK\x03\x04 not really a docx"),
+        zip_upload('mixed.zip', {'ok.txt': b"Carol\nGo developer", '__MACOSX/._ok.txt': b"junk", 'notes.md': b"# no"}),
+    ]
+    resumes, report, _ = ingest(files)
+    assert [r['name'] for r in resumes] == ['ok']
+    skipped = dict(report['skipped'])
+    assert set(skipped) == {'broken.zip', 'corrupt.docx'}
+    assert skipped['broken.zip'].startswith("invalid ZIP archive")
+
+
+def test_oversized_files_are_not_read():
+    files = [upload('big.txt', b"x" * 101), zip_upload('big.zip', {'big.txt': b"x" * 101, 'small.txt': b"x"})]
+    entries = list(iter_upload_entries(files, max_file_bytes=100))
+    assert entries == [('big.txt', None, "file too large"), ('big.txt', None, "file too large"), ('small.txt', b"x", None)]
+
+
+def test_capacity_stops_ingestion():
+    files = [upload(f'{i}.txt', f"Candidate {i}\nPython".encode()) for i in range(5)]
+    resumes, report, _ = ingest(files, capacity=3, next_number=10)
+    assert [r['email'] for r in resumes] == [f'candidate{i}@email.com' for i in (10, 11, 12)]
+    assert [reason for _, reason in report['skipped']] == ["resume store is full"] * 2
@@ -0,0 +1,41 @@
+import asyncio
+from datetime import datetime
+
+from screener.invites import Invite, SMTPSettings, send_invites_async, serve_smtp_stand_in
+
+SLOT = datetime(2026, 1, 5, 9, 0)
+
+
+def make_invite(**fields):
+    values = {'name': "Jane Doe", 'email': 'jane@example.com', 'start': SLOT, 'duration': "1 hour",
+              'interview_type': "Video Call", 'position': "Backend Engineer"}
+    values.update(fields)
+    return Invite(**values)
+
+
+def test_headers_and_calendar_are_escaped():
+    invite = make_invite(name='Doe, "JJ" Jane', interview_type="Panel; round 2", position="Engineer, Backend",
+                         meeting_link="https://meet.example.com/a;b,c")
+    message = invite.message('recruiting@example.com')
+    assert message['To'] == '"Doe, \\"JJ\\" Jane" <jane@example.com>'
+    calendar = invite.calendar('recruiting@example.com').split('\r\n')
+    assert r'SUMMARY:Panel\; round 2 - Engineer\, Backend' in calendar
+    assert r'LOCATION:https://meet.example.com/a\;b\,c' in calendar
+    assert 'ATTENDEE;CN="Doe,  JJ  Jane";RSVP=TRUE:mailto:jane@example.com' in calendar
+
+
+def test_an_unbuildable_invite_fails_alone():
+    async def run():
+        received = []
+        server = await serve_smtp_stand_in('127.0.0.1', 0, received=received)
+        port = server.sockets[0].getsockname()[1]
+        settings = SMTPSettings(host='127.0.0.1', port=port, sender='recruiting@example.com')
+        invites = [make_invite(), make_invite(position="Backend\nEngineer"), make_invite(name="John Roe")]
+        async with server:
+            statuses = await send_invites_async(invites, settings, concurrency=2, rate=None)
+        return statuses, received
+
+    statuses, received = asyncio.run(run())
+    assert [s['status'] for s in statuses] == ['sent', 'failed', 'sent']
+    assert statuses[1]['error'].startswith("ValueError") and statuses[1]['attempts'] == 0
+    assert len(received) == 2
@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from screener.batch import rank_results
+from screener.ranking import LiveRanking, SortedKeys
+
+
+def make_results(rng, n):
+    """A scores-only results frame for n resumes, with plenty of tied scores"""
+    return pd.DataFrame({
+        'resume_id': np.arange(n),
+        'name': [f"Candidate {rng.random():.6f}" for _ in range(n)],
+        'email': [''] * n,
+        'score': [rng.randint(0, 100) for _ in range(n)],
+        'skill_match': [rng.randint(0, 100) for _ in range(n)],
+        'experience_match': [rng.randint(0, 100) for _ in range(n)],
+        'education_match': [rng.choice([50, 80, 100]) for _ in range(n)],
+        'semantic_match': [0] * n,
+        'skill_mask': np.array([rng.getrandbits(64) for _ in range(n)], dtype=np.uint64),
+        'has_leadership': [rng.random() < 0.5 for _ in range(n)],
+        'open_source': [rng.random() < 0.2 for _ in range(n)],
+    })
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_sorted_keys_matches_sorted_list(seed):
+    rng = random.Random(seed)
+    keys = SortedKeys(bucket_size=4)
+    expected = []
+    for _ in range(2000):
+        if expected and rng.random() < 0.4:
+            key = rng.choice(expected)
+            keys.remove(key)
+            expected.remove(key)
+        else:
+            key = rng.randint(-500, 500)
+            keys.add(key)
+            expected.append(key)
+        expected.sort()
+    assert list(keys) == expected
+    assert len(keys) == len(expected)
+    for probe in (-600, -1, 0, 250, 600):
+        assert keys.count_below(probe) == sum(k < probe for k in expected)
+    assert keys.slice(7, 31) == expected[7:31]
+    with pytest.raises(KeyError):
+        keys.remove(10_000)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_live_ranking_matches_rank_results(seed):
+    rng = random.Random(seed)
+    ranking = LiveRanking(bucket_size=8)
+    # key -> that candidate's row, resume_id set to its arrival number
+    expected = {}
+    arrivals = 0
+    for _ in range(30):
+        batch = make_results(rng, rng.randint(1, 40))
+        # Some keys are re-added, replacing the candidate under that key
+        pool = list(expected)
+        reused = rng.sample(pool, min(len(pool), rng.randint(0, len(batch) // 4)))
+        keys = reused + [f"k{arrivals + i}" for i in range(len(batch) - len(reused))]
+        rng.shuffle(keys)
+        ranking.add(batch, keys)
+        for row in batch.to_dict('records'):
+            expected[keys[row['resume_id']]] = {**row, 'resume_id': arrivals + row['resume_id']}
+        arrivals += len(batch)
+        for key in rng.sample(list(expected), min(len(expected), rng.randint(0, 10))):
+            ranking.remove(key)
+            del expected[key]
+        ranking.remove('never-added')
+
+        reference = rank_results(pd.DataFrame(list(expected.values()), columns=batch.columns))
+        frame = ranking.frame()
+        assert len(ranking) == len(reference)
+        assert frame['resume_id'].tolist() == reference['resume_id'].tolist()
+        assert frame['score'].tolist() == reference['score'].tolist()
+        assert [ranking.key(a) for a in frame['resume_id']] == [
+            key for key, _ in sorted(expected.items(), key=lambda item: (-item[1]['score'], item[1]['resume_id']))
+        ]
+        assert ranking.slice(3, 17)['resume_id'].tolist() == reference['resume_id'].tolist()[3:17]
+        assert [a for chunk in ranking.iter_chunks(7) for a in chunk['resume_id']] == reference['resume_id'].tolist()
+        for min_score in (0, 33.5, 50, 99, 101):
+            assert ranking.count_at_least(min_score) == int((reference['score'] >= min_score).sum())
+        if len(reference):
+            assert ranking.top_score == reference['score'].max()
+            assert ranking.mean_score == pytest.approx(reference['score'].mean())
+            assert ranking.stats.leaders == int(reference['has_leadership'].sum())
+            assert ranking.stats.quantile(0.5) == int(np.quantile(reference['score'], 0.5, method='inverted_cdf'))
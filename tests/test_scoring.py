@@ -0,0 +1,47 @@
+import random
+import warnings
+
+import pytest
+
+from screener.batch import analyze_resumes_batch
+from screener.profile import compile_job_profile
+from screener.scoring import analyze_resume
+
+JOB_DESCRIPTION = """Senior Full Stack Developer
+5+ years of experience with React, Node.js, Python and AWS.
+Docker and Kubernetes a plus; PostgreSQL or MongoDB."""
+
+
+def test_zero_minimum_years_is_fully_met():
+    job_profile = compile_job_profile("Python developer, 0+ years of experience")
+    assert job_profile.min_years == 0
+    resumes = [
+        {'name': "New", 'email': '', 'content': "Python developer with 0 years of experience"},
+        {'name': "Senior", 'email': '', 'content': "Python developer with 8 years of experience"},
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        results = analyze_resumes_batch(resumes, job_profile)
+    assert results['experience_match'].tolist() == [100, 100]
+    assert results['score'].between(0, 100).all()
+    for resume, score in zip(resumes, results['score']):
+        assert analyze_resume(resume, job_profile)['score'] == score
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_batch_scores_match_scalar_scores(seed):
+    rng = random.Random(seed)
+    words = ["Python", "react.js", "k8s", "reactive", "Docker", "mongo", "JSON", "led a team", "open source",
+             "master's degree", "PhD", "bachelor", "years of experience", "team", "AWS", "node"]
+    resumes = [
+        {'name': f"Candidate {i}", 'email': '',
+         'content': f"{rng.randint(0, 15)} years of experience. " + " ".join(rng.choices(words, k=rng.randint(0, 12)))}
+        for i in range(200)
+    ]
+    job_profile = compile_job_profile(JOB_DESCRIPTION)
+    results = analyze_resumes_batch(resumes, job_profile)
+    for resume, row in zip(resumes, results.to_dict('records')):
+        expected = analyze_resume(resume, job_profile)
+        for column in ('score', 'skill_match', 'experience_match', 'education_match'):
+            assert row[column] == expected[column], (resume['content'], column)
+        assert row['matched_skills'] == expected['matched_skills']
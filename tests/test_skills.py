@@ -0,0 +1,38 @@
+import pytest
+
+from screener.skills import get_matcher
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return get_matcher()
+
+
+@pytest.mark.parametrize('text', [
+    "Built reactive dashboards", "Parsed JSON payloads", "Nodes of a graph", "Expressive code",
+])
+def test_skills_match_whole_words_only(matcher, text):
+    assert matcher.find(text) == set()
+
+
+@pytest.mark.parametrize('text, skill', [
+    ("Deployed on k8s", 'Kubernetes'),
+    ("Built with ReactJS", 'React'),
+    ("Amazon Web Services (EC2)", 'AWS'),
+    ("postgres and mongo", 'PostgreSQL'),
+    ("CI / CD pipelines", 'CI/CD'),
+])
+def test_aliases_map_to_canonical_skills(matcher, text, skill):
+    assert skill in matcher.find(text)
+
+
+def test_skills_are_matched_case_insensitively_in_taxonomy_order(matcher):
+    assert matcher.find_ordered("k8s, PYTHON and react.js; more Python") == ['React', 'Python', 'Kubernetes']
+
+
+def test_masks_round_trip(matcher):
+    skills = ['Kubernetes', 'React', 'Python']
+    mask = matcher.find_mask("Python, React and k8s")
+    assert mask == matcher.mask(skills)
+    assert matcher.expand(mask) == [s for s in matcher.skills if s in skills]
+    assert matcher.expand_many(matcher.pack([mask, 0])) == [matcher.expand(mask), []]
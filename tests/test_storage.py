@@ -0,0 +1,87 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from screener.batch import analyze_features_batch
+from screener.profile import compile_job_profile
+from screener.samples import SAMPLE_RESUMES
+from screener.storage import SQLiteStorage, Storage
+from screener.store import CandidateStore
+from screener.vectors import embed
+
+JOB_DESCRIPTION = "Senior Full Stack Developer: 5+ years with React, Node.js, Python and AWS"
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / 'screener.sqlite3'))
+    yield storage
+    storage.close()
+
+
+def saved_pool(storage):
+    store = CandidateStore(SAMPLE_RESUMES)
+    columns = store.columns()
+    columns['embedding'] = embed([r['content'] for r in SAMPLE_RESUMES])
+    storage.save_candidates(columns)
+    return store, columns
+
+
+def test_storage_is_abstract():
+    with pytest.raises(TypeError):
+        Storage()
+
+
+def test_candidates_round_trip(storage):
+    store, columns = saved_pool(storage)
+    # Saving again updates rather than duplicates
+    storage.save_candidates(columns)
+    assert storage.count_candidates() == len(SAMPLE_RESUMES)
+
+    loaded = storage.load_candidates(dim=columns['embedding'].shape[1])
+    restored = CandidateStore.from_columns(loaded)
+    assert list(restored) == list(store)
+    assert restored.hashes == store.hashes
+    for name, values in store.features().items():
+        np.testing.assert_array_equal(restored.features()[name], values)
+    np.testing.assert_allclose(loaded['embedding'], columns['embedding'], rtol=1e-6)
+    assert 'embedding' not in storage.load_candidates()
+
+
+def test_results_follow_their_candidates(storage):
+    store, _ = saved_pool(storage)
+    job_profile = compile_job_profile(JOB_DESCRIPTION)
+    results = analyze_features_batch(store.features(), store.names, store.emails, job_profile)
+    requisition = {'fingerprint': job_profile.fingerprint, 'title': "Developer", 'job_description': JOB_DESCRIPTION,
+                   'semantic_weight': 0.0}
+    storage.save_requisition(requisition)
+    storage.save_results(job_profile.fingerprint, store.hashes, results)
+    assert storage.requisitions() == [requisition]
+
+    conn = sqlite3.connect(storage.path)
+
+    def count_results():
+        return conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    assert count_results() == len(store)
+    storage.delete_candidates(store.hashes[:2])
+    assert storage.count_candidates() == len(store) - 2
+    assert count_results() == len(store) - 2
+    storage.clear()
+    assert storage.count_candidates() == 0 and storage.requisitions() == [] and count_results() == 0
+    conn.close()
+
+
+def test_legacy_integer_masks_load(storage):
+    _, columns = saved_pool(storage)
+    conn = sqlite3.connect(storage.path)
+    with conn:
+        # Files from before multi-word masks stored each as a signed 64-bit integer
+        conn.execute('UPDATE candidates SET skill_mask = -1 WHERE id = 1')
+        conn.execute('UPDATE candidates SET skill_mask = 5 WHERE id = 2')
+    conn.close()
+    masks = storage.load_candidates()['skill_mask']
+    assert masks.dtype == np.uint64
+    assert masks[:2, 0].tolist() == [2 ** 64 - 1, 5]
+    np.testing.assert_array_equal(masks[2:], columns['skill_mask'][2:])